@@ -0,0 +1,123 @@
+import datetime
+import json
+
+
+class ArticleRepository:
+    """
+    Acceso a los artículos con Redis como caché de lectura delante de MySQL.
+
+    Las lecturas se sirven primero desde Redis; los artículos que faltan se
+    leen de MySQL y se vuelven a guardar en Redis. Las escrituras van a MySQL
+    y a Redis. También se cachean las listas ordenadas (los ids en orden) por
+    (campo, algoritmo, search_value, limit); cualquier inserción o borrado
+    las invalida incrementando un contador de generación que forma parte de
+    su clave.
+
+    stats lleva los aciertos y fallos de ambas cachés para dimensionar Redis.
+    """
+
+    GENERATION_KEY = "sorted_results:generation"
+
+    def __init__(self, mysql_db, redis_db, sorted_ttl=3600):
+        self.mysql_db = mysql_db
+        self.redis_db = redis_db
+        self.sorted_ttl = sorted_ttl
+        self.stats = {
+            "article_hits": 0,
+            "article_misses": 0,
+            "sorted_hits": 0,
+            "sorted_misses": 0,
+        }
+
+    @staticmethod
+    def _from_cache(article):
+        # Redis guarda las fechas como texto ISO; se restauran como date, igual
+        # que las retorna MySQL
+        value = article.get("publication_date") if isinstance(article, dict) else None
+        if isinstance(value, str) and value:
+            try:
+                article["publication_date"] = datetime.date.fromisoformat(value)
+            except ValueError:
+                pass
+        return article
+
+    def get(self, article_id):
+        return self.get_many([article_id])[0]
+
+    def get_many(self, article_ids):
+        """
+        Retorna los artículos en el orden de article_ids (None si no existen).
+        """
+        article_ids = list(article_ids)
+        cached = self.redis_db.get_articles(article_ids)
+        missing = [article_id for article_id, article in zip(article_ids, cached) if article is None]
+        self.stats["article_hits"] += len(article_ids) - len(missing)
+        self.stats["article_misses"] += len(missing)
+
+        found = {}
+        if missing:
+            found = {article["id"]: article for article in self.mysql_db.iter_articles(filters={"id": missing})}
+            if found:
+                self.redis_db.store_articles(found.values())
+        return [self._from_cache(article) if article is not None else found.get(article_id)
+                for article_id, article in zip(article_ids, cached)]
+
+    def insert(self, article):
+        return self.insert_many([article])
+
+    def insert_many(self, articles, batch_size=1000):
+        """
+        Inserta los artículos en MySQL por lotes. Cada lote se guarda en Redis
+        e invalida las listas ordenadas cacheadas solo después de su commit, de
+        modo que un lote revertido nunca llega a la caché. Retorna las
+        estadísticas de MySQL.
+        """
+        def committed(batch):
+            self.redis_db.store_articles(batch)
+            self.invalidate_sorted()
+
+        return self.mysql_db.insert_articles(articles, batch_size=batch_size, on_commit=committed)
+
+    def delete_many(self, article_ids):
+        """
+        Elimina los artículos de MySQL y después de Redis, e invalida las
+        listas ordenadas cacheadas. Retorna las filas eliminadas de MySQL.
+        """
+        article_ids = list(article_ids)
+        if not article_ids:
+            return 0
+        deleted = self.mysql_db.delete_articles(article_ids)
+        self.redis_db.delete_articles(article_ids)
+        self.invalidate_sorted()
+        return deleted
+
+    def invalidate_sorted(self):
+        self.redis_db.r.incr(self.GENERATION_KEY)
+
+    def _sorted_key(self, field, algorithm, search_value, limit):
+        generation = int(self.redis_db.r.get(self.GENERATION_KEY) or 0)
+        return f"sorted_results:{generation}:{field}:{algorithm}:{search_value!r}:{limit}"
+
+    def sorted(self, field, algorithm="tim_sort", search_value=None, limit=None):
+        """
+        Retorna los artículos ordenados por field. Si la lista de ids está en
+        Redis se reconstruye con get_many; si no, se ordena con
+        MySQLDatabase.sorted_articles y se guarda la lista con sorted_ttl.
+        """
+        key = self._sorted_key(field, algorithm, search_value, limit)
+        cached = self.redis_db.r.get(key)
+        if cached is not None:
+            self.stats["sorted_hits"] += 1
+            return self.get_many(json.loads(cached))
+
+        self.stats["sorted_misses"] += 1
+        articles = list(self.mysql_db.sorted_articles(field, search_value=search_value, limit=limit,
+                                                      algorithm=algorithm))
+        self.redis_db.r.set(key, json.dumps([article["id"] for article in articles]), ex=self.sorted_ttl)
+        self.redis_db.store_articles(articles)
+        return articles
+
+    def hit_ratio(self, cache="article"):
+        hits = self.stats[f"{cache}_hits"]
+        total = hits + self.stats[f"{cache}_misses"]
+        return hits / total if total else 0.0
@@ -1,25 +1,30 @@
 import requests
-from bs4 import BeautifulSoup
 
+from data_sources.extraction import extract_articles
 
-def fetch_acm_articles(query):
+ACM_SEARCH_URL = "https://dl.acm.org/action/doSearch"
+
+
+def parse_acm_articles(content, engine=None):
+    """
+    Extrae título, autores, fecha y DOI de una página de resultados de ACM.
+    content puede ser el cuerpo en bytes de la respuesta o el texto HTML.
+    """
+    return extract_articles(content, "acm", engine)
+
+
+def fetch_acm_articles(query, cache=None):
     """
     Realiza scraping a la base de datos de ACM para obtener artículos relacionados con el query.
     Este ejemplo es ilustrativo; en un entorno real se debe ajustar según la estructura de la web.
     """
-    url = f"https://dl.acm.org/action/doSearch?AllField={query}"
-    response = requests.get(url)
+    response = (cache or requests).get(ACM_SEARCH_URL, params={"AllField": query})
 
     if response.status_code != 200:
         print("Error al acceder a ACM.")
         return []
 
-    soup = BeautifulSoup(response.text, 'html.parser')
-    articles = []
-    for h5 in soup.find_all("h5", class_="issue-item__title"):
-        title = h5.get_text(strip=True)
-        articles.append({"article_name": title})
-    return articles
+    return parse_acm_articles(response.content)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,168 @@
+import argparse
+import random
+import time
+import tracemalloc
+from collections import Counter
+
+from data_sources.dedup import Deduplicator
+
+SOURCES = ["acm", "sage", "sciencedirect", "scopus"]
+
+_SYLLABLES = ["com", "pu", "ta", "cion", "al", "da", "tos", "ne", "ur", "on", "sis", "te", "ma", "ti",
+              "ca", "lo", "gi", "ver", "so", "re", "de", "mo", "li", "ra", "en", "pro", "cess", "ing"]
+_ACCENTS = str.maketrans("aeiou", "áéíóú")
+
+
+def _word(rnd):
+    return "".join(rnd.choice(_SYLLABLES) for _ in range(rnd.randint(1, 4)))
+
+
+def _typo(rnd, text):
+    if len(text) < 5:
+        return text
+    i = rnd.randrange(1, len(text) - 2)
+    operation = rnd.choice(("delete", "swap", "replace"))
+    if operation == "delete":
+        return text[:i] + text[i + 1:]
+    if operation == "swap":
+        return text[:i] + text[i + 1] + text[i] + text[i + 2:]
+    return text[:i] + rnd.choice("abcdefghijklmnopqrstuvwxyz") + text[i + 1:]
+
+
+def _noisy_title(rnd, title):
+    operations = rnd.sample(["case", "punctuation", "accents", "typo", "typo2", "drop_word"], rnd.randint(1, 3))
+    words = title.split()
+    if "drop_word" in operations and len(words) > 6:
+        del words[rnd.randrange(len(words))]
+    title = " ".join(words)
+    if "case" in operations:
+        title = title.title() if rnd.random() < 0.5 else title.upper()
+    if "accents" in operations:
+        title = title.translate(_ACCENTS) if rnd.random() < 0.5 else title.replace("ó", "o")
+    if "typo" in operations:
+        title = _typo(rnd, title)
+    if "typo2" in operations:
+        title = _typo(rnd, _typo(rnd, title))
+    if "punctuation" in operations:
+        title = rnd.choice(["", "«"]) + title.replace(" ", rnd.choice([" ", ": ", " - "]), 1) + rnd.choice([".", "!", "?", ""])
+    return title
+
+
+def _noisy_authors(rnd, authors):
+    authors = authors[:rnd.randint(1, len(authors))]
+    if rnd.random() < 0.5:
+        # Formato "Apellido, N." de Scopus
+        authors = [f"{name.split()[-1]}, {name.split()[0][0]}." for name in authors]
+    return "; ".join(authors)
+
+
+def generate_noisy_articles(n, duplicate_rate=0.3, sibling_rate=0.05, seed=7):
+    """
+    Genera n registros de varias fuentes. Una fracción duplicate_rate de los
+    artículos aparece de nuevo (1 a 3 veces) con ruido en el título (erratas,
+    mayúsculas, tildes, puntuación, una palabra menos), en los autores y a veces
+    en el año. Una fracción sibling_rate son artículos distintos con el título
+    de otro anterior salvo una palabra y otros autores, que no deben fusionarse.
+    Retorna (registros, etiquetas) donde la etiqueta identifica el artículo
+    original de cada registro.
+    """
+    rnd = random.Random(seed)
+    names = [_word(rnd).capitalize() for _ in range(300)]
+    surnames = [_word(rnd).capitalize() for _ in range(3000)]
+    records, labels = [], []
+    article = 0
+    title = ""
+    while len(records) < n:
+        if title and rnd.random() < sibling_rate:
+            words = title.split()
+            words[rnd.randrange(len(words))] = _word(rnd)
+            title = " ".join(words)
+        else:
+            title = " ".join(_word(rnd) for _ in range(rnd.randint(5, 12))).capitalize()
+        authors = [f"{rnd.choice(names)} {rnd.choice(surnames)}" for _ in range(rnd.randint(1, 4))]
+        year = rnd.randint(1990, 2025)
+        doi = f"10.{rnd.randint(1000, 9999)}/{rnd.randint(10 ** 6, 10 ** 7)}"
+        sources = rnd.sample(SOURCES, len(SOURCES))
+        copies = 1 + (rnd.randint(1, 3) if rnd.random() < duplicate_rate else 0)
+        for copy in range(min(copies, n - len(records))):
+            noisy = copy > 0
+            records.append({
+                "id": f"{sources[copy]}-{article}-{copy}",
+                "article_name": _noisy_title(rnd, title) if noisy else title,
+                "author_name": _noisy_authors(rnd, authors) if noisy else "; ".join(authors),
+                "publication_date": str(year + (rnd.choice((-1, 1)) if noisy and rnd.random() < 0.1 else 0)),
+                "doi": doi if rnd.random() < 0.3 else "",
+                "source": sources[copy],
+            })
+            labels.append(article)
+        article += 1
+    return records, labels
+
+
+def _pairs(sizes):
+    return sum(size * (size - 1) // 2 for size in sizes)
+
+
+def pair_metrics(predicted, expected):
+    """
+    Precisión y exhaustividad sobre pares de registros: un par es positivo si
+    ambos registros están en el mismo grupo.
+    """
+    true_positives = _pairs(Counter(zip(predicted, expected)).values())
+    predicted_pairs = _pairs(Counter(predicted).values())
+    expected_pairs = _pairs(Counter(expected).values())
+    precision = true_positives / predicted_pairs if predicted_pairs else 1.0
+    recall = true_positives / expected_pairs if expected_pairs else 1.0
+    return {"precision": precision, "recall": recall, "true_pairs": expected_pairs, "found_pairs": predicted_pairs}
+
+
+def run_benchmark(size, duplicate_rate=0.3, sibling_rate=0.05, memory=False, **options):
+    records, labels = generate_noisy_articles(size, duplicate_rate, sibling_rate)
+    deduplicator = Deduplicator(**options)
+    if memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    deduplicator.add_many(records)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1] if memory else None
+    if memory:
+        tracemalloc.stop()
+    result = {
+        "records": size,
+        "articles": len(set(labels)),
+        "merged_records": len(deduplicator.records()),
+        "seconds": elapsed,
+        "records_per_second": size / elapsed if elapsed else None,
+        "peak_bytes": peak,
+        **deduplicator.stats,
+    }
+    result.update(pair_metrics(deduplicator.labels(), labels))
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Mide la precisión, la exhaustividad y el rendimiento de data_sources.dedup.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--duplicate-rate", type=float, default=0.3)
+    parser.add_argument("--sibling-rate", type=float, default=0.05)
+    parser.add_argument("--threshold", type=float, default=0.6)
+    parser.add_argument("--bands", type=int, default=16)
+    parser.add_argument("--rows", type=int, default=4)
+    parser.add_argument("--memory", action="store_true", help="Mide el pico de memoria con tracemalloc (más lento).")
+    args = parser.parse_args(argv)
+
+    results = []
+    for size in args.sizes:
+        result = run_benchmark(size, args.duplicate_rate, args.sibling_rate, args.memory,
+                               threshold=args.threshold, bands=args.bands, rows=args.rows)
+        results.append(result)
+        memory = f"  pico {result['peak_bytes'] / 2 ** 20:.0f} MiB" if result["peak_bytes"] else ""
+        print(f"{size:>9} registros  {result['seconds']:8.2f} s  {result['records_per_second']:>9.0f} reg/s  "
+              f"precisión={result['precision']:.4f}  exhaustividad={result['recall']:.4f}  "
+              f"artículos={result['articles']} fusionados={result['merged_records']}{memory}")
+    return results
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,133 @@
+import argparse
+import os
+import random
+import time
+
+from bs4 import BeautifulSoup
+
+from data_sources.extraction import ENGINES, SELECTORS, default_engine, extract_articles, lxml
+
+
+def baseline_titles(content, source):
+    """
+    Ruta original de los scrapers: decodificar el texto completo, construir el
+    árbol con html.parser y buscar la etiqueta del título.
+    """
+    title_tag, _, title_class = SELECTORS[source]["title"].partition(".")
+    soup = BeautifulSoup(content.decode("utf-8", errors="replace"), 'html.parser')
+    return [tag.get_text(strip=True) for tag in soup.find_all(title_tag, class_=title_class)]
+
+
+def synthetic_page(source, results=50, seed=0):
+    """
+    Genera una página de resultados con la estructura de SELECTORS[source],
+    rodeada de navegación, scripts y estilos como en una página real.
+    """
+    rnd = random.Random(seed)
+    words = ["computational", "thinking", "pensamiento", "computacional", "learning", "análisis",
+             "education", "data", "model", "visualización", "systems", "algorithms"]
+    items = []
+    for i in range(results):
+        title = " ".join(rnd.choice(words) for _ in range(rnd.randint(4, 10))).capitalize()
+        authors = [f"Autor {rnd.randint(1, 500)}" for _ in range(rnd.randint(1, 4))]
+        doi = f"10.{rnd.randint(1000, 9999)}/{rnd.randint(100000, 999999)}"
+        date = f"{rnd.randint(1, 28)} Mar {rnd.randint(1995, 2025)}"
+        if source == "acm":
+            items.append(
+                f'<li class="search__item issue-item-container"><div class="issue-item">'
+                f'<h5 class="issue-item__title"><a href="/doi/{doi}">{title}</a></h5>'
+                f'<ul class="rlist--inline loa">'
+                + "".join(f'<li><a href="#"><span class="hlFld-ContribAuthor">{a}</span></a></li>' for a in authors)
+                + f'</ul><div class="bookPubDate">{date}</div></div></li>')
+        elif source == "sage":
+            items.append(
+                f'<div class="issue-item"><h3 class="hlFld-Title"><a href="/doi/{doi}">{title}</a></h3>'
+                f'<div class="issue-item__authors">'
+                + "".join(f'<span class="contribDegrees">{a}</span>' for a in authors)
+                + f'</div><span class="issue-item__date">{date}</span>'
+                f'<a class="issue-item__doi" href="https://doi.org/{doi}">DOI</a></div>')
+        else:
+            items.append(
+                f'<li class="ResultItem col-xs-24" data-doi="{doi}"><div class="result-item-content">'
+                f'<h2 class="result-list-title"><a href="#">{title}</a></h2>'
+                f'<ol class="Authors">'
+                + "".join(f'<li><span class="author">{a}</span></li>' for a in authors)
+                + f'</ol><div class="srctitle-date-fields"><span class="date">{date}</span></div></div></li>')
+    noise = "".join(
+        f'<div class="nav-block"><ul>{"".join(f"<li><a href=#>Enlace {j}</a></li>" for j in range(20))}</ul></div>'
+        for _ in range(30))
+    script = "<script>" + "var x = 1;" * 2000 + "</script><style>" + ".a{color:red}" * 1000 + "</style>"
+    return (f'<!DOCTYPE html><html><head><meta charset="utf-8">{script}</head><body>{noise}'
+            f'<ul class="results">{"".join(items)}</ul>{noise}</body></html>').encode("utf-8")
+
+
+def _time(function, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def benchmark_page(content, source, repeat=5):
+    """
+    Mide la ruta original y cada motor disponible sobre una página. Retorna una
+    lista de diccionarios con el tiempo, el número de artículos y si los títulos
+    coinciden con los de la ruta original.
+    """
+    baseline_time, titles = _time(lambda: baseline_titles(content, source), repeat)
+    results = [{"source": source, "engine": "baseline", "seconds": baseline_time,
+                "articles": len(titles), "speedup": 1.0, "titles_match": True}]
+    engines = ENGINES if lxml is not None else ("soup",)
+    for engine in engines:
+        elapsed, articles = _time(lambda: extract_articles(content, source, engine), repeat)
+        results.append({
+            "source": source, "engine": engine, "seconds": elapsed, "articles": len(articles),
+            "speedup": baseline_time / elapsed if elapsed else None,
+            "titles_match": [" ".join(t.split()) for t in titles] == [a["article_name"] for a in articles],
+        })
+    return results
+
+
+def _source_for(path):
+    name = os.path.basename(path).lower()
+    for source in SELECTORS:
+        if name.startswith(source):
+            return source
+    raise ValueError(f"No se puede deducir la fuente de {path}; el nombre debe empezar por {list(SELECTORS)}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Compara la extracción original con BeautifulSoup frente a los motores de data_sources.extraction.")
+    parser.add_argument("fixtures", nargs="*",
+                        help="Páginas guardadas; el nombre debe empezar por acm, sage o sciencedirect.")
+    parser.add_argument("--synthetic", type=int, default=50,
+                        help="Si no se indican páginas, resultados por página sintética.")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    if args.fixtures:
+        pages = []
+        for path in args.fixtures:
+            with open(path, "rb") as f:
+                pages.append((path, _source_for(path), f.read()))
+    else:
+        pages = [(f"sintética:{source}", source, synthetic_page(source, args.synthetic)) for source in SELECTORS]
+
+    print(f"Motor por defecto: {default_engine()}")
+    all_results = []
+    for name, source, content in pages:
+        for result in benchmark_page(content, source, args.repeat):
+            result["page"] = name
+            all_results.append(result)
+            print(f"{name:<26} {result['engine']:<9} {result['seconds'] * 1000:9.2f} ms  "
+                  f"artículos={result['articles']:<4} x{result['speedup']:.1f}  "
+                  f"títulos iguales={result['titles_match']}")
+    return all_results
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,180 @@
+import asyncio
+import functools
+import time
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from data_sources.acm_scrapper import ACM_SEARCH_URL, parse_acm_articles
+from data_sources.sage_scrapper import SAGE_SEARCH_URL, parse_sage_articles
+from data_sources.sciencedirect_scrapper import (SCIENCEDIRECT_HEADERS, SCIENCEDIRECT_SEARCH_URL,
+                                                 parse_sciencedirect_articles)
+from data_sources.scopus_api import SCOPUS_SEARCH_URL, parse_scopus_articles, scopus_headers
+
+# Códigos HTTP que se reintentan con espera exponencial
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+
+def _source_requests(query, scopus_api_key=None, max_results=25):
+    """
+    Retorna, por fuente, la URL, los parámetros, los headers y la función que
+    convierte la respuesta en una lista de artículos.
+    """
+    sources = {
+        "acm": (ACM_SEARCH_URL, {"AllField": query}, {}, lambda r: parse_acm_articles(r.content)),
+        "sage": (SAGE_SEARCH_URL, {"AllField": query}, {}, lambda r: parse_sage_articles(r.content)),
+        "sciencedirect": (SCIENCEDIRECT_SEARCH_URL, {"qs": query}, SCIENCEDIRECT_HEADERS,
+                          lambda r: parse_sciencedirect_articles(r.content)),
+    }
+    if scopus_api_key:
+        sources["scopus"] = (SCOPUS_SEARCH_URL, {"query": query, "count": max_results},
+                             scopus_headers(scopus_api_key), lambda r: parse_scopus_articles(r.json()))
+    return sources
+
+
+class ArticleCollector:
+    """
+    Consulta todas las fuentes de data_sources de forma concurrente con asyncio.
+
+    Las peticiones bloqueantes de requests se ejecutan en hilos mediante
+    asyncio.to_thread, con una requests.Session por host cuyo pool de conexiones
+    keep-alive tiene el tamaño del límite de concurrencia por host. Cada petición
+    tiene timeout y se reintenta con espera exponencial ante errores de red o
+    códigos 429/5xx.
+
+    base_urls permite reemplazar la URL de cualquier fuente (por ejemplo por un
+    servidor HTTP local que sirva páginas guardadas) para pruebas sin red. Con
+    cache (un HTTPCache) las peticiones pasan por la caché en disco.
+    """
+
+    def __init__(self, per_host_limit=4, timeout=30, retries=3, backoff=0.5, base_urls=None, cache=None):
+        self.per_host_limit = per_host_limit
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.base_urls = base_urls or {}
+        self.cache = cache
+        self._sessions = {}
+        self._semaphores = {}
+
+    def _session(self, host):
+        session = self._sessions.get(host)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.per_host_limit)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            self._sessions[host] = session
+        return session
+
+    def _semaphore(self, host):
+        semaphore = self._semaphores.get(host)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.per_host_limit)
+            self._semaphores[host] = semaphore
+        return semaphore
+
+    async def fetch(self, url, params=None, headers=None):
+        """
+        Realiza un GET respetando el límite por host, con timeout y reintentos.
+        Retorna la respuesta o lanza la última excepción.
+        """
+        host = urlsplit(url).netloc
+        session = self._session(host)
+        if self.cache is not None:
+            # La caché revalida y descarga con la Session del host
+            get = functools.partial(self.cache.get, session=session)
+        else:
+            get = session.get
+        for attempt in range(self.retries + 1):
+            try:
+                async with self._semaphore(host):
+                    response = await asyncio.to_thread(
+                        get, url, params=params, headers=headers, timeout=self.timeout)
+                # Las respuestas generadas por la caché (como el 504 de replay_only)
+                # no cambian al reintentar
+                if response.status_code not in RETRY_STATUS or getattr(response, "replay_miss", False) \
+                        or attempt == self.retries:
+                    return response
+            except requests.RequestException:
+                if attempt == self.retries:
+                    raise
+            await asyncio.sleep(self.backoff * 2 ** attempt)
+
+    async def _fetch_source(self, name, url, params, headers, parse):
+        start = time.perf_counter()
+        try:
+            response = await self.fetch(self.base_urls.get(name, url), params, headers)
+        except requests.RequestException as err:
+            print(f"Error al acceder a {name}: {err}")
+            return name, [], time.perf_counter() - start
+        if response.status_code != 200:
+            print(f"Error al acceder a {name}: {response.status_code}")
+            return name, [], time.perf_counter() - start
+        try:
+            articles = parse(response)
+        except Exception as err:
+            # Un cuerpo malformado (por ejemplo JSON inválido de Scopus) solo
+            # descarta esta fuente, no cancela las demás
+            print(f"Error al procesar la respuesta de {name}: {type(err).__name__}: {err}")
+            return name, [], time.perf_counter() - start
+        for article in articles:
+            article["source"] = name
+        return name, articles, time.perf_counter() - start
+
+    async def stream(self, query, scopus_api_key=None, sources=None, max_results=25):
+        """
+        Generador asíncrono que produce (fuente, artículos, segundos) a medida que
+        cada fuente responde. Scopus solo se consulta si hay API key.
+        """
+        requests_by_source = _source_requests(query, scopus_api_key, max_results)
+        if sources is not None:
+            requests_by_source = {name: requests_by_source[name] for name in sources if name in requests_by_source}
+        tasks = [
+            asyncio.create_task(self._fetch_source(name, *spec))
+            for name, spec in requests_by_source.items()
+        ]
+        try:
+            for task in asyncio.as_completed(tasks):
+                yield await task
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def close(self):
+        for session in self._sessions.values():
+            session.close()
+        self._sessions.clear()
+
+
+def collect_articles(query, scopus_api_key=None, sources=None, max_results=25, **collector_options):
+    """
+    Versión sincrónica: consulta todas las fuentes concurrentemente y retorna
+    un diccionario fuente -> lista de artículos.
+    """
+    async def run():
+        collector = ArticleCollector(**collector_options)
+        results = {}
+        try:
+            async for name, articles, _ in collector.stream(query, scopus_api_key, sources, max_results):
+                results[name] = articles
+        finally:
+            collector.close()
+        return results
+
+    return asyncio.run(run())
+
+
+if __name__ == '__main__':
+    query = "computational thinking"
+
+    async def main():
+        collector = ArticleCollector()
+        try:
+            async for name, articles, elapsed in collector.stream(query):
+                print(f"{name}: {len(articles)} artículos en {elapsed:.2f} s")
+        finally:
+            collector.close()
+
+    asyncio.run(main())
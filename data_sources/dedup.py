@@ -0,0 +1,398 @@
+import random
+
+from sorting_algorithms.search import fold_text, publication_year, tokenize
+
+try:
+    import numpy as np
+except ImportError:
+    # Sin NumPy las firmas MinHash se calculan registro a registro en Python
+    np = None
+
+# Primo de Mersenne 2^31 - 1: los productos a * h caben en 64 bits
+_PRIME = (1 << 31) - 1
+_BASE = 1000003
+_SHINGLE = 3
+
+# Campos que se completan con el primer valor no vacío del grupo al fusionar
+MERGED_FIELDS = ("article_name", "author_name", "publication_date", "theme", "category", "doi")
+
+
+def normalize_title(title):
+    """
+    Título sin tildes, mayúsculas ni puntuación, con las palabras separadas
+    por un espacio: "Análisis  de Datos." -> "analisis de datos".
+    """
+    return " ".join(tokenize(title or ""))
+
+
+def normalize_doi(doi):
+    doi = fold_text(doi or "").strip()
+    position = doi.find("10.")
+    return doi[position:] if position >= 0 else ""
+
+
+def author_surnames(author_name):
+    """
+    Apellidos normalizados de una lista de autores, en cualquiera de los
+    formatos de las fuentes: "Ana García; John Smith", "García, Ana; Smith, J."
+    o "García, Ana and Smith, John".
+    """
+    surnames = set()
+    for author in (author_name or "").replace(" and ", ";").split(";"):
+        author = author.strip()
+        if not author:
+            continue
+        name = author.split(",")[0] if "," in author else author.split()[-1]
+        words = tokenize(name)
+        if words:
+            surnames.add(words[-1])
+    return surnames
+
+
+def _shingles(text):
+    text = text.ljust(_SHINGLE)
+    return {text[i:i + _SHINGLE] for i in range(len(text) - _SHINGLE + 1)}
+
+
+def jaccard(a, b):
+    """
+    Similitud de Jaccard entre los 3-gramas de caracteres de dos títulos normalizados.
+    """
+    a, b = _shingles(a), _shingles(b)
+    return len(a & b) / len(a | b)
+
+
+class _DisjointSet:
+    """
+    Unión-búsqueda con compresión de caminos; la raíz de cada grupo es su
+    primer registro, para que el registro fusionado conserve el orden de llegada.
+    """
+
+    def __init__(self):
+        self.parent = []
+
+    def add(self):
+        self.parent.append(len(self.parent))
+        return len(self.parent) - 1
+
+    def find(self, i):
+        parent = self.parent
+        root = i
+        while parent[root] != root:
+            root = parent[root]
+        while parent[i] != root:
+            parent[i], i = root, parent[i]
+        return root
+
+    def union(self, i, j):
+        i, j = self.find(i), self.find(j)
+        if i == j:
+            return i
+        if j < i:
+            i, j = j, i
+        self.parent[j] = i
+        return i
+
+
+class Deduplicator:
+    """
+    Detecta artículos duplicados entre fuentes en tiempo aproximadamente lineal.
+
+    Cada registro se compara solo con candidatos:
+      - bloqueo exacto: mismo DOI o mismo título normalizado;
+      - MinHash/LSH sobre los 3-gramas de caracteres del título normalizado:
+        la firma se divide en bands bandas de rows valores y dos registros son
+        candidatos si coinciden en alguna banda (títulos con erratas, tildes,
+        puntuación o palabras de más).
+    Los candidatos se verifican con la similitud de Jaccard exacta de los
+    títulos (>= threshold), que al menos un apellido coincida (si ambos tienen
+    autores) y que los años no difieran en más de max_year_gap.
+
+    Los grupos se fusionan en el primer registro: los campos vacíos se
+    completan con los de los duplicados, "sources" lista las fuentes y
+    "duplicate_ids" los ids de los registros fusionados.
+
+    Se puede usar por lotes (add_many y records) o en flujo desde un pipeline
+    (add_batch y pop_changes). En flujo, un registro ya entregado puede cambiar
+    después: un duplicado que llega más tarde lo completa, o une su grupo con
+    otro anterior (cuando coincide con ambos) y el grupo más reciente deja de
+    existir. pop_changes informa de esos cambios para que la etapa siguiente
+    actualice y elimine los registros que ya guardó.
+    """
+
+    def __init__(self, threshold=0.6, bands=16, rows=4, max_year_gap=1, max_bucket=100,
+                 batch_size=10000, seed=1):
+        """
+        :param threshold: Jaccard mínima entre títulos para considerarlos el mismo artículo.
+        :param bands: Bandas LSH; con rows valores por banda, la probabilidad de ser
+                      candidatos es 1 - (1 - J^rows)^bands para una similitud J.
+        :param max_bucket: Registros de cada cubeta LSH con los que se compara uno
+                           nuevo (los más recientes); acota el coste con títulos genéricos.
+        :param batch_size: Registros por lote al calcular las firmas con NumPy.
+        """
+        self.threshold = threshold
+        self.bands = bands
+        self.rows = rows
+        self.max_year_gap = max_year_gap
+        self.max_bucket = max_bucket
+        self.batch_size = batch_size
+
+        permutations = bands * rows
+        if np is not None:
+            rng = np.random.default_rng(seed)
+            self._a = rng.integers(1, _PRIME, permutations, dtype=np.uint64)
+            self._b = rng.integers(0, _PRIME, permutations, dtype=np.uint64)
+        else:
+            rnd = random.Random(seed)
+            self._a = [rnd.randrange(1, _PRIME) for _ in range(permutations)]
+            self._b = [rnd.randrange(0, _PRIME) for _ in range(permutations)]
+
+        self._sets = _DisjointSet()
+        self._merged = []
+        self._titles = []
+        self._surnames = []
+        self._years = []
+        self._by_doi = {}
+        self._by_title = {}
+        self._buckets = {}
+        # Grupos entregados por add_batch y cambios pendientes de pop_changes
+        self._emitted = set()
+        self._updated = set()
+        self._absorbed = []
+        self.stats = {"records": 0, "duplicates": 0, "candidates": 0, "exact": 0, "absorbed": 0}
+
+    def _signatures(self, titles):
+        """
+        Firmas MinHash de los títulos normalizados: una fila de bands * rows
+        enteros por título. Con NumPy, los 3-gramas de todo el lote se
+        calculan como un hash polinómico sobre los puntos de código.
+        """
+        titles = [title.ljust(_SHINGLE) for title in titles]
+        if np is None:
+            signatures = []
+            for title in titles:
+                hashes = []
+                for i in range(len(title) - _SHINGLE + 1):
+                    h = 0
+                    for char in title[i:i + _SHINGLE]:
+                        h = (h * _BASE + ord(char)) % _PRIME
+                    hashes.append(h)
+                signatures.append([min((a * h + b) % _PRIME for h in hashes) for a, b in zip(self._a, self._b)])
+            return signatures
+
+        lengths = np.fromiter((len(title) for title in titles), dtype=np.int64, count=len(titles))
+        codes = np.frombuffer("".join(titles).encode("utf-32-le"), dtype=np.uint32).astype(np.uint64)
+        last = len(codes) - _SHINGLE + 1
+        hashes = codes[:last] % _PRIME
+        for k in range(1, _SHINGLE):
+            hashes = (hashes * _BASE + codes[k:last + k]) % _PRIME
+        # Solo los n-gramas que empiezan y terminan dentro del mismo título
+        ends = np.cumsum(lengths)
+        counts = lengths - _SHINGLE + 1
+        starts = ends - lengths
+        offsets = np.repeat(starts - (np.cumsum(counts) - counts), counts)
+        hashes = hashes[np.arange(counts.sum()) + offsets]
+        segments = np.cumsum(counts) - counts
+
+        signatures = np.empty((len(titles), len(self._a)), dtype=np.uint64)
+        for column, (a, b) in enumerate(zip(self._a, self._b)):
+            signatures[:, column] = np.minimum.reduceat((hashes * a + b) % _PRIME, segments)
+        return signatures
+
+    def _band_keys(self, signatures):
+        """
+        Clave entera de cada banda de cada firma: un hash de los rows valores
+        de la banda combinado con el número de banda, para usar un solo
+        diccionario de cubetas. Las colisiones solo añaden candidatos, que se
+        descartan al verificar.
+        """
+        if np is None:
+            rows = self.rows
+            return [[hash((band, tuple(signature[band * rows:(band + 1) * rows]))) for band in range(self.bands)]
+                    for signature in signatures]
+        bands = signatures.reshape(len(signatures), self.bands, self.rows)
+        multipliers = np.array([_BASE ** (k + 1) % (1 << 64) for k in range(self.rows)], dtype=np.uint64)
+        keys = (bands * multipliers).sum(axis=2, dtype=np.uint64)
+        keys ^= np.arange(self.bands, dtype=np.uint64) * np.uint64(0x9E3779B97F4A7C15)
+        return keys.view(np.int64).tolist()
+
+    def _compatible(self, i, j):
+        a, b = self._surnames[i], self._surnames[j]
+        if a and b and not a & b:
+            return False
+        year_a, year_b = self._years[i], self._years[j]
+        return year_a is None or year_b is None or abs(year_a - year_b) <= self.max_year_gap
+
+    def _merge(self, i, j):
+        root_i, root_j = self._sets.find(i), self._sets.find(j)
+        if root_i == root_j:
+            return False
+        root = self._sets.union(root_i, root_j)
+        other = root_j if root == root_i else root_i
+        target, source = self._merged[root], self._merged[other]
+        for field in MERGED_FIELDS:
+            if not target.get(field) and source.get(field):
+                target[field] = source[field]
+        for name in source["sources"]:
+            if name not in target["sources"]:
+                target["sources"].append(name)
+        target["duplicate_ids"].extend(source["duplicate_ids"])
+        self._merged[other] = None
+        if root in self._emitted:
+            self._updated.add(root)
+        if other in self._emitted:
+            self._emitted.discard(other)
+            self._updated.discard(other)
+            self._absorbed.append((other, source))
+            self.stats["absorbed"] += 1
+        return True
+
+    def _add(self, record, title, keys):
+        index = self._sets.add()
+        merged = dict(record)
+        merged["sources"] = [record["source"]] if record.get("source") else []
+        merged["duplicate_ids"] = [record.get("id")]
+        self._merged.append(merged)
+        self._titles.append(title)
+        self._surnames.append(author_surnames(record.get("author_name")))
+        self._years.append(publication_year(record.get("publication_date")))
+        self.stats["records"] += 1
+
+        matches = []
+        doi = normalize_doi(record.get("doi"))
+        exact = [self._by_doi.get(doi) if doi else None, self._by_title.get(title) if title else None]
+        for j in exact:
+            if j is not None and (j == exact[0] or self._compatible(index, j)):
+                matches.append(j)
+        if matches:
+            # Un registro cuenta una vez aunque coincida por DOI y por título
+            self.stats["exact"] += 1
+
+        keys = keys if title else ()
+        if not matches:
+            candidates = set()
+            for key in keys:
+                bucket = self._buckets.get(key)
+                if bucket is None:
+                    continue
+                if isinstance(bucket, int):
+                    candidates.add(bucket)
+                else:
+                    candidates.update(bucket[-self.max_bucket:])
+            self.stats["candidates"] += len(candidates)
+            for j in sorted(candidates):
+                if self._compatible(index, j) and jaccard(title, self._titles[j]) >= self.threshold:
+                    matches.append(j)
+
+        duplicate = False
+        for j in matches:
+            duplicate = self._merge(j, index) or duplicate
+        if duplicate:
+            self.stats["duplicates"] += 1
+
+        if doi:
+            self._by_doi.setdefault(doi, index)
+        if title:
+            self._by_title.setdefault(title, index)
+        # La mayoría de las cubetas tienen un solo registro: se guarda el índice
+        # sin lista para reducir la memoria
+        buckets = self._buckets
+        for key in keys:
+            bucket = buckets.get(key)
+            if bucket is None:
+                buckets[key] = index
+            elif isinstance(bucket, int):
+                buckets[key] = [bucket, index]
+            else:
+                bucket.append(index)
+        return not duplicate
+
+    def add_many(self, records):
+        """
+        Añade los registros por lotes de batch_size. Retorna cuántos eran
+        artículos nuevos (no duplicados de otro anterior).
+        """
+        new = 0
+        batch = []
+        for record in records:
+            batch.append(record)
+            if len(batch) >= self.batch_size:
+                new += len(self._add_records(batch))
+                batch = []
+        if batch:
+            new += len(self._add_records(batch))
+        return new
+
+    def _add_records(self, records):
+        # Índices de los registros del lote que eran artículos nuevos
+        records = list(records)
+        titles = [normalize_title(record.get("article_name")) for record in records]
+        keys = self._band_keys(self._signatures(titles))
+        added = []
+        for record, title, record_keys in zip(records, titles, keys):
+            if self._add(record, title, record_keys):
+                added.append(len(self._merged) - 1)
+        return added
+
+    def add_batch(self, records):
+        """
+        Añade un lote de registros (las firmas se calculan juntas) y retorna
+        los registros fusionados de los que eran artículos nuevos, para pasarlos
+        a la siguiente etapa de un pipeline. Un registro nuevo que otro del mismo
+        lote une a un grupo anterior ya no se retorna. Los cambios posteriores
+        de los registros retornados se obtienen con pop_changes.
+        """
+        new = [index for index in self._add_records(records) if self._merged[index] is not None]
+        self._emitted.update(new)
+        return [self._merged[index] for index in new]
+
+    def pop_changes(self):
+        """
+        Cambios de los registros retornados por add_batch desde la llamada
+        anterior, como (actualizados, absorbidos):
+          - actualizados: registros fusionados que recibieron datos de un
+            duplicado (campos completados, fuentes o ids nuevos);
+          - absorbidos: pares (registro, registro que lo absorbió) de grupos
+            que se unieron a otro anterior; el primero debe eliminarse.
+        """
+        updated = [self._merged[index] for index in sorted(self._updated)]
+        absorbed = [(record, self.canonical(index)) for index, record in self._absorbed]
+        self._updated = set()
+        self._absorbed = []
+        return updated, absorbed
+
+    def add(self, record):
+        """
+        Añade un registro. Retorna True si es un artículo nuevo y False si se
+        fusionó con uno anterior; en ese caso el registro fusionado (que ya
+        pudo salir del pipeline) se completa en el sitio.
+        """
+        return bool(self.add_batch([record]))
+
+    def canonical(self, record_index):
+        """
+        Registro fusionado del grupo al que pertenece el registro número record_index.
+        """
+        return self._merged[self._sets.find(record_index)]
+
+    def labels(self):
+        """
+        Grupo de cada registro añadido (el índice de su primer registro), en el
+        orden de llegada; dos registros son duplicados si tienen el mismo grupo.
+        """
+        return [self._sets.find(i) for i in range(len(self._merged))]
+
+    def records(self):
+        """
+        Registros fusionados, uno por artículo, en el orden de su primera aparición.
+        """
+        return [merged for merged in self._merged if merged is not None]
+
+
+def deduplicate(records, **options):
+    """
+    Retorna los registros sin duplicados, fusionados con Deduplicator.
+    """
+    deduplicator = Deduplicator(**options)
+    deduplicator.add_many(records)
+    return deduplicator.records()
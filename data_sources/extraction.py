@@ -0,0 +1,169 @@
+from bs4 import BeautifulSoup, SoupStrainer
+
+try:
+    import lxml.html
+    from lxml.cssselect import CSSSelector
+except ImportError:
+    # Sin lxml/cssselect se usa el motor BeautifulSoup con SoupStrainer
+    lxml = None
+    CSSSelector = None
+
+# Selectores por fuente. "item" es la etiqueta y clase del contenedor de cada
+# resultado; el resto son selectores CSS relativos al contenedor, o pares
+# (selector, atributo) cuando el valor está en un atributo. Un selector None
+# se refiere al propio contenedor. Como en los scrapers, la estructura de cada
+# sitio es ilustrativa y debe ajustarse si la página cambia.
+SELECTORS = {
+    "acm": {
+        "item": ("li", "search__item"),
+        "title": "h5.issue-item__title",
+        "authors": "span.hlFld-ContribAuthor",
+        "date": "div.bookPubDate",
+        "doi": ("h5.issue-item__title a", "href"),
+    },
+    "sage": {
+        "item": ("div", "issue-item"),
+        "title": "h3.hlFld-Title",
+        "authors": "div.issue-item__authors span.contribDegrees",
+        "date": "span.issue-item__date",
+        "doi": ("a.issue-item__doi", "href"),
+    },
+    "sciencedirect": {
+        "item": ("li", "ResultItem"),
+        "title": "h2.result-list-title",
+        "authors": "ol.Authors span.author",
+        "date": "div.srctitle-date-fields span.date",
+        "doi": (None, "data-doi"),
+    },
+}
+
+ENGINES = ("lxml", "soup")
+
+
+def default_engine():
+    return "lxml" if lxml is not None else "soup"
+
+
+def _clean(text):
+    return " ".join(text.split())
+
+
+def _normalize_doi(value):
+    # Los enlaces tienen la forma /doi/10.1145/... o https://doi.org/10.1145/...
+    position = value.find("10.")
+    return value[position:] if position >= 0 else value
+
+
+def _field_spec(spec):
+    return spec if isinstance(spec, tuple) else (spec, None)
+
+
+def _record(title, authors, date, doi):
+    return {
+        "article_name": title,
+        "author_name": "; ".join(authors),
+        "publication_date": date,
+        "doi": _normalize_doi(doi) if doi else "",
+    }
+
+
+_compiled = {}
+
+
+def _selector(css):
+    selector = _compiled.get(css)
+    if selector is None:
+        selector = _compiled[css] = CSSSelector(css)
+    return selector
+
+
+def _extract_items(items, config, select, text):
+    """
+    Construye los registros a partir de los contenedores de resultados; select
+    y text adaptan la consulta CSS y la extracción de texto a cada motor.
+    """
+    def values(item, spec):
+        css, attribute = _field_spec(spec)
+        nodes = [item] if css is None else select(item, css)
+        if attribute:
+            return [node.get(attribute, "") for node in nodes]
+        return [_clean(text(node)) for node in nodes]
+
+    articles = []
+    for item in items:
+        titles = values(item, config["title"])
+        if not titles:
+            continue
+        dates = values(item, config["date"])
+        dois = values(item, config["doi"])
+        articles.append(_record(titles[0], values(item, config["authors"]),
+                                dates[0] if dates else "", dois[0] if dois else ""))
+    return articles
+
+
+def _extract_lxml(content, config):
+    if isinstance(content, str):
+        # lxml rechaza los str con declaración de codificación XML (ValueError);
+        # se pasan como UTF-8 con la codificación del parser fija, que prevalece
+        # sobre la que declare el documento
+        root = lxml.html.fromstring(content.encode("utf-8"), parser=lxml.html.HTMLParser(encoding="utf-8"))
+    elif b"charset" not in content[:2048].lower():
+        # Sin charset declarado, libxml2 asumiría latin-1; las fuentes usan UTF-8
+        root = lxml.html.fromstring(content, parser=lxml.html.HTMLParser(encoding="utf-8"))
+    else:
+        root = lxml.html.fromstring(content)
+    tag, css_class = config["item"]
+    items = _selector(f"{tag}.{css_class}")(root)
+    if not items:
+        # Páginas sin contenedores: solo se pueden recuperar los títulos
+        return [_record(_clean(node.text_content()), [], "", "") for node in _selector(config["title"])(root)]
+    return _extract_items(items, config, lambda node, css: _selector(css)(node), lambda node: node.text_content())
+
+
+def _has_class(css_class):
+    # SoupStrainer compara el atributo class completo; se acepta cualquier
+    # elemento que incluya la clase entre las suyas
+    def match(value):
+        if not value:
+            return False
+        return css_class in (value.split() if isinstance(value, str) else value)
+    return match
+
+
+def _extract_soup(content, config):
+    parser = "lxml" if lxml is not None else "html.parser"
+    tag, css_class = config["item"]
+    # Solo se construye el árbol de los contenedores de resultados
+    soup = BeautifulSoup(content, parser, parse_only=SoupStrainer(tag, class_=_has_class(css_class)))
+    items = soup.find_all(tag, class_=css_class)
+    if not items:
+        title_tag, _, title_class = config["title"].partition(".")
+        strainer = SoupStrainer(title_tag, class_=_has_class(title_class)) if title_class else SoupStrainer(title_tag)
+        soup = BeautifulSoup(content, parser, parse_only=strainer)
+        return [_record(_clean(node.get_text(" ")), [], "", "") for node in soup.find_all(title_tag)]
+    return _extract_items(items, config, lambda node, css: node.select(css), lambda node: node.get_text(" "))
+
+
+def extract_articles(content, source, engine=None, selectors=None):
+    """
+    Extrae los artículos (título, autores, fecha y DOI) de una página de
+    resultados. content puede ser bytes (preferible: el parser detecta la
+    codificación sin decodificar el texto completo en Python) o str.
+
+    :param source: Nombre de la fuente en SELECTORS ("acm", "sage", "sciencedirect").
+    :param engine: "lxml" (selectores CSS compilados sobre lxml) o "soup"
+                   (BeautifulSoup limitado con SoupStrainer); por defecto lxml si
+                   está instalado.
+    :param selectors: Configuración alternativa en el formato de SELECTORS.
+    """
+    config = (selectors or SELECTORS)[source]
+    engine = engine or default_engine()
+    if engine == "lxml":
+        if lxml is None:
+            raise ImportError("El motor lxml requiere los paquetes lxml y cssselect")
+        if not content or not content.strip():
+            return []
+        return _extract_lxml(content, config)
+    if engine == "soup":
+        return _extract_soup(content, config)
+    raise ValueError(f"Motor de extracción desconocido: {engine}")
@@ -0,0 +1,196 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from urllib.parse import urlencode
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+# Headers de la petición que cambian la respuesta y forman parte de la clave
+# de la caché (por ejemplo, la API key y el formato pedido a Scopus)
+VARY_HEADERS = ("Accept", "Accept-Language", "Authorization", "Cookie", "X-ELS-APIKey", "X-ELS-Insttoken")
+
+
+class CachedResponse:
+    """
+    Respuesta servida desde la caché, con la misma interfaz básica que
+    requests.Response (status_code, content, text, headers, json()).
+    replay_miss indica el 504 que genera la propia caché en modo replay_only
+    cuando no tiene la URL: no es un error del servidor y no debe reintentarse.
+    """
+
+    def __init__(self, url, status_code, content, headers, from_cache=True, replay_miss=False):
+        self.url = url
+        self.status_code = status_code
+        self.content = content
+        self.headers = CaseInsensitiveDict(headers)
+        self.from_cache = from_cache
+        self.replay_miss = replay_miss
+
+    @property
+    def encoding(self):
+        content_type = self.headers.get("Content-Type", "")
+        for part in content_type.split(";"):
+            name, _, value = part.strip().partition("=")
+            if name.lower() == "charset" and value:
+                return value.strip('"')
+        return "utf-8"
+
+    @property
+    def text(self):
+        return self.content.decode(self.encoding, errors="replace")
+
+    def json(self):
+        return json.loads(self.content)
+
+
+class HTTPCache:
+    """
+    Caché HTTP en disco (SQLite) compartida por los módulos de data_sources.
+
+    Las respuestas 200 se guardan comprimidas con zlib, indexadas por URL,
+    parámetros de la consulta y los headers de VARY_HEADERS. Mientras una entrada tiene menos de ttl segundos
+    se sirve sin red; después se revalida con If-None-Match / If-Modified-Since
+    y un 304 solo renueva la entrada. Si el tamaño total supera max_bytes se
+    eliminan las entradas usadas hace más tiempo (LRU); una respuesta que por
+    sí sola ocupa más de max_bytes no se guarda.
+
+    Con replay_only=True nunca se accede a la red: las entradas se sirven aunque
+    estén vencidas y una URL sin entrada retorna un 504, como only-if-cached.
+
+    get() tiene la firma de requests.get, así que un HTTPCache puede pasarse
+    donde los scrapers esperan requests o una Session. Con session, las
+    peticiones de esa llamada usan esa Session (por ejemplo, el pool keep-alive
+    por host de ArticleCollector) en lugar de la propia.
+    """
+
+    def __init__(self, path=".cache/http_cache.sqlite", ttl=24 * 3600, max_bytes=256 * 1024 * 1024,
+                 replay_only=False, session=None):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.replay_only = replay_only
+        self.session = session or requests.Session()
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "  key TEXT PRIMARY KEY, "
+            "  url TEXT, "
+            "  status INTEGER, "
+            "  headers TEXT, "
+            "  body BLOB, "
+            "  size INTEGER, "
+            "  fetched_at REAL, "
+            "  accessed_at REAL"
+            ")"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed_at)")
+        self._db.commit()
+
+    @staticmethod
+    def cache_key(url, params=None, headers=None):
+        query = urlencode(sorted((params or {}).items()), doseq=True)
+        key = f"{url}?{query}"
+        headers = CaseInsensitiveDict(headers or {})
+        vary = [(name.lower(), headers[name]) for name in VARY_HEADERS if name in headers]
+        if vary:
+            # Sin headers relevantes la clave es la misma que la de versiones anteriores
+            key += "\n" + urlencode(vary)
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+    def _load(self, key):
+        with self._lock:
+            return self._db.execute(
+                "SELECT url, status, headers, body, fetched_at FROM responses WHERE key = ?", (key,)).fetchone()
+
+    def _touch(self, key, refreshed=False):
+        now = time.time()
+        with self._lock:
+            if refreshed:
+                self._db.execute("UPDATE responses SET fetched_at = ?, accessed_at = ? WHERE key = ?", (now, now, key))
+            else:
+                self._db.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+            self._db.commit()
+
+    def _store(self, key, response):
+        headers = {name: response.headers[name]
+                   for name in ("Content-Type", "ETag", "Last-Modified") if name in response.headers}
+        body = zlib.compress(response.content)
+        now = time.time()
+        with self._lock:
+            if len(body) > self.max_bytes:
+                # _evict la eliminaría junto con todas las demás; tampoco se
+                # conserva la versión anterior, que ya no es la vigente
+                self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._db.commit()
+                return
+            self._db.execute(
+                "REPLACE INTO responses (key, url, status, headers, body, size, fetched_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, response.url, response.status_code, json.dumps(headers), body, len(body), now, now))
+            self._evict()
+            self._db.commit()
+
+    def _evict(self):
+        total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        for key, size in self._db.execute("SELECT key, size FROM responses ORDER BY accessed_at").fetchall():
+            self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+            total -= size
+            if total <= self.max_bytes:
+                break
+
+    @staticmethod
+    def _response(row):
+        url, status, headers, body, _ = row
+        return CachedResponse(url, status, zlib.decompress(body), json.loads(headers))
+
+    def get(self, url, params=None, headers=None, timeout=30, session=None, **kwargs):
+        key = self.cache_key(url, params, headers)
+        row = self._load(key)
+        if row is not None and (self.replay_only or time.time() - row[4] < self.ttl):
+            self.hits += 1
+            self._touch(key)
+            return self._response(row)
+        if self.replay_only:
+            self.misses += 1
+            return CachedResponse(url, 504, b"", {}, replay_miss=True)
+
+        request_headers = dict(headers or {})
+        if row is not None:
+            cached_headers = json.loads(row[2])
+            if "ETag" in cached_headers:
+                request_headers["If-None-Match"] = cached_headers["ETag"]
+            if "Last-Modified" in cached_headers:
+                request_headers["If-Modified-Since"] = cached_headers["Last-Modified"]
+
+        response = (session or self.session).get(url, params=params, headers=request_headers, timeout=timeout, **kwargs)
+        if response.status_code == 304 and row is not None:
+            self.revalidated += 1
+            self._touch(key, refreshed=True)
+            return self._response(row)
+        self.misses += 1
+        if response.status_code == 200:
+            self._store(key, response)
+        return response
+
+    def clear(self):
+        with self._lock:
+            self._db.execute("DELETE FROM responses")
+            self._db.commit()
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+        self.session.close()
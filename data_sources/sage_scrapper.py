@@ -1,24 +1,29 @@
 import requests
-from bs4 import BeautifulSoup
 
-def fetch_sage_articles(query):
+from data_sources.extraction import extract_articles
+
+SAGE_SEARCH_URL = "https://journals.sagepub.com/action/doSearch"
+
+
+def parse_sage_articles(content, engine=None):
+    """
+    Extrae título, autores, fecha y DOI de una página de resultados de SAGE Journals.
+    content puede ser el cuerpo en bytes de la respuesta o el texto HTML.
+    """
+    return extract_articles(content, "sage", engine)
+
+
+def fetch_sage_articles(query, cache=None):
     """
     Realiza scraping a la plataforma de SAGE para obtener artículos relacionados con el query.
     Se realiza una solicitud HTTP y se parsea el HTML para extraer títulos de artículos.
     """
-    url = f"https://journals.sagepub.com/action/doSearch?AllField={query}"
-    response = requests.get(url)
+    response = (cache or requests).get(SAGE_SEARCH_URL, params={"AllField": query})
     if response.status_code != 200:
         print("Error al acceder a SAGE Journals.")
         return []
 
-    soup = BeautifulSoup(response.text, 'html.parser')
-    articles = []
-    # Ejemplo de extracción: Se buscan etiquetas que contienen títulos de artículos
-    for tag in soup.find_all("h3", class_="hlFld-Title"):
-        title = tag.get_text(strip=True)
-        articles.append({"article_name": title})
-    return articles
+    return parse_sage_articles(response.content)
 
 if __name__ == '__main__':
     query = "computational thinking"
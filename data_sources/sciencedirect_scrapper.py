@@ -1,27 +1,32 @@
 import requests
-from bs4 import BeautifulSoup
 
-def fetch_sciencedirect_articles(query):
+from data_sources.extraction import extract_articles
+
+SCIENCEDIRECT_SEARCH_URL = "https://www.sciencedirect.com/search"
+SCIENCEDIRECT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0'
+}
+
+
+def parse_sciencedirect_articles(content, engine=None):
+    """
+    Extrae título, autores, fecha y DOI de una página de resultados de ScienceDirect.
+    content puede ser el cuerpo en bytes de la respuesta o el texto HTML.
+    """
+    return extract_articles(content, "sciencedirect", engine)
+
+
+def fetch_sciencedirect_articles(query, cache=None):
     """
     Realiza scraping a la plataforma de ScienceDirect para obtener artículos relacionados con el query.
     Se utiliza un header para simular un navegador y se extraen los títulos de los artículos.
     """
-    url = f"https://www.sciencedirect.com/search?qs={query}"
-    headers = {
-        'User-Agent': 'Mozilla/5.0'
-    }
-    response = requests.get(url, headers=headers)
+    response = (cache or requests).get(SCIENCEDIRECT_SEARCH_URL, params={"qs": query}, headers=SCIENCEDIRECT_HEADERS)
     if response.status_code != 200:
         print("Error al acceder a ScienceDirect.")
         return []
 
-    soup = BeautifulSoup(response.text, 'html.parser')
-    articles = []
-    # Ejemplo de extracción: Se buscan etiquetas <h2> que contienen el título del artículo
-    for h2 in soup.find_all("h2", class_="result-list-title"):
-        title = h2.get_text(strip=True)
-        articles.append({"article_name": title})
-    return articles
+    return parse_sciencedirect_articles(response.content)
 
 if __name__ == '__main__':
     query = "computational thinking"
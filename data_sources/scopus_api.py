@@ -1,7 +1,50 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
 
+SCOPUS_SEARCH_URL = "https://api.elsevier.com/content/search/scopus"
+
+
+def normalize_scopus_entry(entry):
+    """
+    Convierte una entrada de la API de Scopus en un registro con los campos de
+    la tabla articles (id, article_name, author_name, publication_date, theme,
+    category), más el DOI y la fuente.
+    """
+    # dc:identifier tiene la forma "SCOPUS_ID:85012345678"
+    identifier = entry.get('dc:identifier', '').rsplit(':', 1)[-1]
+    authors = [author.get('authname', '') for author in entry.get('author', []) if author.get('authname')]
+    subjects = [subject.get('$', '') for subject in entry.get('subject-area', []) if subject.get('$')]
+    return {
+        "id": int(identifier) if identifier.isdigit() else identifier or None,
+        "article_name": entry.get('dc:title', 'Sin título'),
+        "author_name": "; ".join(authors) if authors else entry.get('dc:creator', ''),
+        "publication_date": entry.get('prism:coverDate', ''),
+        "theme": "; ".join(subjects) if subjects else entry.get('prism:publicationName', ''),
+        "category": entry.get('subtypeDescription', ''),
+        "doi": entry.get('prism:doi', ''),
+        "source": "scopus",
+    }
+
 
-def fetch_scopus_articles(query, api_key, max_results=25):
+def parse_scopus_articles(data):
+    """
+    Extrae los artículos de una respuesta JSON de la API de búsqueda de Scopus.
+    """
+    # Se extrae la información deseada de cada entrada del resultado
+    entries = data.get('search-results', {}).get('entry', [])
+    # Una búsqueda sin resultados retorna una única entrada con la clave "error"
+    return [normalize_scopus_entry(entry) for entry in entries if 'error' not in entry]
+
+
+def scopus_headers(api_key):
+    return {
+        'Accept': 'application/json',
+        'X-ELS-APIKey': api_key
+    }
+
+
+def fetch_scopus_articles(query, api_key, max_results=25, cache=None):
     """
     Accede a la API de Scopus para obtener artículos relacionados con el query.
     Es necesario disponer de un API key válido para utilizar este servicio.
@@ -11,28 +54,74 @@ def fetch_scopus_articles(query, api_key, max_results=25):
     :param max_results: Número máximo de resultados a retornar.
     :return: Lista de diccionarios con información de los artículos.
     """
-    url = "https://api.elsevier.com/content/search/scopus"
-    headers = {
-        'Accept': 'application/json',
-        'X-ELS-APIKey': api_key
-    }
     params = {
         'query': query,
         'count': max_results
     }
-    response = requests.get(url, headers=headers, params=params)
+    response = (cache or requests).get(SCOPUS_SEARCH_URL, headers=scopus_headers(api_key), params=params)
     if response.status_code != 200:
         print(f"Error al acceder a la API de Scopus: {response.status_code}")
         return []
 
-    data = response.json()
-    articles = []
-    # Se extrae la información deseada de cada entrada del resultado
-    for entry in data.get('search-results', {}).get('entry', []):
-        title = entry.get('dc:title', 'Sin título')
-        # Se pueden extraer otros campos si se requiere
-        articles.append({"article_name": title})
-    return articles
+    return parse_scopus_articles(response.json())
+
+
+def iter_scopus_articles(query, api_key, page_size=25, max_results=None, url=SCOPUS_SEARCH_URL,
+                         session=None, timeout=30):
+    """
+    Generador que recorre todos los resultados de Scopus siguiendo la paginación
+    por cursor (cursor=* y luego cursor.@next) y produce un registro normalizado
+    a la vez, por lo que la memoria no crece con el número de resultados.
+
+    Mientras se consumen los registros de una página, la siguiente se solicita
+    en un hilo aparte. url permite apuntar a un endpoint local de pruebas.
+
+    :param page_size: Número de resultados por petición (count).
+    :param max_results: Límite total de registros; None recorre todos.
+    """
+    own_session = session is None
+    session = session or requests.Session()
+    headers = scopus_headers(api_key)
+
+    def fetch_page(cursor):
+        params = {'query': query, 'count': page_size, 'cursor': cursor}
+        return session.get(url, headers=headers, params=params, timeout=timeout)
+
+    produced = 0
+    cursor = '*'
+    executor = ThreadPoolExecutor(max_workers=1)
+    pending = executor.submit(fetch_page, cursor)
+    try:
+        while pending is not None:
+            response = pending.result()
+            pending = None
+            if response.status_code != 200:
+                print(f"Error al acceder a la API de Scopus: {response.status_code}")
+                return
+            results = response.json().get('search-results', {})
+            articles = parse_scopus_articles({'search-results': results})
+            next_cursor = results.get('cursor', {}).get('@next')
+            if max_results is not None:
+                articles = articles[:max_results - produced]
+            remaining = None if max_results is None else max_results - produced - len(articles)
+            if articles and next_cursor and next_cursor != cursor and (remaining is None or remaining > 0):
+                # Prefetch de la página siguiente antes de entregar la actual
+                cursor = next_cursor
+                pending = executor.submit(fetch_page, cursor)
+            for article in articles:
+                produced += 1
+                yield article
+    finally:
+        # Si el consumidor se detiene antes, la página pedida por adelantado se
+        # cancela o, si ya está en curso, se espera y se descarta
+        if pending is not None and not pending.cancel():
+            try:
+                pending.result()
+            except requests.RequestException:
+                pass
+        executor.shutdown()
+        if own_session:
+            session.close()
 
 
 if __name__ == '__main__':
@@ -0,0 +1,109 @@
+import argparse
+import os
+import tempfile
+import time
+
+from exports.export_data import export_stream
+from exports.import_data import iter_bibtex, iter_jsonl, iter_ris
+from sorting_algorithms.benchmark_sorting import generate_articles
+from sorting_algorithms.search import publication_year
+
+# Títulos con caracteres especiales de BibTeX y acentos para verificar los escapes
+_SPECIAL_TITLES = [
+    "Análisis de 100% de los casos & resultados",
+    "Costes en $ y #hashtags con snake_case",
+    "Conjuntos {A, B} y rutas C:\\datos\\articulos",
+    "Aproximación ~ 3^2 en ñandúes",
+]
+
+PARSERS = {
+    "jsonl": (iter_jsonl, "jsonl_path", ".jsonl"),
+    "ris": (iter_ris, "ris_path", ".ris"),
+    "bibtex": (iter_bibtex, "bibtex_path", ".bib"),
+}
+
+
+def sample_articles(n, seed=42):
+    articles = generate_articles(n, seed)
+    for i, article in enumerate(articles[:len(_SPECIAL_TITLES)]):
+        article["article_name"] = _SPECIAL_TITLES[i]
+    return articles
+
+
+def _comparable(article, fmt):
+    """
+    Campos que cada formato conserva: RIS y BibTeX solo guardan el año y
+    convierten el id en texto.
+    """
+    if fmt == "jsonl":
+        return {**article, "publication_date": str(article["publication_date"])}
+    return {
+        "id": article["id"],
+        "article_name": article["article_name"],
+        "author_name": article["author_name"],
+        "publication_date": str(publication_year(article["publication_date"])),
+        "theme": article["theme"],
+        "category": article["category"],
+    }
+
+
+def round_trip(articles, fmt, directory, compression=None):
+    """
+    Exporta los artículos con export_stream en el formato fmt, los vuelve a
+    leer con el parser correspondiente y compara registro a registro.
+    Retorna un diccionario con los tiempos, el tamaño y las diferencias.
+    """
+    parser, option, extension = PARSERS[fmt]
+    path = os.path.join(directory, f"round_trip{extension}")
+    if compression == "gzip":
+        path += ".gz"
+    elif compression == "zstd":
+        path += ".zst"
+    exported = export_stream(articles, **{option: path})
+
+    start = time.perf_counter()
+    parsed = list(parser(path))
+    elapsed = time.perf_counter() - start
+
+    mismatches = [(_comparable(original, fmt), imported)
+                  for original, imported in zip(articles, parsed)
+                  if _comparable(original, fmt) != imported]
+    size = os.path.getsize(path)
+    return {
+        "format": fmt,
+        "compression": compression,
+        "records": len(parsed),
+        "export_seconds": exported["seconds"],
+        "import_seconds": elapsed,
+        "records_per_second": len(parsed) / elapsed if elapsed else None,
+        "mb_per_second": size / elapsed / 1e6 if elapsed else None,
+        "bytes": size,
+        "round_trip_ok": len(parsed) == len(articles) and not mismatches,
+        "mismatches": mismatches[:5],
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Mide los parsers de exports.import_data y verifica la ida y vuelta con export_stream.")
+    parser.add_argument("--size", type=int, default=100000, help="Número de artículos sintéticos.")
+    parser.add_argument("--formats", nargs="+", choices=list(PARSERS), default=list(PARSERS))
+    parser.add_argument("--compression", choices=["gzip", "zstd"], default=None)
+    args = parser.parse_args(argv)
+
+    articles = sample_articles(args.size)
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        for fmt in args.formats:
+            result = round_trip(articles, fmt, directory, args.compression)
+            results.append(result)
+            print(f"{fmt:<7} {result['records']:>9} registros  import {result['import_seconds']:7.2f} s  "
+                  f"{result['records_per_second']:>10.0f} reg/s  {result['mb_per_second']:6.1f} MB/s  "
+                  f"ida y vuelta={'OK' if result['round_trip_ok'] else 'FALLA'}")
+            for expected, imported in result["mismatches"]:
+                print(f"  esperado: {expected}\n  leído:    {imported}")
+    return results
+
+
+if __name__ == '__main__':
+    main()
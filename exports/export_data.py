@@ -1,11 +1,206 @@
+import gzip
+import io
 import json
+import re
+import time
+from contextlib import ExitStack
+
+from sorting_algorithms.search import publication_year
+
+try:
+    import zstandard
+except ImportError:
+    # Sin zstandard solo está disponible la compresión gzip
+    zstandard = None
+
+COMPRESSIONS = ("gzip", "zstd")
+
+# Tamaño del buffer de escritura: cada formato acumula las entradas en memoria
+# y las escribe al disco en bloques grandes en lugar de varias llamadas por artículo
+BUFFER_SIZE = 1 << 20
+
+# Caracteres especiales de BibTeX/LaTeX y su forma escapada
+_BIBTEX_ESCAPES = {
+    "\\": r"\textbackslash{}",
+    "{": r"\{",
+    "}": r"\}",
+    "&": r"\&",
+    "%": r"\%",
+    "$": r"\$",
+    "#": r"\#",
+    "_": r"\_",
+    "~": r"\textasciitilde{}",
+    "^": r"\textasciicircum{}",
+}
+_BIBTEX_SPECIAL = re.compile(r"[\\{}&%$#_~^]")
+
+
+def _year(publication_date):
+    # Año como texto para los campos PY (RIS) y year (BibTeX)
+    year = publication_year(publication_date)
+    return str(year) if year is not None else ""
+
+
+def escape_bibtex(value):
+    value = str(value)
+    # La mayoría de los campos no tienen caracteres especiales: solo se
+    # reemplaza cuando la búsqueda (en C) encuentra alguno
+    if _BIBTEX_SPECIAL.search(value) is None:
+        return value
+    return _BIBTEX_SPECIAL.sub(lambda match: _BIBTEX_ESCAPES[match.group()], value)
+
+
+def _format_ris(item):
+    return (
+        "TY  - JOUR\n"
+        f"AU  - {item.get('author_name', '')}\n"
+        f"TI  - {item.get('article_name', '')}\n"
+        f"PY  - {_year(item.get('publication_date', ''))}\n"
+        f"ID  - {item.get('id', '')}\n"
+        f"KW  - {item.get('theme', '')}\n"
+        f"CT  - {item.get('category', '')}\n"
+        "ER  -\n\n"
+    )
+
+
+def _format_bibtex(item):
+    # Se usa el ID para generar la clave de la entrada
+    note = f"Temática: {item.get('theme', '')}; Categoría: {item.get('category', '')}"
+    return (
+        f"@article{{article{item.get('id', '')},\n"
+        f"  author = {{{escape_bibtex(item.get('author_name', ''))}}},\n"
+        f"  title = {{{escape_bibtex(item.get('article_name', ''))}}},\n"
+        f"  year = {{{_year(item.get('publication_date', ''))}}},\n"
+        f"  note = {{{escape_bibtex(note)}}}\n"
+        "}\n\n"
+    )
+
+
+_encoders = {}
+
+
+def _format_json(item, indent):
+    # Un codificador por sangría, en lugar de crear uno en cada json.dumps
+    encoder = _encoders.get(indent)
+    if encoder is None:
+        encoder = _encoders[indent] = json.JSONEncoder(ensure_ascii=False, indent=indent, default=str)
+    text = encoder.encode(item)
+    if indent:
+        # Misma sangría que json.dump de la lista completa
+        text = " " * indent + text.replace("\n", "\n" + " " * indent)
+    return text
+
+
+def compression_for(filename, compression=None):
+    """
+    Compresión de filename: la indicada en compression ('gzip' o 'zstd') o,
+    si es None, la que corresponde a su extensión (.gz, .zst); None si no
+    está comprimido.
+    """
+    if compression is None:
+        if filename.endswith(".gz"):
+            return "gzip"
+        if filename.endswith(".zst"):
+            return "zstd"
+        return None
+    if compression not in COMPRESSIONS:
+        raise ValueError(f"Compresión desconocida: {compression}; opciones: {COMPRESSIONS}")
+    return compression
+
+
+def open_output(filename, compression=None, buffer_size=BUFFER_SIZE):
+    """
+    Abre filename para escritura de texto UTF-8 con un buffer de buffer_size.
+    compression puede ser 'gzip', 'zstd' (requiere el paquete zstandard) o
+    None, en cuyo caso se deduce de la extensión (.gz, .zst).
+    """
+    compression = compression_for(filename, compression)
+    if compression is None:
+        return open(filename, "w", encoding="utf-8", buffering=buffer_size)
+    if compression == "gzip":
+        raw = gzip.open(filename, "wb", compresslevel=6)
+    else:
+        if zstandard is None:
+            raise ImportError("La compresión zstd requiere el paquete zstandard")
+        raw = zstandard.ZstdCompressor().stream_writer(open(filename, "wb"), closefd=True)
+    return io.TextIOWrapper(io.BufferedWriter(raw, buffer_size), encoding="utf-8")
+
+
+class _JSONArrayWriter:
+    """
+    Escribe un array JSON elemento a elemento, sin construir la lista en memoria.
+    """
+
+    def __init__(self, f, indent):
+        self.f = f
+        self.indent = indent
+        self.first = True
+
+    def write(self, item):
+        self.f.write(("[\n" if self.first else ",\n") + _format_json(item, self.indent))
+        self.first = False
+
+    def close(self):
+        self.f.write("[]" if self.first else "\n]")
+
+
+def export_stream(articles, json_path=None, jsonl_path=None, ris_path=None, bibtex_path=None,
+                  compression=None, json_indent=None, buffer_size=BUFFER_SIZE):
+    """
+    Exporta los artículos a todos los formatos indicados en una sola pasada.
+    articles puede ser cualquier iterable (por ejemplo MySQLDatabase.iter_articles
+    o un generador); cada artículo se formatea y se escribe en cuanto se lee,
+    por lo que la memoria usada no depende del número de artículos.
+
+    :param json_path: Array JSON con un artículo por línea; json_indent aplica
+                      la sangría de json.dump (más lento: json no usa su
+                      codificador en C cuando hay sangría).
+    :param jsonl_path: JSON Lines, un artículo por línea.
+    :param ris_path: Formato RIS.
+    :param bibtex_path: Formato BibTeX, con los caracteres especiales escapados.
+    :param compression: 'gzip', 'zstd' o None (se deduce de la extensión de cada archivo).
+    :return: Diccionario con el número de artículos, los segundos y los archivos escritos.
+    """
+    start = time.perf_counter()
+    count = 0
+    with ExitStack() as stack:
+        writers = []
+        if json_path:
+            array = _JSONArrayWriter(stack.enter_context(open_output(json_path, compression, buffer_size)),
+                                     json_indent)
+            stack.callback(array.close)
+            writers.append(array.write)
+        if jsonl_path:
+            f = stack.enter_context(open_output(jsonl_path, compression, buffer_size))
+            writers.append(lambda item, f=f: f.write(_format_json(item, None) + "\n"))
+        if ris_path:
+            f = stack.enter_context(open_output(ris_path, compression, buffer_size))
+            writers.append(lambda item, f=f: f.write(_format_ris(item)))
+        if bibtex_path:
+            f = stack.enter_context(open_output(bibtex_path, compression, buffer_size))
+            writers.append(lambda item, f=f: f.write(_format_bibtex(item)))
+
+        for item in articles:
+            for write in writers:
+                write(item)
+            count += 1
+
+    files = [path for path in (json_path, jsonl_path, ris_path, bibtex_path) if path]
+    return {"records": count, "seconds": time.perf_counter() - start, "files": files}
+
 
 def export_to_json(data, filename="exports/unified_data.json"):
     """
     Exporta los datos unificados a un archivo JSON.
     """
-    with open(filename, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=4)
+    export_stream(data, json_path=filename, json_indent=4)
+    print(f"Datos exportados a {filename}")
+
+def export_to_jsonl(data, filename="exports/unified_data.jsonl"):
+    """
+    Exporta los datos unificados a un archivo JSON Lines (un artículo por línea).
+    """
+    export_stream(data, jsonl_path=filename)
     print(f"Datos exportados a {filename}")
 
 def export_to_ris(data, filename="exports/unified_data.ris"):
@@ -21,19 +216,7 @@ def export_to_ris(data, filename="exports/unified_data.ris"):
       - KW  - Temática del artículo
       - CT  - Categoría del artículo
     """
-    with open(filename, "w", encoding="utf-8") as f:
-        for item in data:
-            f.write("TY  - JOUR\n")
-            f.write(f"AU  - {item.get('author_name','')}\n")
-            f.write(f"TI  - {item.get('article_name','')}\n")
-            # Se extrae el año de la fecha de publicación
-            publication_date = item.get('publication_date', '')
-            year = publication_date.split("-")[0] if publication_date else ""
-            f.write(f"PY  - {year}\n")
-            f.write(f"ID  - {item.get('id','')}\n")
-            f.write(f"KW  - {item.get('theme','')}\n")
-            f.write(f"CT  - {item.get('category','')}\n")
-            f.write("ER  -\n\n")
+    export_stream(data, ris_path=filename)
     print(f"Datos exportados a {filename}")
 
 def export_to_bibtex(data, filename="exports/unified_data.bib"):
@@ -46,19 +229,7 @@ def export_to_bibtex(data, filename="exports/unified_data.bib"):
       - year: Año de publicación (extraído de publication_date)
       - id: ID del artículo (utilizado como clave)
       - note: Se pueden incluir la temática y categoría
+    Los caracteres especiales de LaTeX ({, }, &, %, $, #, _, ~, ^, \\) se escapan.
     """
-    with open(filename, "w", encoding="utf-8") as f:
-        for item in data:
-            publication_date = item.get('publication_date', '')
-            year = publication_date.split("-")[0] if publication_date else ""
-            # Se usa el ID para generar la clave de la entrada
-            entry_key = f"article{item.get('id','')}"
-            f.write(f"@article{{{entry_key},\n")
-            f.write(f"  author = {{{item.get('author_name','')}}},\n")
-            f.write(f"  title = {{{item.get('article_name','')}}},\n")
-            f.write(f"  year = {{{year}}},\n")
-            f.write(f"  note = {{{'Temática: ' + item.get('theme','') + '; Categoría: ' + item.get('category','')}}}\n")
-            f.write("}\n\n")
+    export_stream(data, bibtex_path=filename)
     print(f"Datos exportados a {filename}")
-
-
@@ -0,0 +1,350 @@
+import gzip
+import io
+import json
+import unicodedata
+
+from exports.export_data import compression_for, zstandard
+
+# Categoría por tipo de referencia cuando el archivo no trae la etiqueta CT
+# (RIS) o la nota "Categoría: ..." (BibTeX); se usa el vocabulario de Scopus
+RIS_TYPES = {
+    "JOUR": "Article",
+    "EJOUR": "Article",
+    "CONF": "Conference Paper",
+    "CPAPER": "Conference Paper",
+    "CHAP": "Book Chapter",
+    "BOOK": "Book",
+    "THES": "Thesis",
+}
+BIBTEX_TYPES = {
+    "article": "Article",
+    "inproceedings": "Conference Paper",
+    "conference": "Conference Paper",
+    "incollection": "Book Chapter",
+    "inbook": "Book Chapter",
+    "book": "Book",
+    "phdthesis": "Thesis",
+    "mastersthesis": "Thesis",
+}
+
+# Etiquetas RIS equivalentes que usan las distintas editoriales
+_RIS_FIELDS = {
+    "TI": "title", "T1": "title",
+    "AU": "author", "A1": "author",
+    "PY": "year", "Y1": "year", "DA": "date",
+    "ID": "id",
+    "KW": "keyword",
+    "CT": "category",
+    "DO": "doi",
+}
+
+# Comandos de LaTeX que genera exports.export_data.escape_bibtex
+_LATEX_COMMANDS = {"textbackslash": "\\", "textasciitilde": "~", "textasciicircum": "^"}
+# Acentos de LaTeX ({\'e}, \"o, \~n, \c{c}) como caracteres combinantes
+_LATEX_ACCENTS = {"'": "\u0301", "`": "\u0300", '"': "\u0308", "^": "\u0302", "~": "\u0303",
+                  "=": "\u0304", ".": "\u0307", "c": "\u0327", "v": "\u030c", "u": "\u0306"}
+_SKIPPED_ENTRIES = {"comment", "string", "preamble"}
+
+
+def open_input(filename):
+    """
+    Abre filename para lectura de texto UTF-8, descomprimiendo .gz y .zst.
+    """
+    compression = compression_for(filename)
+    if compression is None:
+        return open(filename, "r", encoding="utf-8-sig")
+    if compression == "gzip":
+        return gzip.open(filename, "rt", encoding="utf-8-sig")
+    if zstandard is None:
+        raise ImportError("La compresión zstd requiere el paquete zstandard")
+    raw = zstandard.ZstdDecompressor().stream_reader(open(filename, "rb"), closefd=True)
+    return io.TextIOWrapper(io.BufferedReader(raw), encoding="utf-8-sig")
+
+
+def _lines(source):
+    # source puede ser un nombre de archivo o cualquier iterable de líneas
+    if isinstance(source, str):
+        with open_input(source) as f:
+            yield from f
+    else:
+        yield from source
+
+
+def _article_id(value):
+    # isdigit aceptaría caracteres como '²' que int() rechaza
+    value = value.strip()
+    return int(value) if value.isdecimal() else value
+
+
+def _date(value):
+    """
+    Normaliza las fechas RIS (2019, 2019/05/02/, 2019///) al formato
+    'AAAA-MM-DD' o 'AAAA' de las fuentes.
+    """
+    parts = [part for part in value.strip().replace("-", "/").split("/") if part.strip()]
+    return "-".join(part.strip() for part in parts[:3])
+
+
+def _article(article_id, title, authors, date, theme, category, doi):
+    article = {
+        "id": article_id,
+        "article_name": title,
+        "author_name": "; ".join(authors),
+        "publication_date": date,
+        "theme": theme,
+        "category": category,
+    }
+    if doi:
+        article["doi"] = doi
+    return article
+
+
+def iter_jsonl(source):
+    """
+    Generador de artículos de un archivo JSON Lines (exports.export_data.export_stream).
+    """
+    for line in _lines(source):
+        if line.strip():
+            yield json.loads(line)
+
+
+def _ris_article(fields):
+    year = fields.get("year", [""])[0]
+    date = fields.get("date", [""])[0]
+    keywords = fields.get("keyword", [])
+    category = fields.get("category", [""])[0] or RIS_TYPES.get(fields.get("type", [""])[0], "")
+    return _article(_article_id(fields.get("id", [""])[0]), fields.get("title", [""])[0],
+                    fields.get("author", []), _date(date or year), "; ".join(keywords), category,
+                    fields.get("doi", [""])[0])
+
+
+def iter_ris(source):
+    """
+    Generador de artículos de un archivo RIS, leído línea a línea. Cada línea
+    tiene la forma "XX  - valor"; las líneas sin etiqueta continúan el valor
+    anterior (las editoriales parten los títulos largos). Los autores (AU) y
+    las palabras clave (KW) repetidos se unen con "; ".
+
+    :param source: Nombre de archivo (.ris, .ris.gz, .ris.zst) o iterable de líneas.
+    """
+    fields = None
+    last = None
+    for line in _lines(source):
+        line = line.rstrip("\r\n")
+        if len(line) >= 5 and line[2:5] == "  -" and line[:2].isalnum() and line[:2].isupper():
+            tag, value = line[:2], line[6:].strip()
+            if tag == "TY":
+                fields = {"type": [value]}
+                last = None
+            elif fields is None:
+                continue
+            elif tag == "ER":
+                yield _ris_article(fields)
+                fields = None
+            else:
+                name = _RIS_FIELDS.get(tag)
+                last = None
+                if name is not None and value:
+                    values = fields.setdefault(name, [])
+                    values.append(value)
+                    last = values
+        elif last is not None and line.strip():
+            last[-1] = f"{last[-1]} {line.strip()}"
+    if fields is not None:
+        # Archivo truncado: se conserva el último registro sin ER
+        yield _ris_article(fields)
+
+
+def _unescape_latex(value):
+    """
+    Convierte un valor BibTeX a texto: quita las llaves de agrupación, deshace
+    los escapes de exports.export_data.escape_bibtex y los acentos de LaTeX.
+    """
+    if "\\" not in value and "{" not in value:
+        return " ".join(value.split())
+    out = []
+    i, n = 0, len(value)
+    while i < n:
+        char = value[i]
+        if char in "{}":
+            i += 1
+        elif char != "\\" or i + 1 == n:
+            out.append(char)
+            i += 1
+        else:
+            following = value[i + 1]
+            if following.isalpha():
+                end = i + 1
+                while end < n and value[end].isalpha():
+                    end += 1
+                command = value[i + 1:end]
+                if command in _LATEX_COMMANDS:
+                    out.append(_LATEX_COMMANDS[command])
+                    i = _skip_command_space(value, end)
+                elif len(command) == 1 and command in _LATEX_ACCENTS:
+                    i = _apply_accent(value, end, _LATEX_ACCENTS[command], out)
+                else:
+                    # Comando desconocido: se conserva su texto
+                    out.append(value[i:end])
+                    i = end
+            elif following in _LATEX_ACCENTS:
+                i = _apply_accent(value, i + 2, _LATEX_ACCENTS[following], out)
+            else:
+                out.append(following)
+                i += 2
+    return " ".join("".join(out).split())
+
+
+def _skip_command_space(value, i):
+    # Como en LaTeX, tras un comando con nombre ("\\i a", "\\textbackslash{}")
+    # los espacios o un par de llaves vacías solo lo terminan
+    if value.startswith("{}", i):
+        return i + 2
+    while i < len(value) and value[i] == " ":
+        i += 1
+    return i
+
+
+def _apply_accent(value, i, combining, out):
+    # La letra acentuada puede ir entre llaves (\'{e}) o directamente (\'e)
+    while i < len(value) and value[i] == " ":
+        i += 1
+    if value.startswith("{", i):
+        end = value.find("}", i)
+        if end < 0:
+            end = len(value)
+        letter, i = value[i + 1:end].lstrip("\\"), end + 1
+    elif value.startswith(("\\i", "\\j"), i):
+        # i y j sin punto: \'\i
+        letter, i = value[i + 1], _skip_command_space(value, i + 2)
+    else:
+        letter, i = value[i:i + 1], i + 1
+    out.append(unicodedata.normalize("NFC", letter + combining) if letter else "")
+    return i
+
+
+def _next_delimiter(text, i, delimiters):
+    # Posición del siguiente delimitador; str.find recorre el texto en C
+    positions = [position for position in (text.find(char, i) for char in delimiters) if position >= 0]
+    return min(positions) if positions else -1
+
+
+def _scan_value(text, i):
+    """
+    Recorre un valor delimitado por llaves o comillas que empieza en text[i].
+    Retorna el contenido y la posición tras el delimitador de cierre. Salta de
+    un delimitador al siguiente en lugar de recorrer cada carácter; las llaves
+    escapadas (\\{) no cuentan para la profundidad.
+    """
+    quoted = text[i] == '"'
+    delimiters = '{}"\\' if quoted else "{}\\"
+    depth = 0 if quoted else 1
+    start = i = i + 1
+    while True:
+        i = _next_delimiter(text, i, delimiters)
+        if i < 0:
+            return text[start:], len(text)
+        char = text[i]
+        if char == "\\":
+            i += 2
+            continue
+        if char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0 and not quoted:
+                return text[start:i], i + 1
+        elif depth == 0:
+            return text[start:i], i + 1
+        i += 1
+
+
+def _parse_bibtex_entry(text):
+    """
+    Retorna (tipo, clave, campos) de una entrada "@tipo{clave, campo = valor, ...}".
+    """
+    open_at = text.find("{")
+    if open_at < 0:
+        return None
+    entry_type = text[1:open_at].strip().lower()
+    comma = text.find(",", open_at)
+    if comma < 0:
+        return entry_type, text[open_at + 1:].strip(" \t\r\n}"), {}
+    key = text[open_at + 1:comma].strip()
+    fields = {}
+    i, n = comma + 1, len(text)
+    while i < n:
+        equals = text.find("=", i)
+        if equals < 0:
+            break
+        name = text[i:equals].strip(" \t\r\n,").lower()
+        i = equals + 1
+        while i < n and text[i] in " \t\r\n":
+            i += 1
+        if i >= n:
+            break
+        if text[i] in '{"':
+            value, i = _scan_value(text, i)
+        else:
+            # Número o macro (@string) sin delimitadores
+            end = i
+            while end < n and text[end] not in ",}\r\n":
+                end += 1
+            value, i = text[i:end].strip(), end
+        fields[name] = _unescape_latex(value)
+        comma = text.find(",", i)
+        if comma < 0:
+            break
+        i = comma + 1
+    return entry_type, key, fields
+
+
+def _bibtex_article(entry_type, key, fields):
+    theme = fields.get("keywords", "")
+    category = BIBTEX_TYPES.get(entry_type, "")
+    note = fields.get("note", "")
+    # Nota generada por exports.export_data: "Temática: X; Categoría: Y"
+    if note.startswith("Temática:") and "; Categoría:" in note:
+        note_theme, _, note_category = note[len("Temática:"):].partition("; Categoría:")
+        theme, category = note_theme.strip(), note_category.strip()
+    article_id = key[len("article"):] if key.startswith("article") else key
+    authors = [author.strip() for author in fields.get("author", "").replace(" and ", "; ").split("; ")]
+    date = fields.get("date") or fields.get("year", "")
+    return _article(_article_id(article_id), fields.get("title", ""), [a for a in authors if a],
+                    _date(date), theme, category, fields.get("doi", ""))
+
+
+def iter_bibtex(source):
+    """
+    Generador de artículos de un archivo BibTeX. Las líneas se acumulan desde
+    la "@" de cada entrada hasta que la profundidad de llaves vuelve a cero,
+    y la entrada se recorre con un escáner de llaves (sin expresiones
+    regulares), por lo que el coste es lineal en el tamaño del archivo.
+    Se omiten @comment, @string y @preamble.
+
+    :param source: Nombre de archivo (.bib, .bib.gz, .bib.zst) o iterable de líneas.
+    """
+    buffer = []
+    depth = 0
+    for line in _lines(source):
+        if not buffer:
+            start = line.find("@")
+            if start < 0:
+                continue
+            line = line[start:]
+        buffer.append(line)
+        depth += line.count("{") - line.count("}")
+        if "\\" in line:
+            # Las llaves escapadas (\{ y \}) no cambian la profundidad
+            depth += line.count("\\}") - line.count("\\{")
+        if depth > 0 or "{" not in buffer[0] and len(buffer) == 1:
+            continue
+        entry = _parse_bibtex_entry("".join(buffer))
+        buffer = []
+        depth = 0
+        if entry is not None and entry[0] not in _SKIPPED_ENTRIES:
+            yield _bibtex_article(*entry)
+    if buffer:
+        entry = _parse_bibtex_entry("".join(buffer))
+        if entry is not None and entry[0] not in _SKIPPED_ENTRIES:
+            yield _bibtex_article(*entry)
@@ -0,0 +1,637 @@
+import argparse
+import asyncio
+import cProfile
+import datetime
+import hashlib
+import json
+import os
+import queue
+import resource
+import sys
+import threading
+import time
+import tracemalloc
+
+from data_sources.dedup import Deduplicator, normalize_title
+from data_sources.extraction import SELECTORS, extract_articles
+from data_sources.scopus_api import parse_scopus_articles
+from exports.export_data import export_stream
+from exports.import_data import iter_bibtex, iter_jsonl, iter_ris
+from models.article_table import ArticleTable
+from sorting_algorithms.search import publication_date, publication_year
+from views.statistics import BibliometricStats
+
+# Marca de fin de flujo entre etapas
+_DONE = object()
+
+
+class Stage:
+    """
+    Etapa del pipeline que corre en su propio hilo. Recibe lotes de artículos
+    de la cola de la etapa anterior y envía lotes a su cola de salida, acotada
+    a queue_size lotes: si la etapa siguiente es más lenta, esta se bloquea
+    (contrapresión) en lugar de acumular datos en memoria.
+
+    process(batches, emit) recibe un iterador de lotes (None en la primera
+    etapa) y llama a emit(lote) para enviar cada lote; lo que retorne se
+    guarda en el informe.
+
+    Mide el tiempo total, el tiempo esperando entrada y bloqueado en la salida,
+    los registros por segundo y la profundidad de su cola de entrada. Con
+    profile_dir guarda un perfil cProfile de la etapa y con tracemalloc_dir una
+    instantánea de tracemalloc al terminar. Con tracemalloc activo se guardan
+    además la memoria del proceso al terminar la etapa y el pico del proceso
+    desde que empezó su grupo de etapas concurrentes (group_traced_peak_bytes):
+    tracemalloc no distingue entre hilos, por lo que no hay un pico por etapa.
+    """
+
+    def __init__(self, name, process, queue_size=8):
+        self.name = name
+        self.process = process
+        self.outbox = queue.Queue(queue_size)
+        self.result = None
+        self.error = None
+        self.thread = None
+        self.metrics = {
+            "records_in": 0, "records_out": 0, "batches_in": 0, "batches_out": 0,
+            "seconds": 0.0, "wait_input_seconds": 0.0, "wait_output_seconds": 0.0,
+            "max_queue_depth": 0, "mean_queue_depth": 0.0,
+        }
+        self._depth_total = 0
+
+    def _input(self, inbox):
+        metrics = self.metrics
+        while True:
+            depth = inbox.qsize()
+            metrics["max_queue_depth"] = max(metrics["max_queue_depth"], depth)
+            self._depth_total += depth
+            start = time.perf_counter()
+            batch = inbox.get()
+            metrics["wait_input_seconds"] += time.perf_counter() - start
+            if batch is _DONE:
+                return
+            metrics["batches_in"] += 1
+            metrics["records_in"] += len(batch)
+            yield batch
+
+    def _emit(self, batch):
+        if not batch and not getattr(batch, "deleted", None):
+            return
+        start = time.perf_counter()
+        self.outbox.put(batch)
+        self.metrics["wait_output_seconds"] += time.perf_counter() - start
+        self.metrics["batches_out"] += 1
+        self.metrics["records_out"] += len(batch)
+
+    def run(self, inbox=None, profile_dir=None, tracemalloc_dir=None):
+        profiler = cProfile.Profile() if profile_dir else None
+        start = time.perf_counter()
+        try:
+            if profiler:
+                profiler.enable()
+            self.result = self.process(self._input(inbox) if inbox is not None else None, self._emit)
+        except Exception as error:
+            self.error = f"{type(error).__name__}: {error}"
+            # Se vacía la entrada para que la etapa anterior no quede bloqueada
+            if inbox is not None:
+                for _ in self._input(inbox):
+                    pass
+        finally:
+            if profiler:
+                profiler.disable()
+                profiler.dump_stats(os.path.join(profile_dir, f"{self.name}.prof"))
+            self.outbox.put(_DONE)
+            self._finish(start, tracemalloc_dir)
+
+    def _finish(self, start, tracemalloc_dir):
+        metrics = self.metrics
+        metrics["seconds"] = time.perf_counter() - start
+        metrics["busy_seconds"] = max(
+            metrics["seconds"] - metrics["wait_input_seconds"] - metrics["wait_output_seconds"], 0.0)
+        records = max(metrics["records_in"], metrics["records_out"])
+        metrics["records_per_second"] = records / metrics["seconds"] if metrics["seconds"] else None
+        metrics["busy_records_per_second"] = records / metrics["busy_seconds"] if metrics["busy_seconds"] else None
+        polls = metrics["batches_in"] + 1
+        metrics["mean_queue_depth"] = self._depth_total / polls
+        if tracemalloc.is_tracing():
+            # La memoria es del proceso completo: las etapas comparten el heap y
+            # las de un mismo grupo corren a la vez, así que el pico es el del
+            # proceso desde que empezó el grupo (ver Pipeline._reset_peak)
+            current, peak = tracemalloc.get_traced_memory()
+            metrics["traced_memory_bytes"] = current
+            metrics["group_traced_peak_bytes"] = peak
+            if tracemalloc_dir:
+                tracemalloc.take_snapshot().dump(os.path.join(tracemalloc_dir, f"{self.name}.tracemalloc"))
+
+    def start(self, inbox=None, **options):
+        self.thread = threading.Thread(target=self.run, args=(inbox,), kwargs=options, name=f"stage-{self.name}",
+                                       daemon=True)
+        self.thread.start()
+        return self.outbox
+
+    def report(self):
+        return {"name": self.name, **self.metrics, "error": self.error, "result": self.result}
+
+
+class ArticleBatch(list):
+    """
+    Lote de la etapa de deduplicación: los artículos a insertar o actualizar
+    y, en deleted, los ids de los artículos ya enviados que el deduplicador
+    unió después a otro y deben eliminarse.
+    """
+
+    def __init__(self, articles=(), deleted=()):
+        super().__init__(articles)
+        self.deleted = list(deleted)
+
+
+def _batched(records, batch_size):
+    batch = []
+    for record in records:
+        batch.append(record)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _tag_source(records, source):
+    for record in records:
+        if not record.get("source"):
+            record["source"] = source
+        yield record
+
+
+def iter_fixtures(directory):
+    """
+    Artículos de las páginas y exportaciones guardadas en directory, sin red:
+      - .html/.htm: páginas de resultados de ACM, SAGE o ScienceDirect (el
+        nombre debe empezar por acm, sage o sciencedirect);
+      - .json: respuestas de la API de Scopus, o listas de artículos;
+      - .jsonl, .ris, .bib (también .gz / .zst): exportaciones e importaciones.
+    La fuente de cada artículo es la del nombre del archivo si no trae una.
+    """
+    for name in sorted(os.listdir(directory)):
+        path = os.path.join(directory, name)
+        lower = name.lower()
+        base = lower.split(".")[0]
+        source = next((source for source in SELECTORS if lower.startswith(source)), base)
+        if lower.endswith((".html", ".htm")):
+            with open(path, "rb") as f:
+                yield from _tag_source(extract_articles(f.read(), source), source)
+        elif lower.endswith(".json"):
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            if isinstance(data, dict):
+                yield from _tag_source(parse_scopus_articles(data), "scopus")
+            else:
+                yield from _tag_source(data, source)
+        elif ".jsonl" in lower:
+            yield from _tag_source(iter_jsonl(path), source)
+        elif ".ris" in lower:
+            yield from _tag_source(iter_ris(path), source)
+        elif ".bib" in lower:
+            yield from _tag_source(iter_bibtex(path), source)
+
+
+def iter_synthetic(n, seed=7):
+    """
+    n artículos sintéticos de varias fuentes con duplicados ruidosos (los de
+    data_sources.benchmark_dedup), con temática y categoría por artículo.
+    """
+    from data_sources.benchmark_dedup import generate_noisy_articles
+    from sorting_algorithms.benchmark_sorting import generate_articles
+
+    records, labels = generate_noisy_articles(n, seed=seed)
+    base = generate_articles(max(labels) + 1 if labels else 0, seed)
+    for record, label in zip(records, labels):
+        record["theme"] = base[label]["theme"]
+        record["category"] = base[label]["category"]
+        yield record
+
+
+def iter_online(query, scopus_api_key=None, sources=None, max_results=25, cache_path=None):
+    """
+    Artículos de las fuentes en línea con ArticleCollector. El bucle de asyncio
+    corre dentro del hilo de la etapa y cada fuente se entrega en cuanto responde.
+    """
+    from data_sources.collector import ArticleCollector
+    from data_sources.http_cache import HTTPCache
+
+    cache = HTTPCache(cache_path) if cache_path else None
+    collector = ArticleCollector(cache=cache)
+    loop = asyncio.new_event_loop()
+    stream = collector.stream(query, scopus_api_key, sources, max_results)
+    try:
+        while True:
+            try:
+                _, articles, _ = loop.run_until_complete(stream.__anext__())
+            except StopAsyncIteration:
+                break
+            yield from articles
+    finally:
+        loop.run_until_complete(stream.aclose())
+        loop.close()
+        collector.close()
+        if cache is not None:
+            cache.close()
+
+
+def _normalize_date(record):
+    # Fecha de publicación en ISO 'AAAA-MM-DD' (la columna DATE de MySQL no
+    # admite 'June 2020'), o vacía si no se puede interpretar; retorna False
+    # si había un texto que no se pudo interpretar
+    value = record.get("publication_date")
+    date = publication_date(value)
+    record["publication_date"] = date.isoformat() if date is not None else ""
+    return date is not None or not str(value or "").strip()
+
+
+def article_id(record, salt=0):
+    """
+    Id estable para los artículos que no traen uno entero (los de los
+    scrapers): 63 bits de un hash del título normalizado y el año, para que la
+    columna BIGINT de MySQL lo admita y repetir la ejecución actualice las
+    mismas filas. salt > 0 da ids alternativos para resolver colisiones (ver
+    IdRegistry).
+    """
+    key = f"{normalize_title(record.get('article_name'))}|{publication_year(record.get('publication_date')) or ''}"
+    if salt:
+        key += f"|{salt}"
+    return int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "big") >> 1
+
+
+class IdRegistry:
+    """
+    Ids de los artículos únicos de una ejecución. Cada artículo nuevo que sale
+    del deduplicador es distinto de los anteriores, así que un id repetido es
+    una colisión: la de un id hash (dos artículos con el mismo título y año que
+    el deduplicador separó por sus autores, o un choque del hash) se resuelve
+    con article_id(record, salt) para salt = 1, 2, ...; la de un id propio de
+    la fuente no se cambia y solo se cuenta. collisions lleva ambos casos.
+    """
+
+    def __init__(self):
+        self.used = set()
+        self.collisions = 0
+
+    def assign(self, record):
+        if record["id"] in self.used:
+            self.collisions += 1
+            if record["id"] == article_id(record):
+                salt = 1
+                while article_id(record, salt) in self.used:
+                    salt += 1
+                record["id"] = article_id(record, salt)
+        self.used.add(record["id"])
+        return record["id"]
+
+
+class MemoryStore:
+    """
+    Almacén en memoria para el modo sin conexión: los artículos se guardan en
+    un diccionario por id (en lugar de MySQL y Redis) y se ordenan con un
+    ArticleTable, con la misma interfaz que usa el pipeline de
+    ArticleRepository.
+    """
+
+    def __init__(self):
+        self.articles = {}
+
+    def __len__(self):
+        return len(self.articles)
+
+    def insert_many(self, articles, batch_size=1000):
+        rows = 0
+        for article in articles:
+            self.articles[article["id"]] = article
+            rows += 1
+        return {"rows": rows, "failed": 0}
+
+    def delete_many(self, article_ids):
+        return sum(self.articles.pop(article_id, None) is not None for article_id in article_ids)
+
+    def iter_articles(self):
+        return iter(list(self.articles.values()))
+
+    def sorted(self, field, algorithm="tim_sort", search_value=None, limit=None):
+        # La tabla solo calcula la permutación: se emiten los diccionarios
+        # originales, con todos sus campos (sources, duplicate_ids...)
+        articles = list(self.articles.values())
+        order = ArticleTable(articles).argsort(field, algorithm, search_value)
+        return (articles[index] for index in (order[:limit] if limit is not None else order))
+
+    def close(self):
+        pass
+
+
+class DatabaseStore:
+    """
+    Almacén real: MySQL con Redis delante mediante ArticleRepository. Lleva los
+    ids de los artículos de la ejecución para recorrerlos al final.
+    """
+
+    def __init__(self, mysql_options, redis_options):
+        from controllers.article_controller import ArticleRepository
+        from models.mysql_model import MySQLDatabase
+        from models.redis_model import RedisDatabase
+
+        self.mysql_db = MySQLDatabase(**mysql_options)
+        self.repository = ArticleRepository(self.mysql_db, RedisDatabase(**redis_options))
+        self.ids = {}
+
+    def __len__(self):
+        return len(self.ids)
+
+    def insert_many(self, articles, batch_size=1000):
+        articles = list(articles)
+        self.ids.update(dict.fromkeys(article["id"] for article in articles))
+        return self.repository.insert_many(articles, batch_size=batch_size)
+
+    def delete_many(self, article_ids):
+        article_ids = list(article_ids)
+        for article_id in article_ids:
+            self.ids.pop(article_id, None)
+        return self.repository.delete_many(article_ids)
+
+    def iter_articles(self, chunk_size=1000):
+        ids = list(self.ids)
+        for start in range(0, len(ids), chunk_size):
+            for article in self.repository.get_many(ids[start:start + chunk_size]):
+                if article is not None:
+                    yield article
+
+    def sorted(self, field, algorithm="tim_sort", search_value=None, limit=None):
+        return self.repository.sorted(field, algorithm=algorithm, search_value=search_value, limit=limit)
+
+    def close(self):
+        self.mysql_db.close()
+
+
+class Pipeline:
+    """
+    Pipeline completo: obtener -> deduplicar/normalizar -> almacenar corren a
+    la vez, conectadas por colas acotadas. El deduplicador puede unir después
+    grupos que ya envió, así que cada lote lleva también los artículos
+    actualizados y los ids absorbidos, que el almacén actualiza y elimina
+    (ArticleBatch). Al terminar el flujo el almacén tiene solo los artículos
+    finales: se exportan, se calculan las estadísticas y se ordena a la vez,
+    y después se generan los gráficos. run() retorna el informe de la ejecución.
+    """
+
+    def __init__(self, source, store, output_dir, batch_size=500, queue_size=8, sort_field="publication_date",
+                 algorithm="tim_sort", search_value=None, sort_limit=None, compression=None,
+                 visualize=True, figure_formats=("png",), profile=False, trace_memory=False):
+        self.source = source
+        self.store = store
+        self.output_dir = output_dir
+        self.batch_size = batch_size
+        self.queue_size = queue_size
+        self.sort_field = sort_field
+        self.algorithm = algorithm
+        self.search_value = search_value
+        self.sort_limit = sort_limit
+        self.compression = compression
+        self.visualize = visualize
+        self.figure_formats = figure_formats
+        self.profile_dir = os.path.join(output_dir, "profiles") if profile else None
+        self.tracemalloc_dir = os.path.join(output_dir, "tracemalloc") if trace_memory else None
+        self.trace_memory = trace_memory
+        self.deduplicator = Deduplicator(batch_size=batch_size)
+        self.ids = IdRegistry()
+        self.stats = BibliometricStats()
+
+    def _path(self, name):
+        suffix = {"gzip": ".gz", "zstd": ".zst"}.get(self.compression, "")
+        return os.path.join(self.output_dir, name + suffix)
+
+    # Etapas en flujo
+
+    def _fetch(self, _, emit):
+        for batch in _batched(self.source, self.batch_size):
+            emit(batch)
+
+    def _dedup(self, batches, emit):
+        unparsed_dates = 0
+        for batch in batches:
+            for record in batch:
+                if not _normalize_date(record):
+                    unparsed_dates += 1
+                if not isinstance(record.get("id"), int):
+                    record["id"] = article_id(record)
+            articles = ArticleBatch(self.deduplicator.add_batch(batch))
+            for article in articles:
+                self.ids.assign(article)
+            updated, absorbed = self.deduplicator.pop_changes()
+            articles.extend(updated)
+            kept = {article["id"] for article in articles}
+            articles.deleted = [record["id"] for record, _ in absorbed if record["id"] not in kept]
+            emit(articles)
+        return {**self.deduplicator.stats, "id_collisions": self.ids.collisions, "unparsed_dates": unparsed_dates}
+
+    def _store(self, batches, emit):
+        result = {"rows": 0, "failed": 0, "deleted": 0}
+        for batch in batches:
+            if batch:
+                stats = self.store.insert_many(batch, batch_size=self.batch_size)
+                result["rows"] += stats["rows"]
+                result["failed"] += stats["failed"]
+            if batch.deleted:
+                result["deleted"] += self.store.delete_many(batch.deleted)
+        result["articles"] = len(self.store)
+        return result
+
+    # Etapas al final del flujo, sobre los artículos finales del almacén
+
+    def _export(self, _, emit):
+        return export_stream(_batched_emit(self.store.iter_articles(), self.batch_size, emit),
+                             jsonl_path=self._path("articles.jsonl"), ris_path=self._path("articles.ris"),
+                             bibtex_path=self._path("articles.bib"), compression=self.compression)
+
+    def _analyze(self, _, emit):
+        for batch in _batched(self.store.iter_articles(), self.batch_size):
+            self.stats.update(batch)
+            emit(batch)
+        return {"articles": self.stats.total}
+
+    def _sort(self, _, emit):
+        articles = self.store.sorted(self.sort_field, self.algorithm, self.search_value, self.sort_limit)
+        path = self._path(f"sorted_{self.sort_field}.jsonl")
+        result = export_stream(_batched_emit(articles, self.batch_size, emit), jsonl_path=path,
+                               compression=self.compression)
+        return {"field": self.sort_field, "algorithm": self.algorithm, **result}
+
+    def _visualize(self, _, emit):
+        from views.visualization import render_statistics
+
+        return {"figures": render_statistics(self.stats, os.path.join(self.output_dir, "figures"),
+                                             formats=self.figure_formats)}
+
+    def _reset_peak(self):
+        # El pico de tracemalloc se reinicia al empezar cada grupo de etapas
+        # concurrentes; el de la ejecución completa es el máximo de los grupos
+        if self.trace_memory:
+            self.traced_peak = max(self.traced_peak, tracemalloc.get_traced_memory()[1])
+            tracemalloc.reset_peak()
+
+    @staticmethod
+    def _run_concurrently(stages, options):
+        # Etapas sin entrada: cada una en su hilo, descartando su salida
+        for stage in stages:
+            stage.start(None, **options)
+        for stage in stages:
+            while stage.outbox.get() is not _DONE:
+                pass
+            stage.thread.join()
+
+    def run(self):
+        for directory in (self.output_dir, self.profile_dir, self.tracemalloc_dir):
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+        if self.trace_memory:
+            tracemalloc.start()
+            self.traced_peak = 0
+        options = {"profile_dir": self.profile_dir, "tracemalloc_dir": self.tracemalloc_dir}
+        started = datetime.datetime.now().isoformat(timespec="seconds")
+        start = time.perf_counter()
+
+        streaming = [Stage("fetch", self._fetch, self.queue_size), Stage("dedup", self._dedup, self.queue_size),
+                     Stage("store", self._store, self.queue_size)]
+        self._reset_peak()
+        inbox = None
+        for stage in streaming:
+            inbox = stage.start(inbox, **options)
+        # La salida de la última etapa se descarta a medida que llega
+        while inbox.get() is not _DONE:
+            pass
+        for stage in streaming:
+            stage.thread.join()
+
+        final = [Stage("export", self._export, self.queue_size), Stage("analyze", self._analyze, self.queue_size),
+                 Stage("sort", self._sort, self.queue_size)]
+        self._reset_peak()
+        self._run_concurrently(final, options)
+        if self.visualize:
+            visualize = Stage("visualize", self._visualize, self.queue_size)
+            self._reset_peak()
+            self._run_concurrently([visualize], options)
+            final.append(visualize)
+
+        stages = streaming + final
+        report = {
+            "started": started,
+            "seconds": time.perf_counter() - start,
+            "config": {
+                "store": type(self.store).__name__, "batch_size": self.batch_size, "queue_size": self.queue_size,
+                "sort_field": self.sort_field, "algorithm": self.algorithm, "search_value": self.search_value,
+                "sort_limit": self.sort_limit, "compression": self.compression,
+                "profile_dir": self.profile_dir, "tracemalloc_dir": self.tracemalloc_dir,
+            },
+            "records_fetched": streaming[0].metrics["records_out"],
+            "records_unique": len(self.store),
+            "id_collisions": self.ids.collisions,
+            "stages": [stage.report() for stage in stages],
+            "max_rss_bytes": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * (1 if sys.platform == "darwin" else 1024),
+            "errors": [f"{stage.name}: {stage.error}" for stage in stages if stage.error],
+        }
+        report["records_per_second"] = report["records_fetched"] / report["seconds"] if report["seconds"] else None
+        if self.trace_memory:
+            self._reset_peak()
+            report["traced_peak_bytes"] = self.traced_peak
+            tracemalloc.stop()
+        with open(os.path.join(self.output_dir, "run_report.json"), "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2, default=str)
+        return report
+
+
+def _batched_emit(articles, batch_size, emit):
+    # Pasa los artículos a export_stream y los envía por lotes a la cola de la etapa
+    batch = []
+    for article in articles:
+        yield article
+        batch.append(article)
+        if len(batch) >= batch_size:
+            emit(batch)
+            batch = []
+    emit(batch)
+
+
+def print_report(report):
+    print(f"{'etapa':<10} {'entrada':>9} {'salida':>9} {'seg':>8} {'ocupado':>8} {'reg/s':>10} "
+          f"{'cola máx':>8}  error")
+    for stage in report["stages"]:
+        rate = stage["records_per_second"]
+        print(f"{stage['name']:<10} {stage['records_in']:>9} {stage['records_out']:>9} {stage['seconds']:>8.2f} "
+              f"{stage['busy_seconds']:>8.2f} {rate if rate is not None else 0:>10.0f} "
+              f"{stage['max_queue_depth']:>8}  {stage['error'] or ''}")
+    print(f"{report['records_fetched']} artículos obtenidos, {report['records_unique']} únicos, "
+          f"{report['seconds']:.2f} s ({report['records_per_second'] or 0:.0f} reg/s), "
+          f"memoria máxima {report['max_rss_bytes'] / 2 ** 20:.0f} MiB")
+    if report["id_collisions"]:
+        print(f"Aviso: {report['id_collisions']} colisiones de id (ver IdRegistry)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Pipeline de bibliometría: obtener, deduplicar, almacenar, ordenar, exportar y visualizar.")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--fixtures", help="Directorio con páginas y exportaciones guardadas (sin red ni bases de datos).")
+    mode.add_argument("--synthetic", type=int, help="Número de artículos sintéticos (sin red ni bases de datos).")
+    parser.add_argument("--query", default="computational thinking", help="Consulta para las fuentes en línea.")
+    parser.add_argument("--scopus-api-key", default=os.environ.get("SCOPUS_API_KEY"))
+    parser.add_argument("--sources", nargs="+", help="Fuentes en línea a consultar (por defecto todas).")
+    parser.add_argument("--http-cache", help="Ruta de la caché HTTP en disco para el modo en línea.")
+    parser.add_argument("--memory-store", action="store_true",
+                        help="Usa el almacén en memoria también en el modo en línea.")
+    parser.add_argument("--mysql-host", default="localhost")
+    parser.add_argument("--mysql-user", default="root")
+    parser.add_argument("--mysql-password", default=os.environ.get("MYSQL_PASSWORD", ""))
+    parser.add_argument("--mysql-database", default="bibliometria")
+    parser.add_argument("--redis-host", default="localhost")
+    parser.add_argument("--redis-port", type=int, default=6379)
+    parser.add_argument("--output-dir", default=os.path.join("runs", datetime.datetime.now().strftime("%Y%m%d-%H%M%S")))
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--queue-size", type=int, default=8, help="Lotes como máximo en cada cola entre etapas.")
+    parser.add_argument("--sort-field", default="publication_date")
+    parser.add_argument("--algorithm", default="tim_sort")
+    parser.add_argument("--search", help="search_value para el ordenamiento.")
+    parser.add_argument("--sort-limit", type=int)
+    parser.add_argument("--compression", choices=["gzip", "zstd"])
+    parser.add_argument("--no-visualize", action="store_true")
+    parser.add_argument("--figure-formats", nargs="+", default=["png"], choices=["png", "svg"])
+    parser.add_argument("--profile", action="store_true", help="Guarda un perfil cProfile por etapa.")
+    parser.add_argument("--tracemalloc", action="store_true",
+                        help="Mide la memoria con tracemalloc y guarda una instantánea por etapa.")
+    args = parser.parse_args(argv)
+
+    offline = args.fixtures is not None or args.synthetic is not None
+    if args.fixtures is not None:
+        source = iter_fixtures(args.fixtures)
+    elif args.synthetic is not None:
+        source = iter_synthetic(args.synthetic)
+    else:
+        source = iter_online(args.query, args.scopus_api_key, args.sources, cache_path=args.http_cache)
+    if offline or args.memory_store:
+        store = MemoryStore()
+    else:
+        store = DatabaseStore(
+            {"host": args.mysql_host, "user": args.mysql_user, "password": args.mysql_password,
+             "database": args.mysql_database},
+            {"host": args.redis_host, "port": args.redis_port})
+
+    pipeline = Pipeline(source, store, args.output_dir, batch_size=args.batch_size, queue_size=args.queue_size,
+                        sort_field=args.sort_field, algorithm=args.algorithm, search_value=args.search,
+                        sort_limit=args.sort_limit, compression=args.compression, visualize=not args.no_visualize,
+                        figure_formats=args.figure_formats, profile=args.profile, trace_memory=args.tracemalloc)
+    try:
+        report = pipeline.run()
+    finally:
+        store.close()
+    print_report(report)
+    print(f"Informe: {os.path.join(args.output_dir, 'run_report.json')}")
+    return 1 if report["errors"] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
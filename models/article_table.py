@@ -0,0 +1,417 @@
+import datetime
+import json
+import mmap
+import sys
+from array import array
+from collections.abc import Mapping
+
+from sorting_algorithms.search import SearchQuery, publication_date
+from sorting_algorithms.sorting import SortingAlgorithms
+
+# Campos que guarda la tabla y cómo se almacena cada uno:
+#   key   -> int64 (o texto si algún id no es entero)
+#   text  -> bytes UTF-8 concatenados más un arreglo de desplazamientos
+#   dict  -> códigos int32 sobre un diccionario de valores distintos
+#   date  -> ordinal int32 (0 = sin fecha)
+ARTICLE_FIELDS = {
+    "id": "key",
+    "article_name": "text",
+    "author_name": "dict",
+    "publication_date": "date",
+    "theme": "dict",
+    "category": "dict",
+    "doi": "text",
+    "source": "dict",
+}
+
+_MAGIC = b"ARTTABLE"
+_MISSING_ID = -(1 << 63)
+
+
+def _to_ordinal(value):
+    """
+    Ordinal de una fecha en cualquiera de los formatos de publication_date
+    ('AAAA-MM-DD', 'AAAA', 'June 2020'...); 0 si no hay fecha o no se puede
+    interpretar.
+    """
+    date = publication_date(value)
+    return date.toordinal() if date is not None else 0
+
+
+class _KeyColumn:
+    def __init__(self, data=None):
+        self.data = array("q") if data is None else data
+
+    def append(self, value):
+        self.data.append(_MISSING_ID if value is None else value)
+
+    def get(self, i):
+        value = self.data[i]
+        return None if value == _MISSING_ID else value
+
+    def sort_keys(self):
+        return self.data.tolist()
+
+    def buffers(self):
+        return {"data": self.data}
+
+
+class _DateColumn:
+    def __init__(self, data=None, unparsed=0):
+        self.data = array("i") if data is None else data
+        # Fechas no vacías que no se pudieron interpretar (guardadas como 0)
+        self.unparsed = unparsed
+
+    def append(self, value):
+        ordinal = _to_ordinal(value)
+        if not ordinal and str(value or "").strip():
+            self.unparsed += 1
+        self.data.append(ordinal)
+
+    def get(self, i):
+        ordinal = self.data[i]
+        return datetime.date.fromordinal(ordinal) if ordinal else None
+
+    def sort_keys(self):
+        return self.data.tolist()
+
+    def buffers(self):
+        return {"data": self.data}
+
+
+class _DictColumn:
+    """
+    Columna codificada con diccionario: cada valor distinto se guarda una sola
+    vez y cada fila guarda su código.
+    """
+
+    def __init__(self, codes=None, values=None):
+        self.codes = array("i") if codes is None else codes
+        self.values = [] if values is None else values
+        self.index = {value: code for code, value in enumerate(self.values)}
+
+    def append(self, value):
+        value = "" if value is None else str(value)
+        code = self.index.get(value)
+        if code is None:
+            code = self.index[value] = len(self.values)
+            self.values.append(value)
+        self.codes.append(code)
+
+    def get(self, i):
+        return self.values[self.codes[i]]
+
+    def ranks(self):
+        # Rango de cada código en el orden de los valores: ordenar los rangos
+        # equivale a ordenar los textos, comparando enteros
+        ranks = [0] * len(self.values)
+        for rank, code in enumerate(sorted(range(len(self.values)), key=self.values.__getitem__)):
+            ranks[code] = rank
+        return ranks
+
+    def sort_keys(self):
+        ranks = self.ranks()
+        return [ranks[code] for code in self.codes]
+
+    def buffers(self):
+        return {"codes": self.codes}
+
+
+class _TextColumn:
+    """
+    Columna de texto: los valores se concatenan en UTF-8 y offsets marca dónde
+    empieza cada uno (offsets[i]:offsets[i + 1]).
+    """
+
+    def __init__(self, blob=None, offsets=None):
+        self.blob = bytearray() if blob is None else blob
+        self.offsets = array("q", [0]) if offsets is None else offsets
+
+    def append(self, value):
+        self.blob += ("" if value is None else str(value)).encode("utf-8")
+        self.offsets.append(len(self.blob))
+
+    def get(self, i):
+        return bytes(self.blob[self.offsets[i]:self.offsets[i + 1]]).decode("utf-8")
+
+    def sort_keys(self):
+        return [self.get(i) for i in range(len(self.offsets) - 1)]
+
+    def buffers(self):
+        return {"blob": self.blob, "offsets": self.offsets}
+
+
+_COLUMN_TYPES = {"key": _KeyColumn, "date": _DateColumn, "dict": _DictColumn, "text": _TextColumn}
+
+
+class ArticleRow(Mapping):
+    """
+    Vista de una fila de ArticleTable. No copia los datos: cada campo se lee
+    de su columna al accederlo. Se comporta como un diccionario de solo
+    lectura (row["theme"], row.get("doi", "")), por lo que sirve como registro
+    para SortingAlgorithms, SearchQuery y los exportadores de RIS y BibTeX;
+    para JSON se usa to_dict o ArticleTable.iter_dicts.
+    """
+
+    __slots__ = ("table", "index")
+
+    def __init__(self, table, index):
+        self.table = table
+        self.index = index
+
+    def __getitem__(self, field):
+        column = self.table.columns.get(field)
+        if column is None:
+            raise KeyError(field)
+        return column.get(self.index)
+
+    def __iter__(self):
+        return iter(self.table.columns)
+
+    def __len__(self):
+        return len(self.table.columns)
+
+    def to_dict(self):
+        return {field: column.get(self.index) for field, column in self.table.columns.items()}
+
+    def __repr__(self):
+        return f"ArticleRow({self.to_dict()!r})"
+
+
+class ArticleTable:
+    """
+    Almacén de artículos por columnas. Frente a una lista de diccionarios:
+      - theme, category, author_name y source se codifican con diccionario
+        (un int32 por fila más cada valor distinto una vez);
+      - las fechas son ordinales int32 y los ids enteros int64 en arreglos
+        contiguos;
+      - los títulos y DOIs se concatenan en un solo bloque UTF-8.
+
+    column(field) expone los arreglos sin copiarlos (memoryview, compatible con
+    numpy.frombuffer) y argsort ordena por columna con cualquier método de
+    SortingAlgorithms, retornando una permutación de filas en lugar de mover
+    registros. save/load usan un único archivo que se abre con mmap, de modo
+    que cargar una tabla no lee ni decodifica los datos hasta que se usan.
+
+    Solo se guardan los campos de ARTICLE_FIELDS; las fechas que no se pueden
+    interpretar se guardan como desconocidas (None) y se cuentan en
+    unparsed_dates.
+    """
+
+    FORMAT_VERSION = 1
+
+    def __init__(self, articles=None):
+        self.columns = {field: _COLUMN_TYPES[kind]() for field, kind in ARTICLE_FIELDS.items()}
+        self._length = 0
+        self._mmap = None
+        if articles is not None:
+            self.extend(articles)
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError(index)
+        return ArticleRow(self, index)
+
+    def __iter__(self):
+        for index in range(self._length):
+            yield ArticleRow(self, index)
+
+    @property
+    def unparsed_dates(self):
+        return self.columns["publication_date"].unparsed
+
+    def _writable(self):
+        # Las tablas cargadas con mmap se copian a memoria al modificarlas
+        if self._mmap is None:
+            return
+        for field, column in self.columns.items():
+            for name, buffer in column.buffers().items():
+                if isinstance(buffer, memoryview):
+                    copy = bytearray(buffer) if name == "blob" else array(buffer.format, buffer.tobytes())
+                    setattr(column, name, copy)
+        self._mmap = None
+
+    def append(self, article):
+        self._writable()
+        article_id = article.get("id")
+        if article_id is not None and not isinstance(article_id, int) and isinstance(self.columns["id"], _KeyColumn):
+            # Ids no enteros (por ejemplo de fuentes sin id numérico): la
+            # columna pasa a guardarse como texto
+            ids = _TextColumn()
+            for i in range(self._length):
+                value = self.columns["id"].get(i)
+                ids.append("" if value is None else value)
+            self.columns["id"] = ids
+        for field, column in self.columns.items():
+            column.append(article.get(field))
+        self._length += 1
+
+    def extend(self, articles):
+        for article in articles:
+            self.append(article)
+        return self
+
+    def column(self, field):
+        """
+        Datos de la columna sin copiar: memoryview de los ids, ordinales de
+        fecha o códigos de diccionario (ver dictionary), o el bloque UTF-8 de
+        una columna de texto (ver offsets).
+        """
+        column = self.columns[field]
+        if isinstance(column, _DictColumn):
+            return memoryview(column.codes)
+        if isinstance(column, _TextColumn):
+            return memoryview(column.blob)
+        return memoryview(column.data)
+
+    def dictionary(self, field):
+        return self.columns[field].values
+
+    def offsets(self, field):
+        return memoryview(self.columns[field].offsets)
+
+    def values(self, field):
+        """
+        Lista con los valores de la columna, decodificados.
+        """
+        column = self.columns[field]
+        return [column.get(i) for i in range(self._length)]
+
+    def iter_dicts(self, order=None):
+        """
+        Genera los artículos como diccionarios, en el orden de order (por
+        ejemplo el resultado de argsort) o en el de inserción.
+        """
+        for index in (range(self._length) if order is None else order):
+            yield ArticleRow(self, index).to_dict()
+
+    def _priorities(self, field, search_value):
+        column = self.columns[field]
+        if isinstance(search_value, SearchQuery):
+            return search_value.priorities(list(self), lambda row: row[field])
+        search = str(search_value)
+        if isinstance(column, _DictColumn):
+            # La búsqueda se hace una vez por valor distinto
+            matches = [0 if search in value else 1 for value in column.values]
+            return [matches[code] for code in column.codes]
+        return [0 if search in str(column.get(i)) else 1 for i in range(self._length)]
+
+    def argsort(self, field, algorithm="tim_sort", search_value=None, sorter=None):
+        """
+        Permutación de filas que ordena la tabla por field con el método
+        algorithm de SortingAlgorithms, con la misma semántica de search_value
+        que al ordenar los diccionarios: primero las filas que coinciden.
+
+        Las claves se obtienen directamente de la columna (los textos
+        codificados con diccionario se comparan por su rango entero) y se
+        ordenan los números de fila, sin construir ni mover registros.
+        """
+        keys = self.columns[field].sort_keys()
+        if search_value is not None:
+            keys = list(zip(self._priorities(field, search_value), keys))
+        method = getattr(sorter or SortingAlgorithms(), algorithm)
+        return method(list(range(self._length)), key=keys.__getitem__)
+
+    def sorted(self, field, algorithm="tim_sort", search_value=None):
+        """
+        Filas (ArticleRow) en el orden de argsort.
+        """
+        return [ArticleRow(self, index) for index in self.argsort(field, algorithm, search_value)]
+
+    def save(self, filename):
+        """
+        Guarda la tabla en un solo archivo: una cabecera JSON con los
+        diccionarios y la posición de cada arreglo, seguida de los arreglos
+        alineados a 8 bytes tal como están en memoria.
+        """
+        buffers = []
+        meta = {
+            "version": self.FORMAT_VERSION,
+            "byteorder": sys.byteorder,
+            "length": self._length,
+            "columns": {},
+        }
+        for field, column in self.columns.items():
+            kind = {_KeyColumn: "key", _DateColumn: "date", _DictColumn: "dict", _TextColumn: "text"}[type(column)]
+            entry = {"kind": kind, "buffers": {}}
+            if kind == "dict":
+                entry["values"] = column.values
+            elif kind == "date":
+                entry["unparsed"] = column.unparsed
+            for name, buffer in column.buffers().items():
+                view = memoryview(buffer)
+                entry["buffers"][name] = {"format": view.format, "length": len(view)}
+                buffers.append((entry["buffers"][name], view.cast("B")))
+            meta["columns"][field] = entry
+
+        # Los desplazamientos dependen del tamaño de la cabecera: se calcula
+        # con desplazamientos provisionales y se reserva espacio de sobra
+        header = json.dumps(meta, ensure_ascii=False).encode("utf-8")
+        position = len(_MAGIC) + 8 + len(header) + 64 * len(buffers) + 64
+        for info, raw in buffers:
+            position = (position + 7) // 8 * 8
+            info["offset"] = position
+            position += len(raw)
+        header = json.dumps(meta, ensure_ascii=False).encode("utf-8")
+        data_start = len(_MAGIC) + 8 + len(header)
+        if buffers and data_start > buffers[0][0]["offset"]:
+            raise RuntimeError("La cabecera no cabe en el espacio reservado")
+
+        with open(filename, "wb") as f:
+            f.write(_MAGIC)
+            f.write(len(header).to_bytes(8, "little"))
+            f.write(header)
+            for info, raw in buffers:
+                f.write(b"\x00" * (info["offset"] - f.tell()))
+                f.write(raw)
+
+    @classmethod
+    def load(cls, filename, use_mmap=True):
+        """
+        Carga una tabla guardada con save. Con use_mmap los arreglos son
+        memoryviews sobre el archivo proyectado en memoria: la carga es
+        inmediata y el sistema operativo lee las páginas a medida que se usan.
+        """
+        with open(filename, "rb") as f:
+            if f.read(len(_MAGIC)) != _MAGIC:
+                raise ValueError(f"{filename} no es una ArticleTable")
+            size = int.from_bytes(f.read(8), "little")
+            meta = json.loads(f.read(size).decode("utf-8"))
+            if meta.get("version") != cls.FORMAT_VERSION:
+                raise ValueError(f"Versión de tabla no soportada: {meta.get('version')}")
+            if meta["byteorder"] != sys.byteorder:
+                raise ValueError("La tabla se guardó en una máquina con otro orden de bytes")
+            if use_mmap:
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                f.seek(0)
+                data = f.read()
+
+        table = cls.__new__(cls)
+        table._length = meta["length"]
+        table._mmap = data if use_mmap else None
+        table.columns = {}
+        raw = memoryview(data)
+        for field, entry in meta["columns"].items():
+            buffers = {}
+            for name, info in entry["buffers"].items():
+                fmt = info["format"]
+                view = raw[info["offset"]:info["offset"] + info["length"] * array(fmt).itemsize]
+                if not use_mmap:
+                    buffers[name] = bytearray(view) if name == "blob" else array(fmt, view.tobytes())
+                else:
+                    buffers[name] = view if fmt == "B" else view.cast(fmt)
+            if entry["kind"] == "dict":
+                table.columns[field] = _DictColumn(buffers["codes"], entry["values"])
+            elif entry["kind"] == "text":
+                table.columns[field] = _TextColumn(buffers["blob"], buffers["offsets"])
+            elif entry["kind"] == "date":
+                table.columns[field] = _DateColumn(buffers["data"], entry.get("unparsed", 0))
+            else:
+                table.columns[field] = _COLUMN_TYPES[entry["kind"]](buffers["data"])
+        return table
@@ -1,8 +1,61 @@
+import re
+import threading
+import time
+from contextlib import contextmanager
+
 import mysql.connector
-from mysql.connector import errorcode
+from mysql.connector import errorcode, pooling
+
+from sorting_algorithms.sorting import FieldKey, SortingAlgorithms
+
+ARTICLE_COLUMNS = ("id", "article_name", "author_name", "publication_date", "theme", "category")
+
+# INSERT ... ON DUPLICATE KEY UPDATE actualiza la fila existente en el lugar;
+# REPLACE la eliminaba y la volvía a insertar.
+UPSERT_ARTICLE_QUERY = (
+    "INSERT INTO articles "
+    "(id, article_name, author_name, publication_date, theme, category) "
+    "VALUES (%s, %s, %s, %s, %s, %s) "
+    "ON DUPLICATE KEY UPDATE "
+    "article_name = VALUES(article_name), "
+    "author_name = VALUES(author_name), "
+    "publication_date = VALUES(publication_date), "
+    "theme = VALUES(theme), "
+    "category = VALUES(category)"
+)
+
+# Migraciones del esquema: (versión, descripción, sentencias). Se aplican en
+# orden y cada versión aplicada se registra en schema_migrations.
+SCHEMA_MIGRATIONS = [
+    (1, "utf8mb4 y títulos de hasta 512 caracteres", [
+        "ALTER DATABASE {database} CHARACTER SET utf8mb4 COLLATE utf8mb4_unicode_ci",
+        "ALTER TABLE articles CONVERT TO CHARACTER SET utf8mb4 COLLATE utf8mb4_unicode_ci",
+        "ALTER TABLE articles MODIFY article_name VARCHAR(512)",
+    ]),
+    (2, "índices secundarios para filtrar y ordenar", [
+        "CREATE INDEX idx_articles_publication_date ON articles (publication_date)",
+        "CREATE INDEX idx_articles_theme ON articles (theme)",
+        "CREATE INDEX idx_articles_category ON articles (category)",
+        "CREATE INDEX idx_articles_author_name ON articles (author_name)",
+        "CREATE INDEX idx_articles_article_name ON articles (article_name)",
+    ]),
+    (3, "índices FULLTEXT para búsqueda por título y temática", [
+        "CREATE FULLTEXT INDEX ft_articles_article_name ON articles (article_name)",
+        "CREATE FULLTEXT INDEX ft_articles_theme ON articles (theme)",
+    ]),
+    (4, "ids de 63 bits (hash de los scrapers e ids de Scopus)", [
+        "ALTER TABLE articles MODIFY id BIGINT",
+    ]),
+]
+
+_CREATE_INDEX_RE = re.compile(r"CREATE (?:FULLTEXT )?INDEX (\w+) ON ")
+
 
 class MySQLDatabase:
-    def __init__(self, host='localhost', user='root', password='', database='bibliometria'):
+    def __init__(self, host='localhost', user='root', password='', database='bibliometria', pool_size=5):
+        self.pool = None
+        # True mientras hay un bloque transaction() abierto
+        self._in_transaction = False
         try:
             self.cnx = mysql.connector.connect(
                 host=host,
@@ -13,6 +66,18 @@ class MySQLDatabase:
             self.create_database(database)
             self.cnx.database = database
             self.create_table()
+            self.database = database
+            self.migrate()
+            # Pool de conexiones para lecturas en streaming y cargas desde hilos
+            self.pool = pooling.MySQLConnectionPool(
+                pool_name=f"bibliometria_{id(self)}",
+                pool_size=pool_size,
+                host=host,
+                user=user,
+                password=password,
+                database=database
+            )
+            self._pool_slots = threading.BoundedSemaphore(pool_size)
         except mysql.connector.Error as err:
             print(f"Error: {err}")
             self.cnx = None
@@ -20,7 +85,7 @@ class MySQLDatabase:
     def create_database(self, database):
         try:
             self.cursor.execute(
-                f"CREATE DATABASE IF NOT EXISTS {database} DEFAULT CHARACTER SET 'utf8'")
+                f"CREATE DATABASE IF NOT EXISTS {database} DEFAULT CHARACTER SET 'utf8mb4'")
         except mysql.connector.Error as err:
             print(f"Failed creating database: {err}")
             exit(1)
@@ -28,7 +93,7 @@ class MySQLDatabase:
     def create_table(self):
         create_table_query = (
             "CREATE TABLE IF NOT EXISTS articles ("
-            "  id INT PRIMARY KEY, "
+            "  id BIGINT PRIMARY KEY, "
             "  article_name VARCHAR(255), "
             "  author_name VARCHAR(255), "
             "  publication_date DATE, "
@@ -41,30 +106,375 @@ class MySQLDatabase:
         except mysql.connector.Error as err:
             print(f"Failed creating table: {err}")
 
+    def schema_version(self):
+        self.cursor.execute(
+            "CREATE TABLE IF NOT EXISTS schema_migrations ("
+            "  version INT PRIMARY KEY, "
+            "  description VARCHAR(255), "
+            "  applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP"
+            ") ENGINE=InnoDB"
+        )
+        self.cursor.execute("SELECT COALESCE(MAX(version), 0) FROM schema_migrations")
+        version = self.cursor.fetchone()[0]
+        self._end_read()
+        return version
+
+    def _end_read(self):
+        # Con autocommit desactivado, un SELECT abre una transacción implícita
+        # que dejaría la conexión en in_transaction; se cierra salvo que la
+        # lectura ocurra dentro de un bloque transaction()
+        if not self._in_transaction:
+            self.cnx.rollback()
+
+    def _index_exists(self, name):
+        self.cursor.execute(
+            "SELECT COUNT(*) FROM information_schema.STATISTICS "
+            "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'articles' AND INDEX_NAME = %s", (name,))
+        exists = self.cursor.fetchone()[0] > 0
+        self._end_read()
+        return exists
+
+    def _apply_statement(self, statement):
+        """
+        Ejecuta una sentencia de migración. Los CREATE INDEX se omiten si el
+        índice ya existe, de modo que una migración que falló a medias (cada
+        sentencia DDL se confirma por separado en MySQL) puede reintentarse.
+        """
+        match = _CREATE_INDEX_RE.match(statement)
+        if match and self._index_exists(match.group(1)):
+            return
+        self.cursor.execute(statement.format(database=self.database))
+
+    def migrate(self, target=None):
+        """
+        Aplica las migraciones de SCHEMA_MIGRATIONS posteriores a la versión
+        actual del esquema (hasta target, si se indica). Retorna la versión final.
+        """
+        current = self.schema_version()
+        for version, description, statements in SCHEMA_MIGRATIONS:
+            if version <= current or (target is not None and version > target):
+                continue
+            try:
+                for statement in statements:
+                    self._apply_statement(statement)
+                self.cursor.execute(
+                    "INSERT INTO schema_migrations (version, description) VALUES (%s, %s)",
+                    (version, description))
+                self.cnx.commit()
+            except mysql.connector.Error as err:
+                self.cnx.rollback()
+                print(f"Failed applying migration {version}: {err}")
+                break
+            current = version
+        self._indexes = None
+        return current
+
+    def indexed_columns(self):
+        """
+        Retorna dos conjuntos: columnas que encabezan un índice BTREE y columnas
+        con índice FULLTEXT propio, según information_schema.
+        """
+        if getattr(self, "_indexes", None) is None:
+            self.cursor.execute(
+                "SELECT COLUMN_NAME, INDEX_TYPE FROM information_schema.STATISTICS "
+                "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'articles' AND SEQ_IN_INDEX = 1"
+            )
+            btree = set()
+            fulltext = set()
+            for column, index_type in self.cursor.fetchall():
+                (fulltext if index_type == "FULLTEXT" else btree).add(column)
+            self._end_read()
+            self._indexes = (btree, fulltext)
+        return self._indexes
+
+    def plan_sort(self, field, search_value=None):
+        """
+        Decide dónde ordenar: "mysql" si field tiene índice y search_value es
+        None o un texto, "python" en caso contrario (por ejemplo un SearchQuery,
+        que MySQL no puede evaluar).
+        """
+        if field not in ARTICLE_COLUMNS:
+            raise ValueError(f"Columna desconocida: {field}")
+        btree, _ = self.indexed_columns()
+        if field in btree and (search_value is None or isinstance(search_value, (str, int))):
+            return "mysql"
+        return "python"
+
+    def sorted_articles(self, field, search_value=None, limit=None, offset=0, filters=None,
+                        algorithm="tim_sort", chunk_size=1000):
+        """
+        Retorna un iterador de los artículos ordenados por field, con la misma
+        semántica que SortingAlgorithms: si hay search_value, primero los que
+        coinciden. El tipo es el mismo (un generador) se ordene en MySQL o en
+        Python.
+
+        Si field está indexado, el ORDER BY, el LIMIT y la prioridad de búsqueda
+        se delegan a MySQL: MATCH ... AGAINST cuando field tiene índice FULLTEXT
+        y LIKE '%valor%' en otro caso. Si no, las filas se leen con
+        iter_articles y se ordenan en Python con algorithm (o con top_k cuando
+        hay limit y algorithm es tim_sort).
+
+        Nota: MySQL ordena según la colación de la columna (sin distinguir
+        mayúsculas) y MATCH busca palabras completas, por lo que el orden puede
+        diferir ligeramente del de SortingAlgorithms.
+        """
+        if self.plan_sort(field, search_value) == "python":
+            return self._sorted_in_python(field, search_value, limit, offset, filters, algorithm, chunk_size)
+
+        where, params = self._build_filters(filters)
+        order_terms = []
+        order_params = []
+        if search_value is not None:
+            _, fulltext = self.indexed_columns()
+            if field in fulltext:
+                order_terms.append(f"(MATCH({field}) AGAINST (%s IN NATURAL LANGUAGE MODE) = 0)")
+                order_params.append(str(search_value))
+            else:
+                pattern = str(search_value).replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+                order_terms.append(f"(CASE WHEN {field} LIKE %s THEN 0 ELSE 1 END)")
+                order_params.append(f"%{pattern}%")
+        # id desempata igual que la estabilidad de tim_sort sobre filas leídas por id
+        order_terms.extend([field, "id"])
+        query = (f"SELECT {', '.join(ARTICLE_COLUMNS)} FROM articles{where} "
+                 f"ORDER BY {', '.join(order_terms)}")
+        params = params + order_params
+        if limit is not None:
+            query += " LIMIT %s OFFSET %s"
+            params += [limit, offset]
+        elif offset:
+            query += " LIMIT 18446744073709551615 OFFSET %s"
+            params.append(offset)
+        return self._stream_query(query, params, chunk_size)
+
+    def _sorted_in_python(self, field, search_value, limit, offset, filters, algorithm, chunk_size):
+        sorter = SortingAlgorithms()
+        rows = list(self.iter_articles(filters, order_by="id", chunk_size=chunk_size))
+        key = FieldKey(field)
+        if limit is not None and algorithm == "tim_sort":
+            yield from sorter.sorted_page(rows, offset, limit, key=key, search_value=search_value)
+            return
+        result = getattr(sorter, algorithm)(rows, key=key, search_value=search_value)
+        yield from (result[offset:] if limit is None else result[offset:offset + limit])
+
+    @contextmanager
+    def connection(self):
+        """
+        Toma una conexión del pool y la devuelve al salir del bloque. Si todas
+        están en uso, el hilo espera a que se libere una en lugar de fallar con
+        PoolError, por lo que es seguro usarla desde hilos de trabajo.
+        """
+        with self._pool_slots:
+            cnx = self.pool.get_connection()
+            try:
+                yield cnx
+            finally:
+                cnx.close()
+
+    @staticmethod
+    def _build_filters(filters):
+        """
+        Traduce filters a una cláusula WHERE con parámetros. Cada valor puede ser
+        un escalar (igualdad), una tupla (mínimo, máximo) con extremos inclusivos
+        y None para no acotar, o una lista/conjunto (IN).
+        """
+        clauses = []
+        params = []
+        for column, value in (filters or {}).items():
+            if column not in ARTICLE_COLUMNS:
+                raise ValueError(f"Columna desconocida: {column}")
+            if isinstance(value, tuple):
+                minimum, maximum = value
+                if minimum is not None:
+                    clauses.append(f"{column} >= %s")
+                    params.append(minimum)
+                if maximum is not None:
+                    clauses.append(f"{column} <= %s")
+                    params.append(maximum)
+            elif isinstance(value, (list, set, frozenset)):
+                if not value:
+                    clauses.append("FALSE")
+                    continue
+                clauses.append(f"{column} IN ({', '.join(['%s'] * len(value))})")
+                params.extend(value)
+            elif value is None:
+                clauses.append(f"{column} IS NULL")
+            else:
+                clauses.append(f"{column} = %s")
+                params.append(value)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        return where, params
+
+    @staticmethod
+    def _build_order_by(order_by):
+        """
+        Traduce order_by (columna o lista de columnas; un prefijo "-" indica
+        orden descendente) a una cláusula ORDER BY.
+        """
+        if not order_by:
+            return ""
+        if isinstance(order_by, str):
+            order_by = [order_by]
+        terms = []
+        for column in order_by:
+            direction = "DESC" if column.startswith("-") else "ASC"
+            column = column.lstrip("-")
+            if column not in ARTICLE_COLUMNS:
+                raise ValueError(f"Columna desconocida: {column}")
+            terms.append(f"{column} {direction}")
+        return f" ORDER BY {', '.join(terms)}"
+
+    def iter_articles(self, filters=None, order_by=None, chunk_size=1000):
+        """
+        Generador que recorre la tabla articles sin cargar el resultado completo
+        en memoria: usa un cursor sin buffer, de modo que el servidor envía las
+        filas a medida que se leen, y las pide en bloques de chunk_size.
+        Produce un diccionario por artículo, listo para SortingAlgorithms o
+        exports.export_data.
+
+        Si el generador se cierra antes de terminar, las filas pendientes se
+        descartan antes de devolver la conexión al pool.
+        """
+        where, params = self._build_filters(filters)
+        query = f"SELECT {', '.join(ARTICLE_COLUMNS)} FROM articles{where}{self._build_order_by(order_by)}"
+        return self._stream_query(query, params, chunk_size)
+
+    def _stream_query(self, query, params, chunk_size):
+        with self.connection() as cnx:
+            cursor = cnx.cursor(buffered=False, dictionary=True)
+            try:
+                cursor.execute(query, params)
+                while True:
+                    rows = cursor.fetchmany(chunk_size)
+                    if not rows:
+                        break
+                    yield from rows
+            finally:
+                if cnx.unread_result:
+                    cnx.consume_results()
+                cursor.close()
+
+    @staticmethod
+    def _article_row(article):
+        """
+        Convierte un artículo en la tupla de parámetros de UPSERT_ARTICLE_QUERY.
+        Los campos ausentes o vacíos se guardan como NULL.
+        """
+        return (article['id'],) + tuple(article.get(column) or None for column in ARTICLE_COLUMNS[1:])
+
+    @contextmanager
+    def transaction(self):
+        """
+        Agrupa varias operaciones en una transacción: commit al salir del bloque
+        y rollback si ocurre una excepción. Dentro del bloque insert_article no
+        hace commit por su cuenta y propaga los errores, de modo que un lote con
+        una fila fallida se revierte completo.
+        """
+        self.cnx.start_transaction()
+        self._in_transaction = True
+        try:
+            yield self
+        except Exception:
+            self.cnx.rollback()
+            raise
+        else:
+            self.cnx.commit()
+        finally:
+            self._in_transaction = False
+
     def insert_article(self, article):
         """
         Inserta o actualiza un registro en la tabla articles.
         article: dict con claves: id, article_name, author_name, publication_date, theme, category
         """
-        insert_query = (
-            "REPLACE INTO articles "
-            "(id, article_name, author_name, publication_date, theme, category) "
-            "VALUES (%s, %s, %s, %s, %s, %s)"
-        )
-        data = (
-            article['id'],
-            article['article_name'],
-            article['author_name'],
-            article['publication_date'],
-            article['theme'],
-            article['category']
-        )
         try:
-            self.cursor.execute(insert_query, data)
-            self.cnx.commit()
+            self.cursor.execute(UPSERT_ARTICLE_QUERY, self._article_row(article))
+            if not self._in_transaction:
+                self.cnx.commit()
         except mysql.connector.Error as err:
+            if self._in_transaction:
+                raise
+            self.cnx.rollback()
             print(f"Error inserting article: {err}")
 
+    def insert_articles(self, articles, batch_size=1000, on_commit=None):
+        """
+        Inserta o actualiza artículos de cualquier iterable en lotes de
+        batch_size filas. Cada lote se envía con executemany, que el conector
+        reescribe como un único INSERT de varias filas, y se confirma con un solo
+        commit. Si un lote falla se revierte y se continúa con el siguiente.
+
+        on_commit, si se indica, se llama con la lista de artículos de cada lote
+        después de su commit (nunca con los de un lote revertido), por ejemplo
+        para actualizar una caché.
+
+        Usa su propia conexión del pool, por lo que varios hilos pueden cargar
+        lotes en paralelo. Retorna un diccionario con las filas insertadas, los
+        segundos empleados y las filas por segundo.
+        """
+        start = time.perf_counter()
+        rows = 0
+        failed = 0
+        with self.connection() as cnx:
+            cursor = cnx.cursor()
+            batch = []
+            for article in articles:
+                batch.append(article)
+                if len(batch) >= batch_size:
+                    inserted = self._insert_batch(cnx, cursor, batch, on_commit)
+                    rows += inserted
+                    failed += len(batch) - inserted
+                    batch = []
+            if batch:
+                inserted = self._insert_batch(cnx, cursor, batch, on_commit)
+                rows += inserted
+                failed += len(batch) - inserted
+            cursor.close()
+        elapsed = time.perf_counter() - start
+        stats = {
+            "rows": rows,
+            "failed": failed,
+            "seconds": elapsed,
+            "rows_per_second": rows / elapsed if elapsed > 0 else 0.0,
+        }
+        print(f"{rows} artículos insertados en {elapsed:.2f} s ({stats['rows_per_second']:.0f} filas/s)")
+        return stats
+
+    @classmethod
+    def _insert_batch(cls, cnx, cursor, batch, on_commit=None):
+        try:
+            cursor.executemany(UPSERT_ARTICLE_QUERY, [cls._article_row(article) for article in batch])
+            cnx.commit()
+        except mysql.connector.Error as err:
+            cnx.rollback()
+            print(f"Error inserting batch: {err}")
+            return 0
+        if on_commit is not None:
+            on_commit(batch)
+        return len(batch)
+
+    def delete_articles(self, article_ids, batch_size=1000):
+        """
+        Elimina los artículos con los ids indicados, en lotes de batch_size con
+        un commit por lote, usando una conexión del pool. Retorna el número de
+        filas eliminadas.
+        """
+        article_ids = list(article_ids)
+        deleted = 0
+        with self.connection() as cnx:
+            cursor = cnx.cursor()
+            try:
+                for start in range(0, len(article_ids), batch_size):
+                    where, params = self._build_filters({"id": article_ids[start:start + batch_size]})
+                    cursor.execute(f"DELETE FROM articles{where}", params)
+                    deleted += cursor.rowcount
+                    cnx.commit()
+            except mysql.connector.Error as err:
+                cnx.rollback()
+                print(f"Error deleting articles: {err}")
+            finally:
+                cursor.close()
+        return deleted
+
     def close(self):
         self.cursor.close()
         self.cnx.close()
\ No newline at end of file
@@ -1,9 +1,93 @@
 import redis
 import json
+import zlib
+
+try:
+    import msgpack
+except ImportError:
+    # Sin msgpack los diccionarios se serializan siempre como JSON
+    msgpack = None
+
+# Cada valor se guarda con una cabecera de dos bytes: un byte nulo (que no
+# aparece al inicio de los valores escritos antes de este formato) y el tipo
+# de contenido: t = texto, j = JSON, m = msgpack; en mayúscula si está
+# comprimido con zlib.
+_HEADER = b"\x00"
+
+# Valor por defecto de ttl en store_articles: distingue "no indicado" (se usa
+# el ttl de la instancia) de None (sin expiración)
+_DEFAULT_TTL = object()
+
 
 class RedisDatabase:
-    def __init__(self, host='localhost', port=6379, db=0):
+    def __init__(self, host='localhost', port=6379, db=0, namespace='', ttl=None, batch_size=500,
+                 compress_threshold=1024, serializer='json'):
+        """
+        :param namespace: Prefijo de las claves de los artículos. Por defecto
+                          ninguno, como antes: los artículos guardados con su id
+                          como clave siguen siendo accesibles.
+        :param ttl: Segundos de vida de cada artículo; None o 0 para no expirar.
+        :param batch_size: Artículos por pipeline / MGET en las operaciones masivas.
+        :param compress_threshold: Tamaño en bytes a partir del cual el contenido
+                                   se comprime con zlib; None para no comprimir.
+        :param serializer: 'json' o 'msgpack' (si está instalado) para diccionarios.
+        """
         self.r = redis.Redis(host=host, port=port, db=db)
+        self.namespace = namespace
+        # Redis rechaza EX 0: se trata como sin expiración
+        self.ttl = ttl or None
+        self.batch_size = batch_size
+        self.compress_threshold = compress_threshold
+        if serializer == 'msgpack' and msgpack is None:
+            raise ImportError("El serializador msgpack requiere el paquete msgpack")
+        self.serializer = serializer
+
+    def _key(self, article_id):
+        return f"{self.namespace}{article_id}"
+
+    def _encode(self, article_content):
+        if isinstance(article_content, dict):
+            if self.serializer == 'msgpack':
+                kind, payload = b"m", msgpack.packb(article_content, default=str)
+            else:
+                kind, payload = b"j", json.dumps(article_content, ensure_ascii=False, default=str).encode('utf-8')
+        else:
+            kind, payload = b"t", str(article_content).encode('utf-8')
+        # Solo compensa comprimir contenidos grandes (por ejemplo texto completo)
+        if self.compress_threshold is not None and len(payload) >= self.compress_threshold:
+            kind, payload = kind.upper(), zlib.compress(payload)
+        return _HEADER + kind + payload
+
+    @staticmethod
+    def _decode(value):
+        """
+        Retorna el contenido original: dict para JSON/msgpack y str para texto.
+        Los valores sin cabecera (formato anterior) son texto o el JSON de un
+        diccionario, como los guardaba store_article; este último también se
+        retorna como dict, igual que los valores nuevos.
+        """
+        if value is None:
+            return None
+        if not value.startswith(_HEADER) or len(value) < 2:
+            text = value.decode('utf-8')
+            if text.startswith("{"):
+                try:
+                    content = json.loads(text)
+                except ValueError:
+                    return text
+                if isinstance(content, dict):
+                    return content
+            return text
+        kind, payload = value[1:2], value[2:]
+        if kind.isupper():
+            kind, payload = kind.lower(), zlib.decompress(payload)
+        if kind == b"j":
+            return json.loads(payload)
+        if kind == b"m":
+            if msgpack is None:
+                raise ImportError("El artículo está serializado con msgpack y el paquete no está instalado")
+            return msgpack.unpackb(payload)
+        return payload.decode('utf-8')
 
     def store_article(self, article_id, article_content):
         """
@@ -11,16 +95,55 @@ class RedisDatabase:
         :param article_id: ID único del artículo (usado como clave)
         :param article_content: Contenido completo del artículo (puede ser texto o JSON)
         """
-        # Se almacena como string; si article_content es un diccionario se convierte a JSON
-        if isinstance(article_content, dict):
-            article_content = json.dumps(article_content)
-        self.r.set(article_id, article_content)
+        self.r.set(self._key(article_id), self._encode(article_content), ex=self.ttl)
 
     def get_article(self, article_id):
         """
         Recupera el artículo almacenado en Redis mediante su clave.
         """
-        content = self.r.get(article_id)
-        if content:
-            return content.decode('utf-8')
-        return None
\ No newline at end of file
+        content = self._decode(self.r.get(self._key(article_id)))
+        if isinstance(content, dict):
+            return json.dumps(content, ensure_ascii=False)
+        return content
+
+    def store_articles(self, articles, id_field='id', batch_size=None, ttl=_DEFAULT_TTL):
+        """
+        Almacena muchos artículos (diccionarios con la clave id_field) usando
+        pipelines: cada lote de batch_size SET se envía en un solo viaje de red.
+        Sin ttl se usa el de la instancia; ttl=None o 0 los guarda sin expiración.
+        Retorna el número de artículos almacenados.
+        """
+        batch_size = batch_size or self.batch_size
+        ttl = self.ttl if ttl is _DEFAULT_TTL else ttl or None
+        stored = 0
+        pipe = self.r.pipeline(transaction=False)
+        pending = 0
+        for article in articles:
+            pipe.set(self._key(article[id_field]), self._encode(article), ex=ttl)
+            pending += 1
+            if pending >= batch_size:
+                pipe.execute()
+                stored += pending
+                pending = 0
+        if pending:
+            pipe.execute()
+            stored += pending
+        return stored
+
+    def get_articles(self, article_ids, batch_size=None):
+        """
+        Recupera muchos artículos con MGET por lotes. Retorna una lista alineada
+        con article_ids, con el contenido decodificado (dict o str) o None si el
+        artículo no está.
+        """
+        batch_size = batch_size or self.batch_size
+        article_ids = list(article_ids)
+        results = []
+        for start in range(0, len(article_ids), batch_size):
+            keys = [self._key(article_id) for article_id in article_ids[start:start + batch_size]]
+            results.extend(self._decode(value) for value in self.r.mget(keys))
+        return results
+
+    def delete_articles(self, article_ids):
+        keys = [self._key(article_id) for article_id in article_ids]
+        return self.r.delete(*keys) if keys else 0
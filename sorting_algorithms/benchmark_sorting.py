@@ -0,0 +1,287 @@
+import argparse
+import copy
+import csv
+import datetime
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+from sorting_algorithms.sorting import SortingAlgorithms
+
+# Los 14 métodos de SortingAlgorithms, en el orden en que están definidos
+ALGORITHMS = [
+    "tim_sort", "comb_sort", "selection_sort", "tree_sort", "pigeonhole_sort",
+    "bucket_sort", "quick_sort", "heap_sort", "bitonic_sort", "gnome_sort",
+    "binary_insertion_sort", "radix_sort", "bubble_sort", "double_bubble_sort",
+]
+
+# Algoritmos O(n²) que se omiten por encima de --quadratic-limit
+QUADRATIC_ALGORITHMS = {
+    "selection_sort", "gnome_sort", "binary_insertion_sort", "bubble_sort", "double_bubble_sort",
+}
+
+# Algoritmos de distribución: operan aritméticamente sobre la clave, por lo que
+# no se les puede envolver la clave para contar comparaciones.
+DISTRIBUTION_ALGORITHMS = {"pigeonhole_sort", "bucket_sort", "radix_sort"}
+
+# Tipos de clave: campo de la tabla articles y término de búsqueda asociado
+KEY_TYPES = {
+    "int": ("id", "7"),
+    "date": ("publication_date", "2019"),
+    "str": ("article_name", "learning"),
+}
+
+_WORDS = [
+    "computational", "thinking", "learning", "data", "analysis", "education", "model",
+    "algorithm", "network", "systems", "pensamiento", "computacional", "aprendizaje",
+    "datos", "análisis", "educación", "visualización", "estadística", "software", "design",
+]
+_THEMES = ["Computación", "Educación", "Matemáticas", "Ingeniería", "Estadística", "Ciencia de datos"]
+_CATEGORIES = ["Journal", "Conference", "Book chapter", "Review", "Thesis"]
+_SURNAMES = ["García", "Smith", "López", "Johnson", "Martínez", "Brown", "Rodríguez", "Lee", "Pérez", "Wang"]
+_NAMES = ["Ana", "John", "María", "David", "Juan", "Laura", "Carlos", "Emily", "Luis", "Sofía"]
+
+
+def generate_articles(n, seed=42):
+    """
+    Genera n registros sintéticos con los mismos campos que la tabla articles
+    (id, article_name, author_name, publication_date, theme, category).
+    La misma semilla produce siempre los mismos registros.
+    """
+    rnd = random.Random(seed)
+    start = datetime.date(1990, 1, 1).toordinal()
+    end = datetime.date(2025, 12, 31).toordinal()
+    ids = rnd.sample(range(1, n * 10 + 1), n)
+    articles = []
+    for article_id in ids:
+        title = " ".join(rnd.choice(_WORDS) for _ in range(rnd.randint(3, 10)))
+        articles.append({
+            "id": article_id,
+            "article_name": title.capitalize(),
+            "author_name": f"{rnd.choice(_NAMES)} {rnd.choice(_SURNAMES)}",
+            "publication_date": datetime.date.fromordinal(rnd.randint(start, end)),
+            "theme": rnd.choice(_THEMES),
+            "category": rnd.choice(_CATEGORIES),
+        })
+    return articles
+
+
+class _Counter:
+    __slots__ = ("count",)
+
+    def __init__(self):
+        self.count = 0
+
+
+class _CountingKey:
+    """
+    Envuelve el valor de una clave y cuenta cada comparación realizada sobre él.
+    """
+    __slots__ = ("value", "counter")
+
+    def __init__(self, value, counter):
+        self.value = value
+        self.counter = counter
+
+    def __lt__(self, other):
+        self.counter.count += 1
+        return self.value < other.value
+
+    def __le__(self, other):
+        self.counter.count += 1
+        return self.value <= other.value
+
+    def __gt__(self, other):
+        self.counter.count += 1
+        return self.value > other.value
+
+    def __ge__(self, other):
+        self.counter.count += 1
+        return self.value >= other.value
+
+    def __eq__(self, other):
+        self.counter.count += 1
+        return self.value == other.value
+
+    __hash__ = None
+
+    def __str__(self):
+        return str(self.value)
+
+
+def _make_key(field):
+    def key(article):
+        return article[field]
+    return key
+
+
+def _instrumented_key(field, key_calls, comparisons):
+    """
+    Retorna una función clave que cuenta sus invocaciones y, si se le pasa un
+    contador de comparaciones, envuelve el valor en un _CountingKey.
+    """
+    def key(article):
+        key_calls.count += 1
+        if comparisons is None:
+            return article[field]
+        return _CountingKey(article[field], comparisons)
+    return key
+
+
+def run_case(sorter, algorithm, articles, key_type, search_value, repeat=3):
+    """
+    Ejecuta un caso de benchmark y retorna un diccionario con los resultados.
+    El tiempo es el mejor de `repeat` ejecuciones sin instrumentación; la
+    memoria pico se mide con tracemalloc en otra ejecución con la clave sin
+    instrumentar (los _CountingKey ocupan memoria propia), y las comparaciones
+    y llamadas a la clave en una última ejecución instrumentada.
+    """
+    field, _ = KEY_TYPES[key_type]
+    method = getattr(sorter, algorithm)
+    result = {
+        "algorithm": algorithm,
+        "size": len(articles),
+        "key_type": key_type,
+        "search_value": search_value,
+        "status": "ok",
+        "wall_time_s": None,
+        "comparisons": None,
+        "key_calls": None,
+        "peak_memory_bytes": None,
+        "error": None,
+    }
+
+    key = _make_key(field)
+    best = None
+    try:
+        for _ in range(repeat):
+            data = copy.copy(articles)
+            start = time.perf_counter()
+            method(data, key=key, search_value=search_value)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+    except (TypeError, ValueError, IndexError, RecursionError) as err:
+        # Algunos algoritmos solo admiten claves numéricas
+        result["status"] = "error"
+        result["error"] = f"{type(err).__name__}: {err}"
+        return result
+    result["wall_time_s"] = best
+
+    data = copy.copy(articles)
+    tracemalloc.start()
+    try:
+        method(data, key=key, search_value=search_value)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    key_calls = _Counter()
+    comparisons = None if algorithm in DISTRIBUTION_ALGORITHMS else _Counter()
+    method(copy.copy(articles), key=_instrumented_key(field, key_calls, comparisons), search_value=search_value)
+    result["key_calls"] = key_calls.count
+    result["comparisons"] = comparisons.count if comparisons is not None else None
+    result["peak_memory_bytes"] = peak
+    return result
+
+
+def run_benchmark(sizes, algorithms=None, key_types=None, search_modes=(False, True),
+                  quadratic_limit=5000, repeat=3, seed=42, progress=None):
+    """
+    Ejecuta todas las combinaciones de tamaño, algoritmo, tipo de clave y modo
+    de búsqueda. Los algoritmos cuadráticos se marcan como "skipped" cuando el
+    tamaño supera quadratic_limit.
+    """
+    sorter = SortingAlgorithms()
+    algorithms = algorithms or ALGORITHMS
+    key_types = key_types or list(KEY_TYPES)
+    results = []
+    for size in sizes:
+        articles = generate_articles(size, seed=seed)
+        for key_type in key_types:
+            for use_search in search_modes:
+                search_value = KEY_TYPES[key_type][1] if use_search else None
+                for algorithm in algorithms:
+                    if algorithm in QUADRATIC_ALGORITHMS and size > quadratic_limit:
+                        result = {
+                            "algorithm": algorithm, "size": size, "key_type": key_type,
+                            "search_value": search_value, "status": "skipped",
+                            "wall_time_s": None, "comparisons": None, "key_calls": None,
+                            "peak_memory_bytes": None,
+                            "error": f"cuadrático por encima de {quadratic_limit}",
+                        }
+                    else:
+                        result = run_case(sorter, algorithm, articles, key_type, search_value, repeat)
+                    results.append(result)
+                    if progress:
+                        progress(result)
+    return results
+
+
+def write_json(results, filename, metadata):
+    with open(filename, "w", encoding="utf-8") as f:
+        json.dump({"metadata": metadata, "results": results}, f, ensure_ascii=False, indent=4)
+    print(f"Resultados exportados a {filename}")
+
+
+def write_csv(results, filename):
+    fields = ["algorithm", "size", "key_type", "search_value", "status", "wall_time_s",
+              "comparisons", "key_calls", "peak_memory_bytes", "error"]
+    with open(filename, "w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fields)
+        writer.writeheader()
+        writer.writerows(results)
+    print(f"Resultados exportados a {filename}")
+
+
+def _print_result(result):
+    if result["status"] == "ok":
+        comparisons = result["comparisons"] if result["comparisons"] is not None else "-"
+        print(f"{result['algorithm']:<22} n={result['size']:<8} key={result['key_type']:<4} "
+              f"search={str(result['search_value']):<9} {result['wall_time_s'] * 1000:10.2f} ms  "
+              f"cmp={comparisons}  key_calls={result['key_calls']}  "
+              f"peak={result['peak_memory_bytes'] / 1024:.1f} KiB")
+    else:
+        print(f"{result['algorithm']:<22} n={result['size']:<8} key={result['key_type']:<4} "
+              f"search={str(result['search_value']):<9} {result['status']}: {result['error']}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Benchmark reproducible de los métodos de SortingAlgorithms sobre artículos sintéticos.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--algorithms", nargs="+", choices=ALGORITHMS, default=None)
+    parser.add_argument("--keys", nargs="+", choices=list(KEY_TYPES), default=None)
+    parser.add_argument("--search", choices=["both", "with", "without"], default="both",
+                        help="Ejecutar con search_value, sin él o ambos.")
+    parser.add_argument("--quadratic-limit", type=int, default=5000,
+                        help="Tamaño máximo para los algoritmos O(n²).")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--json", default=None, help="Ruta del archivo JSON de resultados.")
+    parser.add_argument("--csv", default=None, help="Ruta del archivo CSV de resultados.")
+    args = parser.parse_args(argv)
+
+    search_modes = {"both": (False, True), "with": (True,), "without": (False,)}[args.search]
+    results = run_benchmark(args.sizes, args.algorithms, args.keys, search_modes,
+                            args.quadratic_limit, args.repeat, args.seed, progress=_print_result)
+    metadata = {
+        "sizes": args.sizes,
+        "seed": args.seed,
+        "repeat": args.repeat,
+        "quadratic_limit": args.quadratic_limit,
+        "python": sys.version,
+        "platform": platform.platform(),
+        "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+    }
+    if args.json:
+        write_json(results, args.json, metadata)
+    if args.csv:
+        write_csv(results, args.csv)
+    return results
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,158 @@
+import datetime
+import re
+import unicodedata
+from collections.abc import Mapping
+
+_TOKEN_RE = re.compile(r"\w+")
+_YEAR_RE = re.compile(r"(?<!\d)(1[5-9]\d\d|2\d\d\d)(?!\d)")
+_ISO_DATE_RE = re.compile(r"(?<!\d)(\d{4})-(\d{1,2})(?:-(\d{1,2}))?(?!\d)")
+_DAY_RE = re.compile(r"(?<!\d)(\d{1,2})(?!\d)")
+# Meses en inglés y español, por nombre completo o abreviado
+_MONTHS = {name: number for number, names in enumerate((
+        "january jan enero ene", "february feb febrero", "march mar marzo", "april apr abril abr",
+        "may mayo", "june jun junio", "july jul julio", "august aug agosto ago",
+        "september sep sept septiembre setiembre", "october oct octubre",
+        "november nov noviembre", "december dec diciembre dic"), start=1) for name in names.split()}
+
+
+def fold_text(text):
+    """
+    Normaliza un texto para comparaciones: elimina tildes y diacríticos
+    (análisis -> analisis) y pasa a minúsculas con casefold.
+    """
+    decomposed = unicodedata.normalize("NFKD", str(text))
+    return "".join(c for c in decomposed if not unicodedata.combining(c)).casefold()
+
+
+def tokenize(text, fold=True):
+    """
+    Divide un texto en palabras, normalizándolo primero si fold es True.
+    """
+    return _TOKEN_RE.findall(fold_text(text) if fold else str(text))
+
+
+def publication_year(publication_date):
+    """
+    Año (entero) de una fecha de publicación: date/datetime (MySQL), texto
+    'AAAA-MM-DD' o 'AAAA' (JSON, RIS, BibTeX) o fechas de las páginas de las
+    fuentes como 'June 2020'. None si no contiene un año.
+    """
+    if isinstance(publication_date, (datetime.date, datetime.datetime)):
+        return publication_date.year
+    match = _YEAR_RE.search(str(publication_date or ""))
+    return int(match.group()) if match else None
+
+
+def publication_date(value):
+    """
+    Fecha (datetime.date) de una fecha de publicación en cualquiera de los
+    formatos de publication_year: 'AAAA-MM-DD', 'AAAA-MM', 'June 2020',
+    'First published May 2, 2019', '2 de mayo de 2019'... Si falta el día se
+    usa el 1 y si solo hay año, el 1 de enero. None si no contiene un año.
+    """
+    if isinstance(value, datetime.datetime):
+        return value.date()
+    if isinstance(value, datetime.date):
+        return value
+    text = str(value or "")
+    match = _ISO_DATE_RE.search(text)
+    if match:
+        year, month, day = int(match.group(1)), int(match.group(2)), int(match.group(3) or 1)
+        try:
+            return datetime.date(year, month, day)
+        except ValueError:
+            pass
+    year = publication_year(text)
+    if year is None:
+        return None
+    month = next((_MONTHS[word] for word in tokenize(text) if word in _MONTHS), None)
+    if month is None:
+        return datetime.date(year, 1, 1)
+    for day in _DAY_RE.findall(text):
+        try:
+            return datetime.date(year, month, int(day))
+        except ValueError:
+            pass
+    return datetime.date(year, month, 1)
+
+
+class SearchQuery:
+    """
+    Consulta de búsqueda con varios términos que se compila una sola vez y puede
+    pasarse como search_value a cualquier méthodo de SortingAlgorithms.
+
+    Cada término coincide con un registro cuando todas sus palabras aparecen en
+    los campos indicados (por defecto article_name y theme), sin distinguir
+    mayúsculas ni tildes si fold es True. La relevancia de un registro es el
+    número de términos que coinciden; la prioridad usada al ordenar es
+    len(terms) - relevancia, así que con un solo término se obtiene la misma
+    prioridad 0/1 que con un search_value de texto.
+
+    Las coincidencias son por palabras completas: "data" no coincide con
+    "database", a diferencia de la búsqueda por subcadena de un search_value de
+    texto.
+
+    Si fields es None, o si el registro no es un diccionario (ni otro Mapping,
+    como ArticleRow), se busca en str(key(registro)) como con search_value, o
+    en str(registro) si no hay key.
+    """
+
+    def __init__(self, terms, fields=("article_name", "theme"), fold=True):
+        if isinstance(terms, str):
+            terms = [terms]
+        self.fold = fold
+        self.fields = tuple(fields) if fields is not None else None
+        self.terms = [tuple(tokenize(term, fold)) for term in terms]
+        self.terms = [term for term in self.terms if term]
+        self._vocabulary = {token for term in self.terms for token in term}
+
+    def __repr__(self):
+        return f"SearchQuery({[' '.join(term) for term in self.terms]!r}, fields={self.fields!r})"
+
+    def _record_tokens(self, record, key):
+        if self.fields is None or not isinstance(record, Mapping):
+            return tokenize(key(record) if key is not None else record, self.fold)
+        tokens = []
+        for field in self.fields:
+            value = record.get(field)
+            if value is not None:
+                tokens.extend(tokenize(value, self.fold))
+        return tokens
+
+    def score(self, record, key=None):
+        """
+        Número de términos de la consulta presentes en un registro.
+        """
+        tokens = set(self._record_tokens(record, key))
+        return sum(1 for term in self.terms if all(token in tokens for token in term))
+
+    def scores(self, records, key=None):
+        """
+        Relevancia de cada registro de la colección. Se construye un índice
+        invertido palabra -> posiciones, limitado al vocabulario de la consulta,
+        y se cuentan los términos por intersección de sus listas de posiciones;
+        el costo es lineal en el tamaño del corpus.
+        """
+        index = {}
+        count = 0
+        for i, record in enumerate(records):
+            count += 1
+            for token in set(self._record_tokens(record, key)):
+                if token in self._vocabulary:
+                    index.setdefault(token, []).append(i)
+
+        result = [0] * count
+        for term in self.terms:
+            postings = [index.get(token) for token in term]
+            if not all(postings):
+                continue
+            matched = set(postings[0]).intersection(*postings[1:])
+            for i in matched:
+                result[i] += 1
+        return result
+
+    def priority(self, record, key=None):
+        return len(self.terms) - self.score(record, key)
+
+    def priorities(self, records, key=None):
+        return [len(self.terms) - score for score in self.scores(records, key)]
@@ -0,0 +1,234 @@
+import pickle
+from bisect import bisect_left, bisect_right, insort
+
+# Campos ordenables de la tabla articles, por nombre corto
+INDEXED_FIELDS = {
+    "title": "article_name",
+    "author": "author_name",
+    "date": "publication_date",
+    "theme": "theme",
+    "category": "category",
+}
+
+
+class SortedIndex:
+    """
+    Lista ordenada de entradas (clave, id) dividida en bloques de tamaño acotado.
+    Se busca el bloque con bisect sobre el máximo de cada bloque y luego la
+    posición dentro del bloque, por lo que insertar y eliminar cuestan
+    O(log n + load) en lugar de reordenar toda la colección.
+    """
+
+    def __init__(self, load=1000):
+        self._load = load
+        self._blocks = []
+        self._maxes = []
+        self._len = 0
+
+    @classmethod
+    def from_sorted(cls, entries, load=1000):
+        """
+        Construye el índice a partir de entradas ya ordenadas, sin reordenarlas.
+        """
+        index = cls(load)
+        entries = list(entries)
+        index._blocks = [entries[i:i + load] for i in range(0, len(entries), load)]
+        index._maxes = [block[-1] for block in index._blocks]
+        index._len = len(entries)
+        return index
+
+    def __len__(self):
+        return self._len
+
+    def __iter__(self):
+        for block in self._blocks:
+            yield from block
+
+    def insert(self, key, article_id):
+        entry = (key, article_id)
+        if not self._blocks:
+            self._blocks.append([entry])
+            self._maxes.append(entry)
+            self._len = 1
+            return
+        pos = bisect_left(self._maxes, entry)
+        if pos == len(self._maxes):
+            pos -= 1
+            self._blocks[pos].append(entry)
+            self._maxes[pos] = entry
+        else:
+            insort(self._blocks[pos], entry)
+        self._len += 1
+
+        block = self._blocks[pos]
+        if len(block) > 2 * self._load:
+            # Dividir el bloque para mantener acotado el costo de insort
+            self._blocks[pos:pos + 1] = [block[:self._load], block[self._load:]]
+            self._maxes[pos:pos + 1] = [block[self._load - 1], block[-1]]
+
+    def remove(self, key, article_id):
+        entry = (key, article_id)
+        pos = bisect_left(self._maxes, entry)
+        if pos == len(self._maxes):
+            raise KeyError(entry)
+        block = self._blocks[pos]
+        i = bisect_left(block, entry)
+        if i == len(block) or block[i] != entry:
+            raise KeyError(entry)
+        del block[i]
+        self._len -= 1
+        if block:
+            self._maxes[pos] = block[-1]
+        else:
+            del self._blocks[pos]
+            del self._maxes[pos]
+
+    def irange(self, minimum=None, maximum=None):
+        """
+        Retorna las entradas cuya clave está entre minimum y maximum (ambos
+        inclusive). Un límite en None no restringe ese extremo.
+        """
+        if minimum is None:
+            pos, i = 0, 0
+        else:
+            # (minimum,) es menor que cualquier (minimum, id)
+            pos = bisect_left(self._maxes, (minimum,))
+            i = bisect_left(self._blocks[pos], (minimum,)) if pos < len(self._blocks) else 0
+        while pos < len(self._blocks):
+            block = self._blocks[pos]
+            if maximum is not None and block[-1][0] > maximum:
+                end = bisect_right(block, maximum, lo=i, key=_entry_key)
+                yield from block[i:end]
+                return
+            yield from block[i:]
+            pos += 1
+            i = 0
+
+    def prefix(self, prefix):
+        """
+        Retorna las entradas cuya clave (texto) comienza con prefix.
+        """
+        for entry in self.irange(prefix):
+            if not entry[0].startswith(prefix):
+                return
+            yield entry
+
+
+def _entry_key(entry):
+    return entry[0]
+
+
+class ArticleIndex:
+    """
+    Índices ordenados persistentes sobre los campos de los artículos, que se
+    mantienen de forma incremental al insertar, eliminar o actualizar registros.
+    Los artículos que no tienen un campo (o lo tienen en None) no se indexan
+    por ese campo.
+    """
+
+    FORMAT_VERSION = 1
+
+    def __init__(self, fields=None, load=1000):
+        self.fields = dict(INDEXED_FIELDS if fields is None else {name: INDEXED_FIELDS[name] for name in fields})
+        self.load = load
+        self.articles = {}
+        self.indexes = {name: SortedIndex(load) for name in self.fields}
+
+    def __len__(self):
+        return len(self.articles)
+
+    def __contains__(self, article_id):
+        return article_id in self.articles
+
+    def get(self, article_id):
+        return self.articles.get(article_id)
+
+    def insert(self, article):
+        """
+        Inserta una copia del artículo; si su id ya existe se actualizan sus
+        claves. Los cambios posteriores del diccionario del llamador no afectan
+        al índice.
+        """
+        article = dict(article)
+        article_id = article["id"]
+        if article_id in self.articles:
+            self.delete(article_id)
+        self.articles[article_id] = article
+        for name, column in self.fields.items():
+            value = article.get(column)
+            if value is not None:
+                self.indexes[name].insert(value, article_id)
+
+    def delete(self, article_id):
+        article = self.articles.pop(article_id)
+        for name, column in self.fields.items():
+            value = article.get(column)
+            if value is not None:
+                self.indexes[name].remove(value, article_id)
+        return article
+
+    def update(self, article_id, **changes):
+        """
+        Actualiza campos de un artículo; solo se reubican las entradas de los
+        índices cuyos campos cambiaron. Retorna el artículo actualizado, que es
+        una copia nueva: los diccionarios retornados antes no se modifican.
+        """
+        article = dict(self.articles[article_id])
+        self.articles[article_id] = article
+        for column, new_value in changes.items():
+            old_value = article.get(column)
+            for name, indexed_column in self.fields.items():
+                if indexed_column != column or old_value == new_value:
+                    continue
+                if old_value is not None:
+                    self.indexes[name].remove(old_value, article_id)
+                if new_value is not None:
+                    self.indexes[name].insert(new_value, article_id)
+            article[column] = new_value
+        return article
+
+    def sorted(self, field):
+        """
+        Retorna los artículos ordenados por field (y luego por id).
+        """
+        return (self.articles[article_id] for _, article_id in self.indexes[field])
+
+    def range(self, field, minimum=None, maximum=None):
+        """
+        Retorna los artículos con minimum <= field <= maximum, en orden. Por
+        ejemplo range("date", date(2015, 1, 1), date(2019, 12, 31)).
+        """
+        return (self.articles[article_id] for _, article_id in self.indexes[field].irange(minimum, maximum))
+
+    def prefix_search(self, prefix, field="title"):
+        return (self.articles[article_id] for _, article_id in self.indexes[field].prefix(prefix))
+
+    def save(self, filename):
+        """
+        Guarda los artículos y las entradas ya ordenadas de cada índice, para
+        que load() reconstruya los índices sin volver a ordenar.
+        """
+        state = {
+            "version": self.FORMAT_VERSION,
+            "fields": self.fields,
+            "load": self.load,
+            "articles": self.articles,
+            "entries": {name: list(index) for name, index in self.indexes.items()},
+        }
+        with open(filename, "wb") as f:
+            pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, filename):
+        with open(filename, "rb") as f:
+            state = pickle.load(f)
+        if state.get("version") != cls.FORMAT_VERSION:
+            raise ValueError(f"Versión de índice no soportada: {state.get('version')}")
+        index = cls.__new__(cls)
+        index.fields = state["fields"]
+        index.load = state["load"]
+        index.articles = state["articles"]
+        index.indexes = {
+            name: SortedIndex.from_sorted(entries, index.load) for name, entries in state["entries"].items()
+        }
+        return index
@@ -1,4 +1,97 @@
+import datetime
+import heapq
+import json
+import math
+import os
+import pickle
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from operator import itemgetter
+
+from sorting_algorithms.search import SearchQuery
+
+try:
+    import numpy as np
+except ImportError:
+    # Sin NumPy, los métodos de distribución usan la implementación en Python puro
+    np = None
+
+
+def _iter_jsonl(filename):
+    """
+    Lee un archivo JSON Lines y retorna cada línea no vacía como diccionario.
+    """
+    with open(filename, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield json.loads(line)
+
+
+def _read_run(run):
+    """
+    Lee secuencialmente los pares (clave, registro) de un archivo temporal de run.
+    """
+    with run:
+        run.seek(0)
+        while True:
+            try:
+                yield pickle.load(run)
+            except EOFError:
+                return
+
+
+def _bitonic_greater(a, b):
+    """
+    Compara dos pares (clave, índice) de bitonic_sort. El relleno (índice -1)
+    es mayor que cualquier par real y nunca se compara con su clave, que puede
+    ser de cualquier tipo.
+    """
+    if a[1] < 0:
+        return b[1] >= 0
+    if b[1] < 0:
+        return False
+    return a[0] > b[0]
+
+
+def _identity(x):
+    # Clave por defecto de parallel_sort: a diferencia de lambda x: x, se puede
+    # enviar a los procesos trabajadores
+    return x
+
+
+class FieldKey:
+    """
+    Función clave serializable que extrae un campo de un registro. A diferencia
+    de una lambda, puede enviarse a los procesos de parallel_sort.
+    """
+
+    def __init__(self, field):
+        self.field = field
+
+    def __call__(self, record):
+        return record[self.field]
+
+    def __repr__(self):
+        return f"FieldKey({self.field!r})"
+
+
+def _sort_chunk(algorithm, chunk, key, search_value, offset):
+    """
+    Ordena un fragmento en un proceso trabajador y retorna los pares
+    (clave, índice global) en orden, listos para la mezcla en el proceso padre.
+    """
+    sorter = SortingAlgorithms()
+    effective_key = sorter._get_effective_key(key, search_value)
+    keys = [effective_key(x) for x in chunk]
+    order = getattr(sorter, algorithm)(list(range(len(chunk))), key=keys.__getitem__)
+    return [(keys[i], offset + i) for i in order]
+
+
 class SortingAlgorithms:
+    # Métodos que admiten el modo paralelo de parallel_sort
+    PARALLEL_ALGORITHMS = ("tim_sort", "quick_sort", "heap_sort")
+
     def __init__(self):
         pass
 
@@ -7,9 +100,16 @@ class SortingAlgorithms:
         Retorna una función clave que, si search_value se proporciona,
         genera una tupla (prioridad, valor) donde prioridad es 0 si el string
         del valor contiene search_value, y 1 en caso contrario.
+        Si search_value es un SearchQuery, la prioridad es la que calcula la
+        consulta (menor cuantos más términos coinciden).
         """
         if search_value is None:
             return key
+        elif isinstance(search_value, SearchQuery):
+            def new_key(x):
+                return (search_value.priority(x, key), key(x))
+
+            return new_key
         else:
             search_str = str(search_value)
 
@@ -22,6 +122,67 @@ class SortingAlgorithms:
 
             return new_key
 
+    def _decorate(self, arr, key, search_value):
+        """
+        Calcula la clave efectiva de cada registro una sola vez y retorna una
+        lista de pares (clave, índice). Los algoritmos comparan y mueven estos
+        pares en lugar de volver a invocar la función clave en cada comparación.
+        Con un SearchQuery las prioridades se calculan en bloque sobre el índice
+        invertido de la consulta.
+        """
+        if isinstance(search_value, SearchQuery):
+            priorities = search_value.priorities(arr, key)
+            return [((priority, key(x)), i) for i, (priority, x) in enumerate(zip(priorities, arr))]
+        effective_key = self._get_effective_key(key, search_value)
+        return [(effective_key(x), i) for i, x in enumerate(arr)]
+
+    def _undecorate(self, arr, pairs):
+        """
+        Reconstruye la lista de registros siguiendo el orden de los pares.
+        """
+        return [arr[i] for _, i in pairs]
+
+    def _numeric_value(self, k):
+        # Utiliza el valor numérico real (segundo elemento en la tupla si aplica);
+        # las fechas se convierten a su ordinal para poder operar con ellas
+        value = k[1] if isinstance(k, tuple) else k
+        if isinstance(value, datetime.date):
+            return value.toordinal()
+        return value
+
+    def _numeric_array(self, values, kinds="iu"):
+        """
+        Convierte los valores a un arreglo de NumPy. Retorna None si NumPy no está
+        disponible o si los valores no son de uno de los tipos indicados en kinds
+        ("i"/"u" enteros, "f" flotantes), para recurrir a la versión en Python puro.
+        """
+        if np is None:
+            return None
+        try:
+            array = np.asarray(values)
+        except (OverflowError, ValueError):
+            return None
+        if array.ndim != 1 or array.dtype.kind not in kinds:
+            return None
+        return array
+
+    def _radix_order(self, keys):
+        """
+        Permutación estable que ordena un arreglo de enteros mediante pasadas LSD
+        por bytes. Los valores se desplazan restando el mínimo, por lo que se
+        admiten números negativos.
+        """
+        offsets = keys.astype(np.uint64) - keys.min().astype(np.uint64)
+        max_offset = int(offsets.max())
+        order = np.arange(len(keys))
+        shift = 0
+        while max_offset >> shift:
+            digits = ((offsets[order] >> np.uint64(shift)) & np.uint64(0xFF)).astype(np.uint8)
+            # argsort estable sobre uint8 es un conteo por dígito
+            order = order[np.argsort(digits, kind="stable")]
+            shift += 8
+        return order
+
     # 1. TimSort (usa el sorted() nativo de Python que utiliza TimSort)
     def tim_sort(self, arr, key=lambda x: x, search_value=None):
         effective_key = self._get_effective_key(key, search_value)
@@ -29,8 +190,8 @@ class SortingAlgorithms:
 
     # 2. Comb Sort
     def comb_sort(self, arr, key=lambda x: x, search_value=None):
-        effective_key = self._get_effective_key(key, search_value)
-        n = len(arr)
+        pairs = self._decorate(arr, key, search_value)
+        n = len(pairs)
         gap = n
         shrink = 1.3
         sorted_flag = False
@@ -42,225 +203,361 @@ class SortingAlgorithms:
                 sorted_flag = True
             i = 0
             while i + gap < n:
-                if effective_key(arr[i]) > effective_key(arr[i + gap]):
-                    arr[i], arr[i + gap] = arr[i + gap], arr[i]
+                if pairs[i][0] > pairs[i + gap][0]:
+                    pairs[i], pairs[i + gap] = pairs[i + gap], pairs[i]
                     sorted_flag = False
                 i += 1
+        arr[:] = self._undecorate(arr, pairs)
         return arr
 
     # 3. Selection Sort
     def selection_sort(self, arr, key=lambda x: x, search_value=None):
-        effective_key = self._get_effective_key(key, search_value)
-        for i in range(len(arr)):
+        pairs = self._decorate(arr, key, search_value)
+        for i in range(len(pairs)):
             min_idx = i
-            for j in range(i + 1, len(arr)):
-                if effective_key(arr[j]) < effective_key(arr[min_idx]):
+            for j in range(i + 1, len(pairs)):
+                if pairs[j][0] < pairs[min_idx][0]:
                     min_idx = j
-            arr[i], arr[min_idx] = arr[min_idx], arr[i]
+            pairs[i], pairs[min_idx] = pairs[min_idx], pairs[i]
+        arr[:] = self._undecorate(arr, pairs)
         return arr
 
-    # 4. Tree Sort (utilizando un árbol binario de búsqueda)
+    # 4. Tree Sort (utilizando un árbol AVL, balanceado e iterativo)
     class _TreeNode:
+        __slots__ = ("value", "left", "right", "height")
+
         def __init__(self, value):
             self.value = value
             self.left = None
             self.right = None
-
-    def _insert_tree(self, root, value, effective_key):
+            self.height = 1
+
+    @staticmethod
+    def _tree_height(node):
+        return node.height if node is not None else 0
+
+    def _update_tree_height(self, node):
+        node.height = 1 + max(self._tree_height(node.left), self._tree_height(node.right))
+
+    def _rotate_tree_right(self, node):
+        pivot = node.left
+        node.left = pivot.right
+        pivot.right = node
+        self._update_tree_height(node)
+        self._update_tree_height(pivot)
+        return pivot
+
+    def _rotate_tree_left(self, node):
+        pivot = node.right
+        node.right = pivot.left
+        pivot.left = node
+        self._update_tree_height(node)
+        self._update_tree_height(pivot)
+        return pivot
+
+    def _rebalance_tree(self, node):
+        # Las rotaciones conservan el recorrido inorden, y con él la estabilidad
+        self._update_tree_height(node)
+        balance = self._tree_height(node.left) - self._tree_height(node.right)
+        if balance > 1:
+            if self._tree_height(node.left.left) < self._tree_height(node.left.right):
+                node.left = self._rotate_tree_left(node.left)
+            return self._rotate_tree_right(node)
+        if balance < -1:
+            if self._tree_height(node.right.right) < self._tree_height(node.right.left):
+                node.right = self._rotate_tree_right(node.right)
+            return self._rotate_tree_left(node)
+        return node
+
+    def _insert_tree(self, root, value):
+        # Cada nodo guarda un par (clave, índice); se compara solo la clave y los
+        # empates van a la derecha para conservar el orden de llegada.
+        new_node = self._TreeNode(value)
         if root is None:
-            return self._TreeNode(value)
-        if effective_key(value) < effective_key(root.value):
-            root.left = self._insert_tree(root.left, value, effective_key)
+            return new_node
+        path = []
+        node = root
+        while node is not None:
+            path.append(node)
+            node = node.left if value[0] < node.value[0] else node.right
+        parent = path[-1]
+        if value[0] < parent.value[0]:
+            parent.left = new_node
         else:
-            root.right = self._insert_tree(root.right, value, effective_key)
+            parent.right = new_node
+
+        # Rebalancear desde la hoja hasta la raíz sin recursión
+        for depth in range(len(path) - 1, -1, -1):
+            node = path[depth]
+            balanced = self._rebalance_tree(node)
+            if depth == 0:
+                root = balanced
+            elif path[depth - 1].left is node:
+                path[depth - 1].left = balanced
+            else:
+                path[depth - 1].right = balanced
         return root
 
     def _inorder_tree(self, root, result):
-        if root:
-            self._inorder_tree(root.left, result)
-            result.append(root.value)
-            self._inorder_tree(root.right, result)
+        stack = []
+        node = root
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            result.append(node.value)
+            node = node.right
 
     def tree_sort(self, arr, key=lambda x: x, search_value=None):
-        effective_key = self._get_effective_key(key, search_value)
+        pairs = self._decorate(arr, key, search_value)
         root = None
-        for item in arr:
-            root = self._insert_tree(root, item, effective_key)
+        for pair in pairs:
+            root = self._insert_tree(root, pair)
         result = []
         self._inorder_tree(root, result)
-        return result
+        return self._undecorate(arr, result)
 
     # 5. Pigeonhole Sort (para datos numéricos)
     def pigeonhole_sort(self, arr, key=lambda x: x, search_value=None):
-        effective_key = self._get_effective_key(key, search_value)
+        pairs = self._decorate(arr, key, search_value)
+        if not pairs:
+            return []
         # Se asume que los valores extraídos son numéricos
-        values = [effective_key(x)[1] if isinstance(effective_key(x), tuple) else effective_key(x) for x in arr]
+        values = [self._numeric_value(k) for k, _ in pairs]
+        keys = self._numeric_array(values)
+        if keys is not None:
+            # No se reservan max-min+1 listas: si el rango cabe en 16 bits, el
+            # argsort estable de NumPy sobre uint16 es un conteo por casillero;
+            # para identificadores dispersos se usan pasadas de radix por bytes.
+            offsets = keys.astype(np.uint64) - keys.min().astype(np.uint64)
+            if int(offsets.max()) < 1 << 16:
+                order = np.argsort(offsets.astype(np.uint16), kind="stable")
+            else:
+                order = self._radix_order(keys)
+            return [arr[i] for i in order.tolist()]
         min_val = min(values)
         max_val = max(values)
         size = max_val - min_val + 1
 
         # Crear "pigeonholes"
         holes = [[] for _ in range(size)]
-        for item in arr:
-            # Utiliza el valor numérico real (segundo elemento en la tupla si aplica)
-            val = effective_key(item)
-            if isinstance(val, tuple):
-                actual_val = val[1]
-            else:
-                actual_val = val
-            holes[actual_val - min_val].append(item)
+        for pair, actual_val in zip(pairs, values):
+            holes[actual_val - min_val].append(pair)
 
-        sorted_arr = []
+        sorted_pairs = []
         for hole in holes:
-            sorted_arr.extend(hole)
-        return sorted_arr
+            sorted_pairs.extend(hole)
+        return self._undecorate(arr, sorted_pairs)
 
     # 6. Bucket Sort (para datos numéricos; asume distribución uniforme)
     def bucket_sort(self, arr, key=lambda x: x, search_value=None):
-        effective_key = self._get_effective_key(key, search_value)
         if not arr:
             return arr
+        pairs = self._decorate(arr, key, search_value)
         # Obtener valores numéricos, asumiendo que son numéricos
-        values = [effective_key(x)[1] if isinstance(effective_key(x), tuple) else effective_key(x) for x in arr]
+        values = [self._numeric_value(k) for k, _ in pairs]
+        keys = self._numeric_array(values, kinds="iuf")
+        if keys is not None:
+            scaled = keys.astype(np.float64)
+            min_val, max_val = scaled.min(), scaled.max()
+            bucket_count = len(arr)
+            bucket_index = ((scaled - min_val) / (max_val - min_val + 1e-9) * (bucket_count - 1)).astype(np.int64)
+            # Dentro de cada cubeta se ordena por la clave efectiva: prioridad de
+            # búsqueda (si la hay) y luego el valor. lexsort es estable.
+            priorities = np.array([k[0] if isinstance(k, tuple) else 0 for k, _ in pairs])
+            order = np.lexsort((keys, priorities, bucket_index))
+            return [arr[i] for i in order.tolist()]
         min_val, max_val = min(values), max(values)
         bucket_count = len(arr)
         buckets = [[] for _ in range(bucket_count)]
 
-        for item in arr:
-            val = effective_key(item)
-            if isinstance(val, tuple):
-                actual_val = val[1]
-            else:
-                actual_val = val
+        for pair, actual_val in zip(pairs, values):
             # Normalizar el índice
             norm_index = int(((actual_val - min_val) / (max_val - min_val + 1e-9)) * (bucket_count - 1))
-            buckets[norm_index].append(item)
+            buckets[norm_index].append(pair)
 
-        sorted_arr = []
+        sorted_pairs = []
         for bucket in buckets:
-            sorted_arr.extend(sorted(bucket, key=effective_key))
-        return sorted_arr
+            sorted_pairs.extend(sorted(bucket, key=itemgetter(0)))
+        return self._undecorate(arr, sorted_pairs)
+
+    # 7. Quick Sort (introsort iterativo y en el lugar)
+    _QUICK_SORT_CUTOFF = 16
+
+    def _insertion_sort_pairs(self, pairs, lo, hi):
+        # Compara el par completo, por lo que los empates quedan por índice
+        for i in range(lo + 1, hi + 1):
+            pair = pairs[i]
+            j = i - 1
+            while j >= lo and pairs[j] > pair:
+                pairs[j + 1] = pairs[j]
+                j -= 1
+            pairs[j + 1] = pair
+
+    def _quick_sort_pairs(self, pairs):
+        """
+        Ordena los pares (clave, índice) en el lugar con una pila explícita:
+        pivote mediana de tres, partición en tres vías (menores, iguales, mayores)
+        e inserción para segmentos pequeños. Si la profundidad supera 2·log2(n)
+        el segmento se ordena con heapsort, como en introsort.
+
+        Las claves iguales siempre terminan en el mismo bloque central, que se
+        reordena por índice; así el resultado es estable como el de tim_sort.
+        """
+        n = len(pairs)
+        if n < 2:
+            return pairs
+        stack = [(0, n - 1, 2 * int(math.log2(n)))]
+        while stack:
+            lo, hi, depth = stack.pop()
+            while lo < hi:
+                if hi - lo < self._QUICK_SORT_CUTOFF:
+                    self._insertion_sort_pairs(pairs, lo, hi)
+                    break
+                if depth == 0:
+                    segment = pairs[lo:hi + 1]
+                    heapq.heapify(segment)
+                    pairs[lo:hi + 1] = [heapq.heappop(segment) for _ in range(len(segment))]
+                    break
+                depth -= 1
+
+                pivot = sorted((pairs[lo][0], pairs[(lo + hi) // 2][0], pairs[hi][0]))[1]
+                lt, i, gt = lo, lo, hi
+                while i <= gt:
+                    k = pairs[i][0]
+                    if k < pivot:
+                        pairs[lt], pairs[i] = pairs[i], pairs[lt]
+                        lt += 1
+                        i += 1
+                    elif k > pivot:
+                        pairs[i], pairs[gt] = pairs[gt], pairs[i]
+                        gt -= 1
+                    else:
+                        i += 1
+                if gt > lt:
+                    pairs[lt:gt + 1] = sorted(pairs[lt:gt + 1], key=itemgetter(1))
+
+                # Se apila el lado mayor y se continúa con el menor: pila O(log n)
+                if lt - lo < hi - gt:
+                    stack.append((gt + 1, hi, depth))
+                    hi = lt - 1
+                else:
+                    stack.append((lo, lt - 1, depth))
+                    lo = gt + 1
+        return pairs
 
-    # 7. Quick Sort
     def quick_sort(self, arr, key=lambda x: x, search_value=None):
-        effective_key = self._get_effective_key(key, search_value)
         if len(arr) <= 1:
             return arr
-        pivot = effective_key(arr[len(arr) // 2])
-        left = [x for x in arr if effective_key(x) < pivot]
-        middle = [x for x in arr if effective_key(x) == pivot]
-        right = [x for x in arr if effective_key(x) > pivot]
-        return self.quick_sort(left, key, search_value) + middle + self.quick_sort(right, key, search_value)
+        pairs = self._decorate(arr, key, search_value)
+        return self._undecorate(arr, self._quick_sort_pairs(pairs))
 
     # 8. Heap Sort
     def heap_sort(self, arr, key=lambda x: x, search_value=None):
-        effective_key = self._get_effective_key(key, search_value)
-        import heapq
-        heap = [(effective_key(x), x) for x in arr]
+        # Los pares (clave, índice) resuelven los empates por posición original,
+        # por lo que nunca se comparan los registros entre sí.
+        heap = self._decorate(arr, key, search_value)
         heapq.heapify(heap)
-        return [heapq.heappop(heap)[1] for _ in range(len(heap))]
+        return self._undecorate(arr, [heapq.heappop(heap) for _ in range(len(heap))])
 
-    # 9. Bitonic Sort (asume longitud potencia de 2; se extiende la lista si es necesario)
+    # 9. Bitonic Sort (red iterativa; se extiende la lista hasta una potencia de 2)
     def bitonic_sort(self, arr, key=lambda x: x, search_value=None):
-        effective_key = self._get_effective_key(key, search_value)
-
-        def compare_and_swap(a, i, j, direction):
-            if (direction == 1 and effective_key(a[i]) > effective_key(a[j])) or \
-                    (direction == 0 and effective_key(a[i]) < effective_key(a[j])):
-                a[i], a[j] = a[j], a[i]
-
-        def bitonic_merge(a, low, cnt, direction):
-            if cnt > 1:
-                k = cnt // 2
-                for i in range(low, low + k):
-                    compare_and_swap(a, i, i + k, direction)
-                bitonic_merge(a, low, k, direction)
-                bitonic_merge(a, low + k, k, direction)
-
-        def _bitonic_sort(a, low, cnt, direction):
-            if cnt > 1:
-                k = cnt // 2
-                _bitonic_sort(a, low, k, 1)
-                _bitonic_sort(a, low + k, k, 0)
-                bitonic_merge(a, low, cnt, direction)
-
-        import math
-        n = len(arr)
+        pairs = self._decorate(arr, key, search_value)
+        n = len(pairs)
+        if n <= 1:
+            return list(arr)
         power = 2 ** math.ceil(math.log2(n))
-        extended = list(arr) + [arr[-1]] * (power - n)
-        _bitonic_sort(extended, 0, power, 1)
-        return extended[:n]
+        # El relleno se marca con índice -1 y queda al final (ver _bitonic_greater)
+        extended = pairs + [(None, -1)] * (power - n)
+
+        size = 2
+        while size <= power:
+            step = size // 2
+            while step > 0:
+                for i in range(power):
+                    j = i ^ step
+                    if j > i:
+                        ascending = (i & size) == 0
+                        if (ascending and _bitonic_greater(extended[i], extended[j])) or \
+                                (not ascending and _bitonic_greater(extended[j], extended[i])):
+                            extended[i], extended[j] = extended[j], extended[i]
+                step //= 2
+            size *= 2
+        return self._undecorate(arr, extended[:n])
 
     # 10. Gnome Sort
     def gnome_sort(self, arr, key=lambda x: x, search_value=None):
-        effective_key = self._get_effective_key(key, search_value)
+        pairs = self._decorate(arr, key, search_value)
         index = 0
-        while index < len(arr):
-            if index == 0 or effective_key(arr[index]) >= effective_key(arr[index - 1]):
+        while index < len(pairs):
+            if index == 0 or pairs[index][0] >= pairs[index - 1][0]:
                 index += 1
             else:
-                arr[index], arr[index - 1] = arr[index - 1], arr[index]
+                pairs[index], pairs[index - 1] = pairs[index - 1], pairs[index]
                 index -= 1
+        arr[:] = self._undecorate(arr, pairs)
         return arr
 
     # 11. Binary Insertion Sort
     def binary_insertion_sort(self, arr, key=lambda x: x, search_value=None):
-        effective_key = self._get_effective_key(key, search_value)
+        pairs = self._decorate(arr, key, search_value)
 
-        def binary_search(sub_arr, item, start, end):
+        def binary_search(sub_arr, item_key, start, end):
             if start == end:
-                return start if effective_key(item) < effective_key(sub_arr[start]) else start + 1
+                return start if item_key < sub_arr[start][0] else start + 1
             if start > end:
                 return start
             mid = (start + end) // 2
-            if effective_key(item) == effective_key(sub_arr[mid]):
+            if item_key == sub_arr[mid][0]:
                 return mid
-            elif effective_key(item) < effective_key(sub_arr[mid]):
-                return binary_search(sub_arr, item, start, mid - 1)
+            elif item_key < sub_arr[mid][0]:
+                return binary_search(sub_arr, item_key, start, mid - 1)
             else:
-                return binary_search(sub_arr, item, mid + 1, end)
+                return binary_search(sub_arr, item_key, mid + 1, end)
 
-        for i in range(1, len(arr)):
-            val = arr[i]
-            j = binary_search(arr, val, 0, i - 1)
-            arr = arr[:j] + [val] + arr[j:i] + arr[i + 1:]
-        return arr
+        for i in range(1, len(pairs)):
+            val = pairs[i]
+            j = binary_search(pairs, val[0], 0, i - 1)
+            pairs = pairs[:j] + [val] + pairs[j:i] + pairs[i + 1:]
+        return self._undecorate(arr, pairs)
 
-    # 12. Radix Sort (para números enteros no negativos)
+    # 12. Radix Sort (para números enteros; negativos solo con NumPy)
     def radix_sort(self, arr, key=lambda x: x, search_value=None):
-        # Para Radix Sort asumimos que los elementos son enteros no negativos;
-        # el parámetro key se usa para extraer el valor numérico.
-        effective_key = self._get_effective_key(key, search_value)
-
+        # Para Radix Sort asumimos que los elementos son enteros (o fechas); con
+        # NumPy se ordena por bytes sobre un arreglo, sin él en base 10 y solo
+        # para valores no negativos. El parámetro key extrae el valor numérico.
         def get_digit(n, d):
             return (n // 10 ** d) % 10
 
-        values = [effective_key(x)[1] if isinstance(effective_key(x), tuple) else effective_key(x) for x in arr]
-        if not values:
+        pairs = self._decorate(arr, key, search_value)
+        if not pairs:
             return arr
-        max_val = max(values)
+        keys = self._numeric_array([self._numeric_value(k) for k, _ in pairs])
+        if keys is not None:
+            return [arr[i] for i in self._radix_order(keys).tolist()]
+        # Cada entrada guarda (valor numérico, par) para no recalcular la clave
+        output = [(self._numeric_value(k), (k, i)) for k, i in pairs]
+        max_val = max(val for val, _ in output)
         exp = 0
-        output = list(arr)
         while 10 ** exp <= max_val:
             buckets = [[] for _ in range(10)]
-            for item in output:
-                # Obtener el valor numérico
-                val = effective_key(item)
-                actual_val = val[1] if isinstance(val, tuple) else val
-                digit = get_digit(actual_val, exp)
-                buckets[digit].append(item)
-            output = [item for bucket in buckets for item in bucket]
+            for entry in output:
+                digit = get_digit(entry[0], exp)
+                buckets[digit].append(entry)
+            output = [entry for bucket in buckets for entry in bucket]
             exp += 1
-        return output
+        return self._undecorate(arr, [pair for _, pair in output])
 
     # 13. Metodo Burbuja
     def bubble_sort(self, arr, key=lambda x: x, search_value=None):
-        effective_key = self._get_effective_key(key, search_value)
-        n = len(arr)
+        pairs = self._decorate(arr, key, search_value)
+        n = len(pairs)
         for i in range(n):
             for j in range(0, n - i - 1):
-                if effective_key(arr[j]) > effective_key(arr[j + 1]):
-                    arr[j], arr[j + 1] = arr[j + 1], arr[j]
+                if pairs[j][0] > pairs[j + 1][0]:
+                    pairs[j], pairs[j + 1] = pairs[j + 1], pairs[j]
+        arr[:] = self._undecorate(arr, pairs)
         return arr
 
     # Méthodo: Double Bubble Sort (Cocktail Shaker Sort)
@@ -269,8 +566,8 @@ class SortingAlgorithms:
         Implementa el méthodo doble burbuja (Cocktail Shaker Sort) que
         recorre el arreglo en ambas direcciones en cada iteración.
         """
-        effective_key = self._get_effective_key(key, search_value)
-        n = len(arr)
+        pairs = self._decorate(arr, key, search_value)
+        n = len(pairs)
         start = 0
         end = n - 1
         swapped = True
@@ -278,8 +575,8 @@ class SortingAlgorithms:
             swapped = False
             # Recorrido de izquierda a derecha
             for i in range(start, end):
-                if effective_key(arr[i]) > effective_key(arr[i + 1]):
-                    arr[i], arr[i + 1] = arr[i + 1], arr[i]
+                if pairs[i][0] > pairs[i + 1][0]:
+                    pairs[i], pairs[i + 1] = pairs[i + 1], pairs[i]
                     swapped = True
             if not swapped:
                 break
@@ -288,9 +585,130 @@ class SortingAlgorithms:
             end -= 1
             # Recorrido de derecha a izquierda
             for i in range(end, start, -1):
-                if effective_key(arr[i - 1]) > effective_key(arr[i]):
-                    arr[i], arr[i - 1] = arr[i - 1], arr[i]
+                if pairs[i - 1][0] > pairs[i][0]:
+                    pairs[i], pairs[i - 1] = pairs[i - 1], pairs[i]
                     swapped = True
             start += 1
+        arr[:] = self._undecorate(arr, pairs)
         return arr
 
+    # Top-k y paginación sin ordenar la lista completa
+    def top_k(self, arr, k, key=lambda x: x, search_value=None):
+        """
+        Retorna los primeros k registros en el orden de tim_sort usando un heap
+        acotado de tamaño k: O(n log k) en lugar de ordenar toda la lista.
+        Los empates se resuelven por la posición original, por lo que el
+        resultado es idéntico a tim_sort(arr, key, search_value)[:k].
+        """
+        if k <= 0:
+            return []
+        if k >= len(arr):
+            return self.tim_sort(arr, key=key, search_value=search_value)
+        effective_key = self._get_effective_key(key, search_value)
+        pairs = heapq.nsmallest(k, ((effective_key(x), i) for i, x in enumerate(arr)))
+        return self._undecorate(arr, pairs)
+
+    def sorted_page(self, arr, offset, limit, key=lambda x: x, search_value=None):
+        """
+        Retorna la página [offset, offset + limit) del resultado ordenado, igual
+        a tim_sort(arr, key, search_value)[offset:offset + limit].
+        """
+        if offset < 0 or limit < 0:
+            raise ValueError("offset y limit deben ser no negativos")
+        return self.top_k(arr, offset + limit, key=key, search_value=search_value)[offset:]
+
+    # Ordenamiento externo para colecciones que no caben en memoria
+    def external_sort(self, source, key=lambda x: x, search_value=None, algorithm="tim_sort",
+                      run_size=100000, output=None, tmp_dir=None):
+        """
+        Ordena una colección arbitrariamente grande de registros. source puede ser
+        un iterable de diccionarios o la ruta de un archivo JSON Lines.
+
+        Los registros se leen en runs de a lo sumo run_size elementos, cada run se
+        ordena en memoria con el méthodo indicado en algorithm y se guarda en un
+        archivo temporal binario (pickle) como pares (clave, registro). Finalmente
+        los runs se mezclan con heapq.merge, que respeta el orden de los runs en
+        caso de empate, por lo que el resultado es estable si el algoritmo lo es.
+
+        Si output es None retorna un generador de registros ordenados; en caso
+        contrario escribe los registros en output como JSON Lines y retorna la ruta.
+        """
+        method = getattr(self, algorithm)
+        effective_key = self._get_effective_key(key, search_value)
+        records = _iter_jsonl(source) if isinstance(source, str) else iter(source)
+
+        runs = []
+        chunk = []
+        for record in records:
+            chunk.append(record)
+            if len(chunk) >= run_size:
+                runs.append(self._spill_run(chunk, method, effective_key, tmp_dir))
+                chunk = []
+        if chunk or not runs:
+            runs.append(self._spill_run(chunk, method, effective_key, tmp_dir))
+
+        merged = (record for _, record in heapq.merge(*[_read_run(run) for run in runs], key=itemgetter(0)))
+        if output is None:
+            return merged
+        with open(output, "w", encoding="utf-8") as f:
+            for record in merged:
+                f.write(json.dumps(record, ensure_ascii=False, default=str))
+                f.write("\n")
+        return output
+
+    def _spill_run(self, chunk, method, effective_key, tmp_dir):
+        """
+        Ordena un run en memoria y lo escribe en un archivo temporal que se
+        elimina automáticamente al cerrarse.
+        """
+        keys = [effective_key(x) for x in chunk]
+        # Se ordenan índices con las claves ya calculadas (search_value ya aplicado)
+        order = method(list(range(len(chunk))), key=keys.__getitem__)
+        run = tempfile.TemporaryFile(dir=tmp_dir)
+        for i in order:
+            pickle.dump((keys[i], chunk[i]), run, protocol=pickle.HIGHEST_PROTOCOL)
+        return run
+
+    # Ordenamiento paralelo por fragmentos con un pool de procesos
+    def parallel_sort(self, arr, algorithm="tim_sort", key=_identity, search_value=None,
+                      workers=None, chunk_size=None):
+        """
+        Divide arr en fragmentos, ordena cada uno en un ProcessPoolExecutor con el
+        méthodo indicado (tim_sort, quick_sort o heap_sort) y mezcla los fragmentos
+        en el proceso padre con heapq.merge.
+
+        key debe ser serializable con pickle (por ejemplo FieldKey("article_name")
+        o una función definida a nivel de módulo), no una lambda. Los empates se
+        resuelven por la posición original, por lo que el resultado es idéntico al
+        de la versión secuencial. Con un solo trabajador o una entrada que cabe en
+        un fragmento se ordena en el proceso actual. chunk_size debe ser un entero
+        positivo; por defecto se reparte la entrada entre los trabajadores.
+        """
+        if algorithm not in self.PARALLEL_ALGORITHMS:
+            raise ValueError(f"parallel_sort no admite {algorithm}; use uno de {self.PARALLEL_ALGORITHMS}")
+        if chunk_size is not None and (not isinstance(chunk_size, int) or chunk_size < 1):
+            raise ValueError(f"chunk_size debe ser un entero positivo, no {chunk_size!r}")
+        if workers is not None and workers < 0:
+            raise ValueError(f"workers no puede ser negativo: {workers}")
+        workers = workers or os.cpu_count() or 1
+        n = len(arr)
+        if chunk_size is None:
+            chunk_size = max(1, math.ceil(n / workers))
+        if workers == 1 or n <= chunk_size:
+            return getattr(self, algorithm)(list(arr), key=key, search_value=search_value)
+
+        for name, value in (("key", key), ("search_value", search_value)):
+            try:
+                pickle.dumps(value)
+            except (pickle.PicklingError, AttributeError, TypeError) as err:
+                raise TypeError(f"parallel_sort requiere que {name} sea serializable con pickle para enviarlo a "
+                                f"los procesos (use FieldKey o una función de módulo, no una lambda): {err}") from err
+
+        offsets = range(0, n, chunk_size)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(_sort_chunk, algorithm, arr[start:start + chunk_size], key, search_value, start)
+                for start in offsets
+            ]
+            sorted_chunks = [future.result() for future in futures]
+        return self._undecorate(arr, heapq.merge(*sorted_chunks))
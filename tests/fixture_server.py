@@ -0,0 +1,180 @@
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+CONTENT_TYPES = {".html": "text/html; charset=utf-8", ".json": "application/json"}
+
+
+def fixture(name):
+    with open(os.path.join(FIXTURES_DIR, name), "rb") as f:
+        return f.read()
+
+
+def page(name, status=200, delay=0.0):
+    """
+    Respuesta con el contenido de un archivo de tests/fixtures.
+    """
+    content_type = CONTENT_TYPES.get(os.path.splitext(name)[1], "application/octet-stream")
+    return status, fixture(name), {"Content-Type": content_type}, delay
+
+
+def status(code, delay=0.0, body=b""):
+    return code, body, {"Content-Type": "text/plain"}, delay
+
+
+class FixtureServer:
+    """
+    Servidor HTTP local (http.server en un hilo) que sirve páginas guardadas a
+    los módulos de data_sources para probarlos sin red.
+
+    routes asocia cada ruta a una respuesta (status, cuerpo, headers, espera),
+    a una lista de respuestas que se entregan en orden (la última se repite) o
+    a una función que recibe los parámetros de la consulta y retorna una
+    respuesta. Registra cada petición y el máximo de peticiones simultáneas.
+    """
+
+    def __init__(self, routes=None):
+        self.routes = dict(routes or {})
+        self.requests = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self._server.server_address
+        return f"http://{host}:{port}"
+
+    def url(self, path):
+        return self.base_url + path
+
+    def hits(self, path):
+        return sum(1 for request_path, _ in self.requests if request_path == path)
+
+    def _respond(self, path, query):
+        with self._lock:
+            self.requests.append((path, query))
+            route = self.routes.get(path)
+            if isinstance(route, list):
+                route = route.pop(0) if len(route) > 1 else route[0]
+        if route is None:
+            return status(404)
+        if callable(route):
+            return route(query)
+        return route
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            # HTTP/1.1 para que los clientes puedan reutilizar la conexión
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                parts = urlsplit(self.path)
+                query = {name: values[-1] for name, values in parse_qs(parts.query).items()}
+                with server._lock:
+                    server.active += 1
+                    server.max_active = max(server.max_active, server.active)
+                try:
+                    code, body, headers, delay = server._respond(parts.path, query)
+                    if delay:
+                        time.sleep(delay)
+                    self.send_response(code)
+                    for name, value in headers.items():
+                        self.send_header(name, value)
+                    self.send_header("Content-Length", str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+                except (BrokenPipeError, ConnectionResetError):
+                    # El cliente cerró la conexión (por ejemplo, tras un timeout)
+                    self.close_connection = True
+                finally:
+                    with server._lock:
+                        server.active -= 1
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+
+class FakeScopus:
+    """
+    Endpoint de búsqueda de Scopus para FixtureServer con paginación por
+    cursor: el cursor "*" abre la primera página y cada página indica la
+    siguiente en cursor.@next. Permite simular los casos límite de la API:
+      - repeat_cursor_at: desde esa página @next repite el cursor actual;
+      - empty_page_at: esa página no trae entradas;
+      - total=0: la respuesta trae la entrada de marcador con la clave "error".
+    Registra los cursores pedidos en cursors.
+    """
+
+    def __init__(self, total, repeat_cursor_at=None, empty_page_at=None, delay=0.0):
+        self.total = total
+        self.repeat_cursor_at = repeat_cursor_at
+        self.empty_page_at = empty_page_at
+        self.delay = delay
+        self.cursors = []
+
+    @staticmethod
+    def entry(number):
+        return {
+            "dc:identifier": f"SCOPUS_ID:{85000000000 + number}",
+            "dc:title": f"Computational thinking study {number}",
+            "dc:creator": f"Author{number} A.",
+            "author": [{"authname": f"Author{number} A."}, {"authname": f"Coauthor{number} B."}],
+            "prism:coverDate": f"{2000 + number % 25}-01-01",
+            "prism:publicationName": "Computers and Education",
+            "prism:doi": f"10.1016/test.{number}",
+            "subtypeDescription": "Article",
+            "subject-area": [{"$": "Computer Science (all)"}],
+        }
+
+    def __call__(self, query):
+        cursor = query.get("cursor", "*")
+        self.cursors.append(cursor)
+        count = int(query.get("count", 25))
+        page_number = 0 if cursor == "*" else int(cursor.split("-")[1])
+        start = page_number * count
+        if self.total == 0:
+            entries = [{"@_fa": "true", "error": "Result set was empty"}]
+        elif page_number == self.empty_page_at:
+            entries = []
+        else:
+            entries = [self.entry(number) for number in range(start, min(start + count, self.total))]
+        results = {
+            "opensearch:totalResults": str(self.total),
+            "opensearch:itemsPerPage": str(len(entries)),
+            "cursor": {"@current": cursor},
+            "entry": entries,
+        }
+        if self.repeat_cursor_at is not None and page_number >= self.repeat_cursor_at:
+            results["cursor"]["@next"] = cursor
+        elif start + count < self.total:
+            results["cursor"]["@next"] = f"page-{page_number + 1}"
+        body = json.dumps({"search-results": results}).encode("utf-8")
+        return 200, body, {"Content-Type": "application/json"}, self.delay
@@ -0,0 +1,106 @@
+import datetime
+
+import pytest
+
+from controllers.article_controller import ArticleRepository
+from models.redis_model import RedisDatabase
+
+fakeredis = pytest.importorskip("fakeredis")
+
+
+class InMemoryMySQL:
+    """
+    Doble de MySQLDatabase con la semántica de lotes de insert_articles: cada
+    lote se confirma o se revierte completo y on_commit solo se llama tras el
+    commit. Los artículos con id None hacen fallar su lote, como la columna
+    id NOT NULL de MySQL.
+    """
+
+    def __init__(self):
+        self.rows = {}
+        self.commits = 0
+
+    def insert_articles(self, articles, batch_size=1000, on_commit=None):
+        rows = failed = 0
+        batch = []
+        for article in list(articles) + [None]:
+            if article is not None:
+                batch.append(article)
+            if batch and (len(batch) >= batch_size or article is None):
+                if any(item["id"] is None for item in batch):
+                    failed += len(batch)
+                else:
+                    self.rows.update((item["id"], dict(item)) for item in batch)
+                    self.commits += 1
+                    rows += len(batch)
+                    if on_commit is not None:
+                        on_commit(batch)
+                batch = []
+        return {"rows": rows, "failed": failed}
+
+    def delete_articles(self, article_ids):
+        return sum(self.rows.pop(article_id, None) is not None for article_id in article_ids)
+
+    def iter_articles(self, filters=None):
+        ids = (filters or {}).get("id", list(self.rows))
+        return (dict(self.rows[article_id]) for article_id in ids if article_id in self.rows)
+
+    def sorted_articles(self, field, search_value=None, limit=None, algorithm="tim_sort"):
+        articles = sorted(self.rows.values(), key=lambda article: article[field])
+        return [dict(article) for article in articles[:limit]]
+
+
+@pytest.fixture
+def repository():
+    redis_db = RedisDatabase()
+    redis_db.r = fakeredis.FakeRedis()
+    return ArticleRepository(InMemoryMySQL(), redis_db)
+
+
+def _article(number):
+    return {"id": number, "article_name": f"Artículo {number}", "author_name": "Ana García",
+            "publication_date": datetime.date(2000 + number, 1, 1), "theme": "Computación", "category": "Journal"}
+
+
+def test_failed_batch_never_reaches_redis(repository):
+    articles = [_article(1), _article(2), _article(3), {**_article(4), "id": None}, _article(5)]
+    stats = repository.insert_many(articles, batch_size=2)
+    assert (stats["rows"], stats["failed"]) == (3, 2)
+    # El lote [3, None] se revirtió: el 3 no está en MySQL ni en Redis
+    cached = repository.redis_db.get_articles([1, 2, 3, 5])
+    assert [article and article["id"] for article in cached] == [1, 2, None, 5]
+    assert repository.get(3) is None
+    assert (repository.stats["article_hits"], repository.stats["article_misses"]) == (0, 1)
+
+
+def test_generation_bumped_once_per_committed_batch(repository):
+    r = repository.redis_db.r
+    repository.insert_many([_article(number) for number in range(5)], batch_size=2)
+    assert int(r.get(ArticleRepository.GENERATION_KEY)) == repository.mysql_db.commits == 3
+    repository.insert_many([{**_article(9), "id": None}])
+    assert int(r.get(ArticleRepository.GENERATION_KEY)) == 3
+
+
+def test_sorted_results_invalidated_after_insert(repository):
+    repository.insert_many([_article(3), _article(1)])
+    assert [article["id"] for article in repository.sorted("publication_date")] == [1, 3]
+    assert [article["id"] for article in repository.sorted("publication_date")] == [1, 3]
+    assert repository.stats["sorted_hits"] == 1
+    repository.insert(_article(2))
+    assert [article["id"] for article in repository.sorted("publication_date")] == [1, 2, 3]
+
+
+def test_read_through_restores_dates(repository):
+    repository.insert_many([_article(1)])
+    article = repository.get(1)
+    assert article["publication_date"] == datetime.date(2001, 1, 1)
+    assert repository.stats["article_hits"] == 1
+
+
+def test_delete_many_removes_from_both_stores(repository):
+    repository.insert_many([_article(1), _article(2), _article(3)])
+    assert [article["id"] for article in repository.sorted("publication_date")] == [1, 2, 3]
+    assert repository.delete_many([2, 9]) == 1
+    assert repository.redis_db.get_articles([2]) == [None]
+    assert repository.get(2) is None
+    assert [article["id"] for article in repository.sorted("publication_date")] == [1, 3]
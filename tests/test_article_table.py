@@ -0,0 +1,129 @@
+import datetime
+import random
+
+import pytest
+
+from models.article_table import ArticleTable
+from sorting_algorithms.search import SearchQuery
+from sorting_algorithms.sorting import SortingAlgorithms
+
+
+def _articles(n, seed=0):
+    rnd = random.Random(seed)
+    return [{
+        "id": number,
+        "article_name": rnd.choice(["Computational", "Computer", "Data", "Robotics"]) + f" thinking {number % 7}",
+        "author_name": rnd.choice(["Ana García", "John Smith", None]),
+        "publication_date": datetime.date(2000 + rnd.randrange(20), 1 + rnd.randrange(12), 1 + rnd.randrange(28)),
+        "theme": rnd.choice(["Computación", "Educación", "Robótica"]),
+        "category": rnd.choice(["Journal", "Review", None]),
+        "doi": rnd.choice(["", f"10.1000/{number}"]),
+    } for number in range(1, n + 1)]
+
+
+def _expected(article):
+    return {
+        "id": article["id"],
+        "article_name": article["article_name"],
+        "author_name": article["author_name"] or "",
+        "publication_date": article["publication_date"],
+        "theme": article["theme"],
+        "category": article["category"] or "",
+        "doi": article["doi"],
+        "source": "",
+    }
+
+
+@pytest.mark.parametrize("use_mmap", [True, False])
+def test_save_load_round_trip(tmp_path, use_mmap):
+    articles = _articles(300)
+    filename = tmp_path / "articles.table"
+    ArticleTable(articles).save(filename)
+    table = ArticleTable.load(filename, use_mmap=use_mmap)
+    assert len(table) == 300
+    assert list(table.iter_dicts()) == [_expected(article) for article in articles]
+    assert table[-1]["id"] == 300
+    assert table.column("id").tolist() == list(range(1, 301))
+
+
+@pytest.mark.parametrize("use_mmap", [True, False])
+def test_save_load_empty_table(tmp_path, use_mmap):
+    filename = tmp_path / "empty.table"
+    ArticleTable().save(filename)
+    table = ArticleTable.load(filename, use_mmap=use_mmap)
+    assert len(table) == 0
+    assert list(table.iter_dicts()) == [] and table.argsort("theme") == []
+    table.append({"id": 1, "article_name": "Primer artículo"})
+    assert table[0]["article_name"] == "Primer artículo"
+
+
+def test_load_rejects_other_files(tmp_path):
+    filename = tmp_path / "other.table"
+    filename.write_bytes(b"no es una tabla")
+    with pytest.raises(ValueError):
+        ArticleTable.load(filename)
+
+
+def test_append_copies_mmap_table(tmp_path):
+    articles = _articles(50)
+    filename = tmp_path / "articles.table"
+    ArticleTable(articles).save(filename)
+    table = ArticleTable.load(filename)
+    extra = {"id": 51, "article_name": "Robótica educativa", "author_name": "María López",
+             "publication_date": "2021-03-04", "theme": "Robótica", "category": "Review", "doi": "10.1000/51"}
+    table.append(extra)
+    assert table._mmap is None
+    assert table[50]["publication_date"] == datetime.date(2021, 3, 4)
+    assert table.dictionary("author_name")[table.column("author_name")[50]] == "María López"
+    assert list(table.iter_dicts())[:50] == [_expected(article) for article in articles]
+    # El archivo no cambia: una nueva carga no ve el artículo añadido
+    assert len(ArticleTable.load(filename)) == 50
+
+
+@pytest.mark.parametrize("algorithm", ["tim_sort", "tree_sort", "quick_sort", "heap_sort", "comb_sort"])
+@pytest.mark.parametrize("field", ["id", "article_name", "publication_date", "theme"])
+@pytest.mark.parametrize("search_value", [None, "Comp", SearchQuery(["computational thinking", "robótica"])])
+def test_argsort_matches_sorting_dicts(algorithm, field, search_value):
+    articles = _articles(200, seed=1)
+    table = ArticleTable(articles)
+    method = getattr(SortingAlgorithms(), algorithm)
+    expected = method(list(articles), key=lambda article: article[field], search_value=search_value)
+    order = table.argsort(field, algorithm, search_value)
+    if algorithm != "comb_sort":
+        assert [table[i]["id"] for i in order] == [article["id"] for article in expected]
+    else:
+        # Métodos no estables: se compara solo el orden de las claves
+        assert [table[i][field] for i in order] == [article[field] for article in expected]
+    assert [row["id"] for row in table.sorted(field, algorithm, search_value)] == [table[i]["id"] for i in order]
+
+
+def test_non_integer_id_switches_column_to_text():
+    table = ArticleTable([{"id": 1}, {"id": None}, {"id": 3}])
+    assert table.column("id").format == "q"
+    table.append({"id": "10.1000/abc"})
+    assert table.values("id") == ["1", "", "3", "10.1000/abc"]
+    assert table.argsort("id") == [1, 0, 3, 2]
+
+
+def test_to_dict_turns_missing_dictionary_values_into_empty_strings():
+    table = ArticleTable([{"id": 1, "article_name": None, "theme": None, "category": "Review"}])
+    row = table[0].to_dict()
+    assert (row["author_name"], row["theme"], row["source"], row["category"]) == ("", "", "", "Review")
+    assert row["article_name"] == "" and row["publication_date"] is None
+    assert table.dictionary("theme") == [""]
+
+
+def test_free_text_dates_are_parsed_and_unparseable_ones_counted(tmp_path):
+    table = ArticleTable([
+        {"id": 1, "publication_date": "June 2020"},
+        {"id": 2, "publication_date": "First published May 2, 2019"},
+        {"id": 3, "publication_date": "2018"},
+        {"id": 4, "publication_date": "sin fecha"},
+        {"id": 5, "publication_date": ""},
+    ])
+    assert table.values("publication_date") == [
+        datetime.date(2020, 6, 1), datetime.date(2019, 5, 2), datetime.date(2018, 1, 1), None, None]
+    assert table.unparsed_dates == 1
+    assert table.argsort("publication_date") == [3, 4, 2, 1, 0]
+    table.save(tmp_path / "dates.table")
+    assert ArticleTable.load(tmp_path / "dates.table").unparsed_dates == 1
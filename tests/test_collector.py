@@ -0,0 +1,150 @@
+import asyncio
+import time
+
+import pytest
+import requests
+
+from data_sources.collector import ArticleCollector, collect_articles
+from tests.fixture_server import FixtureServer, page, status
+
+PATHS = {
+    "acm": "/acm/action/doSearch",
+    "sage": "/sage/action/doSearch",
+    "sciencedirect": "/sciencedirect/search",
+    "scopus": "/scopus/content/search/scopus",
+}
+
+
+@pytest.fixture
+def server():
+    with FixtureServer({
+        PATHS["acm"]: page("acm_search.html"),
+        PATHS["sage"]: page("sage_search.html"),
+        PATHS["sciencedirect"]: page("sciencedirect_search.html"),
+        PATHS["scopus"]: page("scopus_search.json"),
+    }) as server:
+        yield server
+
+
+def _collector(server, **options):
+    base_urls = {name: server.url(path) for name, path in PATHS.items()}
+    return ArticleCollector(base_urls=base_urls, **options)
+
+
+def _fetch_all(collector, urls):
+    async def run():
+        return await asyncio.gather(*(collector.fetch(url) for url in urls))
+
+    try:
+        return asyncio.run(run())
+    finally:
+        collector.close()
+
+
+def test_collects_all_sources_from_fixtures(server):
+    base_urls = {name: server.url(path) for name, path in PATHS.items()}
+    results = collect_articles("computational thinking", scopus_api_key="test-key", base_urls=base_urls)
+    assert {name: len(articles) for name, articles in results.items()} == {
+        "acm": 2, "sage": 1, "sciencedirect": 1, "scopus": 2}
+    assert results["acm"][0]["doi"] == "10.1145/3287324.3287431"
+    assert all(article["source"] == name for name, articles in results.items() for article in articles)
+    acm_query = next(query for path, query in server.requests if path == PATHS["acm"])
+    assert acm_query == {"AllField": "computational thinking"}
+
+
+def test_stream_yields_fast_sources_first(server):
+    server.routes[PATHS["acm"]] = page("acm_search.html", delay=0.5)
+    collector = _collector(server)
+
+    async def run():
+        return [name async for name, _, _ in collector.stream("computational thinking")]
+
+    try:
+        order = asyncio.run(run())
+    finally:
+        collector.close()
+    assert order[-1] == "acm"
+    assert sorted(order) == ["acm", "sage", "sciencedirect"]
+
+
+def test_per_host_limit_caps_concurrency():
+    with FixtureServer({"/slow": status(200, delay=0.2)}) as server:
+        collector = ArticleCollector(per_host_limit=2)
+        responses = _fetch_all(collector, [server.url("/slow")] * 6)
+        assert [response.status_code for response in responses] == [200] * 6
+        assert server.max_active == 2
+
+
+def test_requests_run_concurrently_across_hosts():
+    with FixtureServer({"/slow": status(200, delay=0.3)}) as first, \
+            FixtureServer({"/slow": status(200, delay=0.3)}) as second:
+        collector = ArticleCollector(per_host_limit=1)
+        urls = [first.url("/slow"), second.url("/slow")]
+        start = time.perf_counter()
+        _fetch_all(collector, urls)
+        assert time.perf_counter() - start < 0.55
+
+
+@pytest.mark.parametrize("code", [429, 500, 502, 503, 504])
+def test_retries_transient_status_with_backoff(code):
+    with FixtureServer({"/flaky": [status(code), status(code), status(200, body=b"ok")]}) as server:
+        collector = ArticleCollector(retries=3, backoff=0.01)
+        response, = _fetch_all(collector, [server.url("/flaky")])
+        assert response.status_code == 200
+        assert server.hits("/flaky") == 3
+
+
+def test_returns_last_response_when_retries_are_exhausted():
+    with FixtureServer({"/down": status(503)}) as server:
+        collector = ArticleCollector(retries=2, backoff=0.01)
+        response, = _fetch_all(collector, [server.url("/down")])
+        assert response.status_code == 503
+        assert server.hits("/down") == 3
+
+
+def test_does_not_retry_client_errors():
+    with FixtureServer({"/missing": status(404)}) as server:
+        collector = ArticleCollector(retries=3, backoff=0.01)
+        response, = _fetch_all(collector, [server.url("/missing")])
+        assert response.status_code == 404
+        assert server.hits("/missing") == 1
+
+
+def test_timeout_is_retried_then_raised():
+    with FixtureServer({"/hang": status(200, delay=1.0)}) as server:
+        collector = ArticleCollector(timeout=0.2, retries=1, backoff=0.01)
+        with pytest.raises(requests.Timeout):
+            _fetch_all(collector, [server.url("/hang")])
+        assert server.hits("/hang") == 2
+
+
+def test_timeout_in_stream_reports_empty_source(server):
+    server.routes[PATHS["sage"]] = page("sage_search.html", delay=1.0)
+    collector = _collector(server, timeout=0.2, retries=0)
+
+    async def run():
+        return {name: articles async for name, articles, _ in collector.stream("computational thinking")}
+
+    try:
+        results = asyncio.run(run())
+    finally:
+        collector.close()
+    assert results["sage"] == []
+    assert len(results["acm"]) == 2
+
+
+def test_malformed_body_only_drops_that_source(server, capsys):
+    server.routes[PATHS["scopus"]] = (200, b"{no es json", {"Content-Type": "application/json"}, 0.0)
+    base_urls = {name: server.url(path) for name, path in PATHS.items()}
+    results = collect_articles("computational thinking", scopus_api_key="test-key", base_urls=base_urls)
+    assert {name: len(articles) for name, articles in results.items()} == {
+        "acm": 2, "sage": 1, "sciencedirect": 1, "scopus": 0}
+    assert "Error al procesar la respuesta de scopus: JSONDecodeError" in capsys.readouterr().out
+
+
+def test_collect_articles_forwards_max_results(server):
+    base_urls = {name: server.url(path) for name, path in PATHS.items()}
+    collect_articles("computational thinking", scopus_api_key="test-key", sources=["scopus"], max_results=7,
+                     base_urls=base_urls)
+    scopus_query = next(query for path, query in server.requests if path == PATHS["scopus"])
+    assert scopus_query["count"] == "7"
@@ -0,0 +1,78 @@
+from data_sources.benchmark_dedup import generate_noisy_articles, pair_metrics
+from data_sources.dedup import Deduplicator, deduplicate, normalize_doi, normalize_title
+
+ALPHA = {"id": 1, "article_name": "Alpha study of learning", "author_name": "Ana García",
+         "publication_date": "2019", "doi": "10.1/alpha", "source": "acm"}
+BETA = {"id": 2, "article_name": "Completely different beta words", "author_name": "García, A.",
+        "publication_date": "2019", "source": "sage"}
+# Mismo DOI que ALPHA y mismo título que BETA: une los dos grupos
+BRIDGE = {"id": 3, "article_name": "Completely Different Beta Words!", "author_name": "Ana García",
+          "publication_date": "2019", "doi": "https://doi.org/10.1/ALPHA", "source": "scopus"}
+
+
+def test_normalization():
+    assert normalize_title("  Análisis  de Datos.") == "analisis de datos"
+    assert normalize_doi("https://doi.org/10.1145/ABC") == "10.1145/abc"
+
+
+def test_noisy_duplicates_are_merged():
+    records, labels = generate_noisy_articles(3000)
+    deduplicator = Deduplicator()
+    deduplicator.add_many(records)
+    metrics = pair_metrics(deduplicator.labels(), labels)
+    assert metrics["precision"] > 0.99
+    assert metrics["recall"] > 0.9
+    assert len(deduplicate(records)) == len(deduplicator.records())
+
+
+def test_later_duplicate_reported_as_update():
+    deduplicator = Deduplicator()
+    first, = deduplicator.add_batch([dict(ALPHA)])
+    assert deduplicator.add_batch([{**ALPHA, "id": 9, "source": "scopus", "doi": ""}]) == []
+    updated, absorbed = deduplicator.pop_changes()
+    assert updated == [first] and absorbed == []
+    assert first["sources"] == ["acm", "scopus"] and first["duplicate_ids"] == [1, 9]
+    assert deduplicator.pop_changes() == ([], [])
+
+
+def test_transitive_merge_reports_absorbed_group():
+    deduplicator = Deduplicator()
+    alpha, beta = deduplicator.add_batch([dict(ALPHA), dict(BETA)])
+    assert deduplicator.add_batch([dict(BRIDGE)]) == []
+    updated, absorbed = deduplicator.pop_changes()
+    assert updated == [alpha]
+    assert absorbed == [(beta, alpha)]
+    assert alpha["duplicate_ids"] == [1, 3, 2]
+    assert deduplicator.records() == [alpha]
+    assert deduplicator.stats["absorbed"] == 1
+
+
+def test_group_absorbed_within_the_same_batch_is_not_emitted():
+    deduplicator = Deduplicator()
+    alpha, = deduplicator.add_batch([dict(ALPHA)])
+    assert deduplicator.add_batch([dict(BETA), dict(BRIDGE)]) == []
+    assert deduplicator.pop_changes() == ([alpha], [])
+    assert deduplicator.records() == [alpha]
+
+
+def test_streaming_matches_batch_result():
+    records, _ = generate_noisy_articles(2000, seed=3)
+    streaming = Deduplicator()
+    kept = {}
+    for start in range(0, len(records), 100):
+        for record in streaming.add_batch(dict(record) for record in records[start:start + 100]):
+            kept[id(record)] = record
+        updated, absorbed = streaming.pop_changes()
+        assert all(id(record) in kept for record in updated)
+        for record, survivor in absorbed:
+            del kept[id(record)]
+    assert [record["duplicate_ids"] for record in kept.values()] == \
+        [record["duplicate_ids"] for record in deduplicate(records, batch_size=100)]
+
+
+def test_exact_match_counted_once_per_record():
+    deduplicator = Deduplicator()
+    deduplicator.add_many([dict(ALPHA), {**ALPHA, "id": 4}, dict(BETA), dict(BRIDGE)])
+    # El duplicado de ALPHA coincide por DOI y por título; BRIDGE por DOI (ALPHA) y por título (BETA)
+    assert deduplicator.stats["exact"] == 2
+    assert len(deduplicator.records()) == 1
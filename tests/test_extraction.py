@@ -0,0 +1,75 @@
+import pytest
+
+from data_sources.extraction import ENGINES, extract_articles, lxml
+from tests.fixture_server import fixture
+
+ENGINE_PARAMS = [pytest.param(engine, marks=pytest.mark.skipif(
+    engine == "lxml" and lxml is None, reason="lxml no está instalado")) for engine in ENGINES]
+
+EXPECTED = {
+    "acm": [
+        {"article_name": "Computational Thinking in Elementary Classrooms", "author_name": "Ana García; John Smith",
+         "publication_date": "February 2019", "doi": "10.1145/3287324.3287431"},
+        {"article_name": "Assessing Computational Thinking with Block-Based Programming",
+         "author_name": "María López", "publication_date": "June 2020", "doi": "10.1145/3341525.3387404"},
+    ],
+    "sage": [
+        {"article_name": "Computational Thinking and Problem Solving in Secondary Education",
+         "author_name": "Luis Pérez; Emily Brown", "publication_date": "First published May 2, 2019",
+         "doi": "10.1177/0735633119845694"},
+    ],
+    "sciencedirect": [
+        {"article_name": "Computational thinking in teacher education: a systematic review",
+         "author_name": "Sofía Martínez; David Lee", "publication_date": "March 2020",
+         "doi": "10.1016/j.compedu.2019.103798"},
+    ],
+}
+
+
+@pytest.mark.parametrize("engine", ENGINE_PARAMS)
+@pytest.mark.parametrize("source", list(EXPECTED))
+def test_selectors_extract_fixture_pages(source, engine):
+    content = fixture(f"{source}_search.html")
+    assert extract_articles(content, source, engine=engine) == EXPECTED[source]
+    assert extract_articles(content.decode("utf-8"), source, engine=engine) == EXPECTED[source]
+
+
+@pytest.mark.parametrize("engine", ENGINE_PARAMS)
+@pytest.mark.parametrize("declared", ["utf-8", "iso-8859-1"])
+def test_str_with_xml_encoding_declaration(engine, declared):
+    content = (f'<?xml version="1.0" encoding="{declared}"?>\n'
+               '<html><body><ul><li class="search__item"><h5 class="issue-item__title">'
+               '<a href="https://doi.org/10.1/x">Análisis del pensamiento</a></h5></li></ul></body></html>')
+    article, = extract_articles(content, "acm", engine=engine)
+    assert (article["article_name"], article["doi"]) == ("Análisis del pensamiento", "10.1/x")
+
+
+@pytest.mark.parametrize("engine", ENGINE_PARAMS)
+def test_bytes_without_charset_are_utf8(engine):
+    content = '<div class="issue-item"><h3 class="hlFld-Title">Educación</h3></div>'.encode("utf-8")
+    assert extract_articles(content, "sage", engine=engine)[0]["article_name"] == "Educación"
+
+
+@pytest.mark.parametrize("engine", ENGINE_PARAMS)
+def test_titles_without_containers(engine):
+    content = b'<html><body><h2 class="result-list-title">Solo  el\n t\xc3\xadtulo</h2></body></html>'
+    assert extract_articles(content, "sciencedirect", engine=engine) == [
+        {"article_name": "Solo el título", "author_name": "", "publication_date": "", "doi": ""}]
+
+
+@pytest.mark.parametrize("engine", ENGINE_PARAMS)
+def test_empty_page(engine):
+    assert extract_articles(b"", "acm", engine=engine) == []
+    assert extract_articles("<html></html>", "acm", engine=engine) == []
+
+
+def test_custom_selectors_and_unknown_engine():
+    selectors = {"blog": {"item": ("article", "post"), "title": "h1", "authors": "span.by",
+                          "date": ("time", "datetime"), "doi": ("a.doi", "href")}}
+    content = ('<article class="post big"><h1>Post</h1><span class="by">Ana</span>'
+               '<time datetime="2021-04-01">1 abril</time><a class="doi" href="/doi/10.9/p">doi</a></article>')
+    for engine in ("soup",) + (("lxml",) if lxml is not None else ()):
+        assert extract_articles(content, "blog", engine=engine, selectors=selectors) == [
+            {"article_name": "Post", "author_name": "Ana", "publication_date": "2021-04-01", "doi": "10.9/p"}]
+    with pytest.raises(ValueError):
+        extract_articles(content, "acm", engine="regex")
@@ -0,0 +1,120 @@
+import asyncio
+import random
+import time
+from urllib.parse import urlsplit
+
+import requests
+
+from data_sources.collector import ArticleCollector
+from data_sources.http_cache import HTTPCache
+from tests.fixture_server import FixtureServer, page
+
+
+class CountingSession(requests.Session):
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    def request(self, *args, **kwargs):
+        self.calls += 1
+        return super().request(*args, **kwargs)
+
+
+def test_serves_hits_without_network(tmp_path):
+    with FixtureServer({"/acm": page("acm_search.html")}) as server:
+        cache = HTTPCache(str(tmp_path / "cache.sqlite"))
+        first = cache.get(server.url("/acm"), params={"AllField": "ct"})
+        second = cache.get(server.url("/acm"), params={"AllField": "ct"})
+        cache.close()
+    assert first.content == second.content
+    assert second.from_cache and not second.replay_miss
+    assert server.hits("/acm") == 1
+
+
+def test_replay_only_miss_is_marked(tmp_path):
+    cache = HTTPCache(str(tmp_path / "cache.sqlite"), replay_only=True)
+    response = cache.get("http://127.0.0.1:9/never", params={"q": "x"})
+    cache.close()
+    assert response.status_code == 504
+    assert response.replay_miss
+
+
+def test_collector_does_not_retry_replay_misses(tmp_path):
+    cache = HTTPCache(str(tmp_path / "cache.sqlite"), replay_only=True)
+    collector = ArticleCollector(retries=3, backoff=0.5, cache=cache)
+    start = time.perf_counter()
+    try:
+        response = asyncio.run(collector.fetch("http://127.0.0.1:9/never"))
+    finally:
+        collector.close()
+        cache.close()
+    assert response.status_code == 504
+    assert time.perf_counter() - start < 0.4
+    assert cache.misses == 1
+
+
+def test_get_uses_the_session_passed_in(tmp_path):
+    with FixtureServer({"/acm": page("acm_search.html")}) as server:
+        own = CountingSession()
+        host = CountingSession()
+        cache = HTTPCache(str(tmp_path / "cache.sqlite"), ttl=0, session=own)
+        cache.get(server.url("/acm"), session=host)
+        # Con ttl=0 la entrada está vencida y se revalida por la misma Session
+        cache.get(server.url("/acm"), session=host)
+        cache.close()
+        host.close()
+    assert (own.calls, host.calls) == (0, 2)
+
+
+def test_collector_sends_cached_requests_through_host_sessions(tmp_path):
+    with FixtureServer({"/acm": page("acm_search.html")}) as server:
+        cache = HTTPCache(str(tmp_path / "cache.sqlite"), ttl=0, session=CountingSession())
+        collector = ArticleCollector(cache=cache)
+
+        async def run():
+            return await asyncio.gather(*(collector.fetch(server.url("/acm")) for _ in range(2)))
+
+        try:
+            responses = asyncio.run(run())
+            host = urlsplit(server.url("/acm")).netloc
+            assert list(collector._sessions) == [host]
+        finally:
+            collector.close()
+            cache.close()
+    assert [response.status_code for response in responses] == [200, 200]
+    assert cache.session.calls == 0
+
+
+def test_cache_key_includes_relevant_headers():
+    url, params = "https://api.elsevier.com/content/search/scopus", {"query": "ct"}
+    base = HTTPCache.cache_key(url, params)
+    assert HTTPCache.cache_key(url, params, {"User-Agent": "Mozilla/5.0"}) == base
+    first = HTTPCache.cache_key(url, params, {"Accept": "application/json", "X-ELS-APIKey": "a"})
+    assert first != base
+    assert first != HTTPCache.cache_key(url, params, {"Accept": "application/json", "X-ELS-APIKey": "b"})
+    assert first != HTTPCache.cache_key(url, params, {"Accept": "application/xml", "X-ELS-APIKey": "a"})
+    assert first == HTTPCache.cache_key(url, params, {"x-els-apikey": "a", "accept": "application/json"})
+
+
+def test_requests_with_different_api_keys_do_not_share_entries(tmp_path):
+    with FixtureServer({"/scopus": page("scopus_search.json")}) as server:
+        cache = HTTPCache(str(tmp_path / "cache.sqlite"))
+        for api_key in ("a", "b", "a"):
+            cache.get(server.url("/scopus"), params={"query": "ct"}, headers={"X-ELS-APIKey": api_key})
+        cache.close()
+    assert server.hits("/scopus") == 2
+
+
+def test_response_larger_than_max_bytes_is_not_cached(tmp_path):
+    # Bytes aleatorios: zlib no los reduce
+    big = (200, random.Random(1).randbytes(16000), {"Content-Type": "application/octet-stream"}, 0.0)
+    with FixtureServer({"/small": page("acm_search.html"), "/big": big}) as server:
+        cache = HTTPCache(str(tmp_path / "cache.sqlite"), max_bytes=8000)
+        cache.get(server.url("/small"))
+        response = cache.get(server.url("/big"))
+        assert response.status_code == 200
+        cache.get(server.url("/big"))
+        cache.get(server.url("/small"))
+        cache.close()
+    # La entrada grande no se guarda ni desaloja a la pequeña
+    assert (server.hits("/big"), server.hits("/small")) == (2, 1)
@@ -0,0 +1,103 @@
+import pytest
+
+from exports.benchmark_import import PARSERS, round_trip, sample_articles
+from exports.export_data import compression_for, zstandard
+from exports.import_data import iter_bibtex, iter_jsonl, iter_ris
+
+COMPRESSIONS = [None, "gzip", pytest.param("zstd", marks=pytest.mark.skipif(
+    zstandard is None, reason="zstandard no está instalado"))]
+
+
+@pytest.mark.parametrize("compression", COMPRESSIONS)
+@pytest.mark.parametrize("fmt", list(PARSERS))
+def test_round_trip_with_export_stream(fmt, compression, tmp_path):
+    articles = sample_articles(300)
+    result = round_trip(articles, fmt, str(tmp_path), compression)
+    assert result["records"] == len(articles)
+    assert result["round_trip_ok"], result["mismatches"]
+
+
+def test_ris_wrapped_lines_and_repeated_tags():
+    lines = [
+        "TY  - JOUR",
+        "ID  - 7",
+        "TI  - Computational thinking in primary",
+        "      education: a longitudinal study",
+        "AU  - García, Ana",
+        "AU  - Smith, John",
+        "A1  - López, María",
+        "KW  - Computación",
+        "KW  - Educación",
+        "PY  - 2019///",
+        "DO  - 10.1145/123",
+        "ER  - ",
+        "",
+        "TY  - CONF",
+        "TI  - Second article",
+        "DA  - 2020/05/02/",
+        "ER  - ",
+    ]
+    first, second = iter_ris(lines)
+    assert first == {
+        "id": 7,
+        "article_name": "Computational thinking in primary education: a longitudinal study",
+        "author_name": "García, Ana; Smith, John; López, María",
+        "publication_date": "2019",
+        "theme": "Computación; Educación",
+        "category": "Article",
+        "doi": "10.1145/123",
+    }
+    assert second["category"] == "Conference Paper"
+    assert second["publication_date"] == "2020-05-02"
+
+
+def test_ris_truncated_file_keeps_last_record():
+    assert [article["article_name"] for article in iter_ris(["TY  - JOUR", "TI  - Sin ER"])] == ["Sin ER"]
+
+
+def test_bibtex_latex_escapes_and_accents():
+    entry = r"""
+@comment{ignorado}
+@article{article12,
+  title = {An{\'a}lisis de 100\% de los casos \& resultados en \~{n}and\'ues},
+  author = {Jos\'{e} M\"uller and Fran\c{c}ois Garc\'\i a},
+  year = 2021,
+  note = {Temática: C:\textbackslash{}datos \{A\}; Categoría: Review},
+  doi = "10.1000/{X}_1"
+}
+"""
+    article, = iter_bibtex(entry.splitlines(keepends=True))
+    assert article == {
+        "id": 12,
+        "article_name": "Análisis de 100% de los casos & resultados en ñandúes",
+        "author_name": "José Müller; François García",
+        "publication_date": "2021",
+        "theme": "C:\\datos {A}",
+        "category": "Review",
+        "doi": "10.1000/X_1",
+    }
+
+
+def test_bibtex_multiline_entries_and_types():
+    text = "@inproceedings{key1,\n  title = {Primer\n título},\n  year = {2018}\n}\n" \
+           "@book{key2, title = \"Segundo {título}\", keywords = {ct; educación}}\n"
+    first, second = iter_bibtex(text.splitlines(keepends=True))
+    assert (first["id"], first["article_name"], first["category"]) == ("key1", "Primer título", "Conference Paper")
+    assert (second["article_name"], second["theme"], second["category"]) == ("Segundo título", "ct; educación", "Book")
+
+
+def test_non_ascii_digit_ids_stay_text():
+    first, second = iter_ris(["TY  - JOUR", "ID  - ²3", "ER  - ", "TY  - JOUR", "ID  -  42 ", "ER  - "])
+    assert (first["id"], second["id"]) == ("²3", 42)
+
+
+def test_compression_for():
+    assert (compression_for("a.jsonl"), compression_for("a.ris.gz"), compression_for("a.bib.zst")) == \
+        (None, "gzip", "zstd")
+    assert compression_for("a.jsonl", "gzip") == "gzip"
+    with pytest.raises(ValueError):
+        compression_for("a.jsonl", "bz2")
+
+
+def test_jsonl_skips_blank_lines():
+    assert list(iter_jsonl(['{"id": 1}\n', "\n", '{"id": 2}\n'])) == [{"id": 1}, {"id": 2}]
@@ -0,0 +1,110 @@
+import datetime
+import json
+
+import main
+from main import IdRegistry, article_id
+
+
+def _record(title, date="2020-01-01", **fields):
+    return {"article_name": title, "publication_date": date, **fields}
+
+
+def _hashed(title, date="2020-01-01"):
+    record = _record(title, date)
+    record["id"] = main.article_id(record)
+    return record
+
+
+def test_article_id_is_stable_and_fits_bigint():
+    first = article_id(_record("Computational Thinking!", "2020-05-01"))
+    assert first == article_id(_record("computational thinking", "2020"))
+    assert 0 <= first < 2 ** 63
+    assert first != article_id(_record("computational thinking", "2021"))
+    assert first != article_id(_record("computational thinking", "2020"), salt=1)
+
+
+def test_registry_resalts_same_title_and_year():
+    # El deduplicador separa dos artículos con el mismo título y año si sus
+    # autores no coinciden: ambos reciben ids distintos
+    registry = IdRegistry()
+    first, second = _hashed("Computational thinking"), _hashed("Computational thinking")
+    assert registry.assign(first) != registry.assign(second)
+    assert second["id"] == article_id(second, salt=1)
+    assert registry.collisions == 1
+
+
+def test_registry_resolves_hash_collisions(monkeypatch):
+    # Con ids de 1 bit, tres títulos distintos chocan por fuerza
+    monkeypatch.setattr(main, "article_id", lambda record, salt=0: (article_id(record, salt) & 1) + 2 * salt)
+    registry = IdRegistry()
+    records = [_hashed("Primer artículo"), _hashed("Segundo artículo"), _hashed("Tercer artículo")]
+    ids = [registry.assign(record) for record in records]
+    assert len(set(ids)) == 3
+    assert [record["id"] for record in records] == ids
+    assert registry.collisions >= 1
+
+
+def test_registry_reports_native_id_clash():
+    registry = IdRegistry()
+    registry.assign(_record("Artículo de Scopus", id=85000000001))
+    assert registry.assign(_record("Otro artículo", id=85000000001)) == 85000000001
+    assert registry.collisions == 1
+
+
+def test_pipeline_applies_updates_and_absorbed_groups(tmp_path):
+    from tests.test_dedup import ALPHA, BETA, BRIDGE
+
+    # Con lotes de 2, ALPHA y BETA salen como artículos distintos y BRIDGE
+    # los une después: BETA debe eliminarse del almacén y de las exportaciones
+    unscraped = {"article_name": "Sin id propio", "author_name": "Luis Pérez", "publication_date": "2020"}
+    store = main.MemoryStore()
+    pipeline = main.Pipeline(iter([dict(ALPHA), dict(BETA), dict(BRIDGE), unscraped]), store, str(tmp_path),
+                             batch_size=2, visualize=False)
+    report = pipeline.run()
+    assert report["errors"] == []
+    assert report["records_unique"] == 2
+    assert set(store.articles) == {1, article_id(unscraped)}
+    assert sorted(store.articles[1]["sources"]) == ["acm", "sage", "scopus"]
+    stages = {stage["name"]: stage["result"] for stage in report["stages"]}
+    assert (stages["dedup"]["absorbed"], stages["store"]["deleted"]) == (1, 1)
+    exported = [json.loads(line)["id"] for line in open(tmp_path / "articles.jsonl", encoding="utf-8")]
+    assert sorted(exported) == sorted(store.articles)
+    assert pipeline.stats.total == 2
+
+
+def test_main_synthetic_run(tmp_path, capsys):
+    assert main.main(["--synthetic", "2000", "--output-dir", str(tmp_path), "--no-visualize"]) == 0
+    report = json.loads((tmp_path / "run_report.json").read_text(encoding="utf-8"))
+    exported = [json.loads(line)["id"] for line in open(tmp_path / "articles.jsonl", encoding="utf-8")]
+    assert len(exported) == len(set(exported)) == report["records_unique"]
+    assert "únicos" in capsys.readouterr().out
+
+
+def test_main_fixtures_sorted_export_keeps_dates_and_merge_fields(tmp_path):
+    assert main.main(["--fixtures", "tests/fixtures", "--output-dir", str(tmp_path), "--no-visualize"]) == 0
+    rows = [json.loads(line) for line in open(tmp_path / "sorted_publication_date.jsonl", encoding="utf-8")]
+    dates = [row["publication_date"] for row in rows]
+    # Las fechas en texto libre de ACM, SAGE y ScienceDirect se normalizan
+    assert len(rows) == 6 and all(dates) and dates == sorted(dates)
+    assert "2020-06-01" in dates and "2019-05-02" in dates
+    assert all(row["sources"] == [row["source"]] and row["id"] in row["duplicate_ids"] for row in rows)
+
+
+def test_dedup_normalizes_publication_dates(tmp_path):
+    records = [_record("Junio", "June 2020"), _record("Sin fecha", "pronto"), _record("Vacía", ""),
+               _record("Año", "2018"), _record("Scopus", datetime.date(2019, 5, 2))]
+    store = main.MemoryStore()
+    report = main.Pipeline(iter(records), store, str(tmp_path), visualize=False).run()
+    dates = {article["article_name"]: article["publication_date"] for article in store.articles.values()}
+    assert dates == {"Junio": "2020-06-01", "Sin fecha": "", "Vacía": "", "Año": "2018-01-01",
+                     "Scopus": "2019-05-02"}
+    stages = {stage["name"]: stage["result"] for stage in report["stages"]}
+    assert stages["dedup"]["unparsed_dates"] == 1
+
+
+def test_pipeline_traced_peak_per_stage_group(tmp_path):
+    report = main.Pipeline(main.iter_synthetic(500), main.MemoryStore(), str(tmp_path), visualize=False,
+                           trace_memory=True).run()
+    peaks = [stage["group_traced_peak_bytes"] for stage in report["stages"]]
+    assert all(peaks) and report["traced_peak_bytes"] >= max(peaks)
+    assert len(list((tmp_path / "tracemalloc").iterdir())) == len(report["stages"])
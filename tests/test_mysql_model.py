@@ -0,0 +1,247 @@
+"""
+Pruebas de models.mysql_model. Las del planificador de ordenamiento usan un
+cursor simulado; las de integración (fixture db) necesitan un servidor MySQL
+local y se omiten si no está definida MYSQL_TEST_HOST. Por ejemplo:
+
+    docker run -d --rm -p 3306:3306 -e MYSQL_ROOT_PASSWORD=test mysql:8
+    MYSQL_TEST_HOST=127.0.0.1 MYSQL_TEST_PASSWORD=test python -m pytest tests/test_mysql_model.py
+
+Cada prueba usa la base de datos MYSQL_TEST_DATABASE (por defecto
+bibliometria_test), que se elimina al terminar.
+"""
+import datetime
+import os
+
+import pytest
+
+from models.mysql_model import MySQLDatabase
+from sorting_algorithms.search import SearchQuery
+
+DATABASE = os.environ.get("MYSQL_TEST_DATABASE", "bibliometria_test")
+
+
+def _options():
+    return {
+        "host": os.environ.get("MYSQL_TEST_HOST"),
+        "user": os.environ.get("MYSQL_TEST_USER", "root"),
+        "password": os.environ.get("MYSQL_TEST_PASSWORD", ""),
+        "database": DATABASE,
+    }
+
+
+def _article(number, **fields):
+    article = {
+        "id": number,
+        "article_name": f"Computational thinking {number}",
+        "author_name": f"Author {number}",
+        "publication_date": datetime.date(2000 + number % 20, 1, 1),
+        "theme": "Computación",
+        "category": "Journal",
+    }
+    article.update(fields)
+    return article
+
+
+@pytest.fixture
+def db():
+    if not os.environ.get("MYSQL_TEST_HOST"):
+        pytest.skip("MYSQL_TEST_HOST no está definida")
+    database = MySQLDatabase(**_options())
+    assert database.cnx is not None, "no se pudo conectar a MySQL"
+    yield database
+    database.cursor.execute(f"DROP DATABASE IF EXISTS {DATABASE}")
+    database.close()
+
+
+def _ids(db):
+    return sorted(row["id"] for row in db.iter_articles())
+
+
+def test_insert_article_commits_outside_transaction(db):
+    db.insert_article(_article(1))
+    db.insert_article(_article(2))
+    assert _ids(db) == [1, 2]
+
+
+def test_insert_article_upserts(db):
+    db.insert_article(_article(1))
+    db.insert_article(_article(1, article_name="Nuevo título"))
+    rows = list(db.iter_articles())
+    assert [row["article_name"] for row in rows] == ["Nuevo título"]
+
+
+def test_transaction_commits_on_exit(db):
+    with db.transaction():
+        db.insert_article(_article(1))
+        db.insert_article(_article(2))
+        assert _ids(db) == []
+    assert _ids(db) == [1, 2]
+
+
+def test_failed_insert_rolls_back_whole_transaction(db):
+    from mysql.connector import Error
+
+    with pytest.raises(Error):
+        with db.transaction():
+            db.insert_article(_article(1))
+            db.insert_article(_article(None))
+    assert _ids(db) == []
+    # La conexión sigue utilizable y vuelve al modo con commit por fila
+    db.insert_article(_article(3))
+    assert _ids(db) == [3]
+
+
+def test_failed_insert_outside_transaction_is_reported(db, capsys):
+    db.insert_article(_article(None))
+    db.insert_article(_article(1))
+    assert "Error inserting article" in capsys.readouterr().out
+    assert _ids(db) == [1]
+
+
+def test_insert_articles_batches(db):
+    stats = db.insert_articles((_article(number) for number in range(1, 251)), batch_size=100)
+    assert (stats["rows"], stats["failed"]) == (250, 0)
+    assert _ids(db) == list(range(1, 251))
+
+
+def test_delete_articles(db):
+    db.insert_articles(_article(number) for number in range(1, 6))
+    assert db.delete_articles([2, 4, 99], batch_size=2) == 2
+    assert _ids(db) == [1, 3, 5]
+
+
+def test_bigint_ids(db):
+    db.insert_article(_article(2 ** 63 - 1))
+    assert _ids(db) == [2 ** 63 - 1]
+
+
+def test_startup_leaves_no_open_transaction(db):
+    from models.mysql_model import SCHEMA_MIGRATIONS
+
+    assert db.schema_version() == SCHEMA_MIGRATIONS[-1][0]
+    assert not db.cnx.in_transaction
+    # Segunda apertura sobre un esquema al día: solo lecturas en el arranque
+    again = MySQLDatabase(**_options())
+    try:
+        assert not again.cnx.in_transaction
+        again.indexed_columns()
+        assert not again.cnx.in_transaction
+        again.insert_article(_article(1))
+        with again.transaction():
+            again.insert_article(_article(2))
+    finally:
+        again.close()
+    assert _ids(db) == [1, 2]
+
+
+def test_migration_resumes_after_partial_failure(db):
+    from models.mysql_model import SCHEMA_MIGRATIONS
+
+    # Se simula que la migración 2 creó solo algunos índices antes de fallar
+    db.cursor.execute("DELETE FROM schema_migrations WHERE version >= 2")
+    db.cursor.execute("DROP INDEX idx_articles_category ON articles")
+    db.cursor.execute("DROP INDEX ft_articles_theme ON articles")
+    db.cnx.commit()
+    assert db.schema_version() == 1
+    assert db.migrate() == SCHEMA_MIGRATIONS[-1][0]
+    btree, fulltext = db.indexed_columns()
+    assert {"publication_date", "theme", "category", "author_name", "article_name"} <= btree
+    assert {"article_name", "theme"} <= fulltext
+    assert not db.cnx.in_transaction
+
+
+class _FakeCursor:
+    # Solo responde la consulta de índices de indexed_columns
+    def __init__(self, indexes):
+        self.indexes = indexes
+        self.queries = []
+
+    def execute(self, query, params=None):
+        self.queries.append(query)
+
+    def fetchall(self):
+        return self.indexes
+
+
+class _FakeConnection:
+    def rollback(self):
+        pass
+
+
+@pytest.fixture
+def planner():
+    """
+    MySQLDatabase sin servidor: índices BTREE en publication_date y
+    article_name, FULLTEXT en article_name; las consultas de lectura se
+    registran en queries en lugar de ejecutarse.
+    """
+    database = MySQLDatabase.__new__(MySQLDatabase)
+    database._in_transaction = False
+    database._indexes = None
+    database.cnx = _FakeConnection()
+    database.cursor = _FakeCursor([("id", "BTREE"), ("publication_date", "BTREE"), ("article_name", "BTREE"),
+                                   ("article_name", "FULLTEXT")])
+    database.queries = []
+    database.rows = [_article(number, article_name=name) for number, name in
+                     ((1, "Robotics"), (2, "Computational thinking"), (3, "Algebra"))]
+
+    def stream_query(query, params, chunk_size):
+        database.queries.append((query, params))
+        yield from ()
+
+    def iter_articles(filters=None, order_by=None, chunk_size=1000):
+        database.queries.append(("iter_articles", filters))
+        return iter(database.rows)
+
+    database._stream_query = stream_query
+    database.iter_articles = iter_articles
+    return database
+
+
+def test_plan_sort(planner):
+    assert planner.plan_sort("publication_date") == "mysql"
+    assert planner.plan_sort("article_name", "thinking") == "mysql"
+    assert planner.plan_sort("article_name", SearchQuery("thinking")) == "python"
+    assert planner.plan_sort("theme") == "python"
+    with pytest.raises(ValueError):
+        planner.plan_sort("password")
+    # information_schema se consulta una sola vez
+    assert len(planner.cursor.queries) == 1
+
+
+def test_sorted_articles_pushdown_orders_in_mysql(planner):
+    list(planner.sorted_articles("publication_date", limit=20, offset=40, filters={"category": "Journal"}))
+    query, params = planner.queries[-1]
+    assert query.endswith("WHERE category = %s ORDER BY publication_date, id LIMIT %s OFFSET %s")
+    assert params == ["Journal", 20, 40]
+
+
+def test_sorted_articles_uses_match_on_fulltext_columns(planner):
+    list(planner.sorted_articles("article_name", search_value="thinking"))
+    query, params = planner.queries[-1]
+    assert "ORDER BY (MATCH(article_name) AGAINST (%s IN NATURAL LANGUAGE MODE) = 0), article_name, id" in query
+    assert params == ["thinking"]
+
+
+def test_sorted_articles_uses_escaped_like_without_fulltext(planner):
+    list(planner.sorted_articles("publication_date", search_value="20%_", offset=5))
+    query, params = planner.queries[-1]
+    assert "ORDER BY (CASE WHEN publication_date LIKE %s THEN 0 ELSE 1 END), publication_date, id" in query
+    assert query.endswith("LIMIT 18446744073709551615 OFFSET %s")
+    assert params == ["%20\\%\\_%", 5]
+
+
+@pytest.mark.parametrize("field, search_value", [("publication_date", None), ("theme", None),
+                                                 ("article_name", SearchQuery("thinking"))])
+def test_sorted_articles_returns_a_generator_on_both_paths(planner, field, search_value):
+    result = planner.sorted_articles(field, search_value=search_value, limit=2)
+    assert iter(result) is result and not isinstance(result, list)
+
+
+def test_sorted_articles_in_python(planner):
+    rows = list(planner.sorted_articles("article_name", search_value=SearchQuery("thinking"), limit=2))
+    assert [row["id"] for row in rows] == [2, 3]
+    rows = list(planner.sorted_articles("article_name", search_value=SearchQuery("thinking"), offset=1,
+                                        algorithm="heap_sort"))
+    assert [row["id"] for row in rows] == [3, 1]
+    assert planner.queries[-1] == ("iter_articles", None)
@@ -0,0 +1,115 @@
+"""
+Pruebas de models.redis_model. Se ejecutan con fakeredis y, si está definida
+REDIS_TEST_HOST, también contra ese servidor Redis (se usa la base
+REDIS_TEST_DB, por defecto 15, que se vacía antes y después de cada prueba).
+"""
+import json
+import os
+
+import pytest
+
+from models.redis_model import RedisDatabase, msgpack
+
+BACKENDS = ["fakeredis"] + (["redis"] if os.environ.get("REDIS_TEST_HOST") else [])
+
+
+@pytest.fixture(params=BACKENDS)
+def make_db(request):
+    """
+    Crea RedisDatabase con las opciones indicadas; todas las de una prueba
+    comparten el mismo servidor.
+    """
+    if request.param == "fakeredis":
+        fakeredis = pytest.importorskip("fakeredis")
+        server = fakeredis.FakeServer()
+
+        def make(**options):
+            db = RedisDatabase(**options)
+            db.r = fakeredis.FakeRedis(server=server)
+            return db
+
+        yield make
+    else:
+        connection = {"host": os.environ["REDIS_TEST_HOST"], "port": int(os.environ.get("REDIS_TEST_PORT", 6379)),
+                      "db": int(os.environ.get("REDIS_TEST_DB", 15))}
+
+        def make(**options):
+            return RedisDatabase(**connection, **options)
+
+        make().r.flushdb()
+        yield make
+        make().r.flushdb()
+
+
+def _article(number):
+    return {"id": number, "article_name": f"Artículo {number}", "author_name": "Ana García",
+            "publication_date": "2020-01-01"}
+
+
+def test_default_namespace_reads_articles_stored_before_headers(make_db):
+    db = make_db()
+    # Formato anterior: texto sin cabecera con el id como clave
+    db.r.set("42", "contenido antiguo".encode("utf-8"))
+    assert db.get_article(42) == "contenido antiguo"
+    assert db.get_articles([42, 43]) == ["contenido antiguo", None]
+
+
+def test_legacy_json_values_decode_to_dicts(make_db):
+    db = make_db()
+    # store_article anterior: json.dumps del diccionario, sin cabecera
+    db.r.set("7", json.dumps(_article(7)))
+    db.r.set("8", "{no es json")
+    db.store_articles([_article(9)])
+    assert db.get_articles([7, 8, 9]) == [_article(7), "{no es json", _article(9)]
+    assert json.loads(db.get_article(7)) == _article(7)
+
+
+def test_namespace_prefixes_keys(make_db):
+    db = make_db(namespace="article:")
+    db.store_article(1, "texto")
+    assert db.r.exists("article:1") and not db.r.exists("1")
+    assert db.get_article(1) == "texto"
+
+
+def test_store_articles_round_trip(make_db):
+    db = make_db(batch_size=7)
+    articles = [_article(number) for number in range(20)]
+    assert db.store_articles(articles) == 20
+    assert db.get_articles([3, 99, 19]) == [articles[3], None, articles[19]]
+    assert db.delete_articles([3, 19]) == 2
+    assert db.get_articles([3, 19]) == [None, None]
+
+
+def test_large_content_is_compressed(make_db):
+    db = make_db(compress_threshold=100)
+    text = "computational thinking " * 100
+    db.store_article(1, text)
+    assert len(db.r.get("1")) < len(text)
+    assert db.get_article(1) == text
+
+
+@pytest.mark.skipif(msgpack is None, reason="msgpack no está instalado")
+def test_msgpack_serializer(make_db):
+    db = make_db(serializer="msgpack")
+    db.store_articles([_article(1)])
+    assert db.r.get("1")[:2] == b"\x00m"
+    assert db.get_articles([1]) == [_article(1)]
+
+
+def test_store_articles_ttl(make_db):
+    db = make_db(ttl=100)
+    db.store_articles([_article(1)])
+    db.store_articles([_article(2)], ttl=None)
+    db.store_articles([_article(3)], ttl=5)
+    db.store_articles([_article(4)], ttl=0)
+    assert 0 < db.r.ttl("1") <= 100
+    assert db.r.ttl("2") == -1
+    assert 0 < db.r.ttl("3") <= 5
+    assert db.r.ttl("4") == -1
+
+
+def test_zero_ttl_means_no_expiry(make_db):
+    db = make_db(ttl=0)
+    db.store_article(1, "texto")
+    db.store_articles([_article(2)])
+    assert db.r.ttl("1") == db.r.ttl("2") == -1
@@ -0,0 +1,85 @@
+import threading
+import time
+
+import pytest
+
+from data_sources.scopus_api import iter_scopus_articles
+from tests.fixture_server import FakeScopus, FixtureServer, status
+
+PATH = "/content/search/scopus"
+
+
+def _run(endpoint, **options):
+    with FixtureServer({PATH: endpoint}) as server:
+        return list(iter_scopus_articles("computational thinking", "test-key", url=server.url(PATH), **options))
+
+
+def test_follows_cursor_through_all_pages():
+    endpoint = FakeScopus(total=55)
+    articles = _run(endpoint, page_size=10)
+    assert [article["id"] for article in articles] == [85000000000 + number for number in range(55)]
+    assert endpoint.cursors == ["*"] + [f"page-{number}" for number in range(1, 6)]
+    first = articles[0]
+    assert first["author_name"] == "Author0 A.; Coauthor0 B."
+    assert first["theme"] == "Computer Science (all)"
+    assert first["source"] == "scopus"
+
+
+def test_max_results_cuts_a_page_in_the_middle():
+    endpoint = FakeScopus(total=100)
+    articles = _run(endpoint, page_size=10, max_results=25)
+    assert len(articles) == 25
+    # La tercera página se pide, pero no una cuarta
+    assert endpoint.cursors == ["*", "page-1", "page-2"]
+
+
+def test_max_results_on_page_boundary_does_not_prefetch():
+    endpoint = FakeScopus(total=100)
+    assert len(_run(endpoint, page_size=10, max_results=20)) == 20
+    assert endpoint.cursors == ["*", "page-1"]
+
+
+def test_repeated_cursor_stops_pagination():
+    endpoint = FakeScopus(total=100, repeat_cursor_at=1)
+    articles = _run(endpoint, page_size=10)
+    assert len(articles) == 20
+    assert endpoint.cursors == ["*", "page-1"]
+
+
+def test_empty_page_stops_pagination():
+    endpoint = FakeScopus(total=100, empty_page_at=2)
+    articles = _run(endpoint, page_size=10)
+    assert len(articles) == 20
+    assert endpoint.cursors == ["*", "page-1", "page-2"]
+
+
+def test_placeholder_error_entry_yields_nothing():
+    endpoint = FakeScopus(total=0)
+    assert _run(endpoint, page_size=10) == []
+    assert endpoint.cursors == ["*"]
+
+
+def test_http_error_stops_iteration():
+    assert _run(status(401)) == []
+
+
+def test_consumer_stopping_early_drains_prefetch():
+    endpoint = FakeScopus(total=100, delay=0.2)
+    threads = threading.active_count()
+    with FixtureServer({PATH: endpoint}) as server:
+        articles = iter_scopus_articles("computational thinking", "test-key", page_size=10, url=server.url(PATH))
+        first = [next(articles) for _ in range(3)]
+        time.sleep(0.05)
+        # La segunda página está en curso; cerrar el generador la espera y
+        # apaga el hilo de prefetch en lugar de dejarlo pendiente
+        articles.close()
+        assert len(first) == 3
+        assert endpoint.cursors == ["*", "page-1"]
+        assert server.active == 0
+    assert threading.active_count() <= threads
+
+
+@pytest.mark.parametrize("page_size", [1, 7, 100])
+def test_page_size_does_not_change_results(page_size):
+    articles = _run(FakeScopus(total=30), page_size=page_size)
+    assert [article["id"] for article in articles] == [85000000000 + number for number in range(30)]
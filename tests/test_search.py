@@ -0,0 +1,86 @@
+import datetime
+
+from sorting_algorithms.search import SearchQuery, fold_text, publication_date, publication_year, tokenize
+from sorting_algorithms.sorting import FieldKey, SortingAlgorithms
+
+
+def test_fold_text_and_tokenize():
+    assert fold_text("Análisis ÑANDÚ") == "analisis nandu"
+    assert tokenize("¿Pensamiento computacional?") == ["pensamiento", "computacional"]
+    assert tokenize("Análisis", fold=False) == ["Análisis"]
+
+
+def test_publication_year():
+    assert publication_year(datetime.date(2019, 5, 2)) == 2019
+    assert publication_year(datetime.datetime(2021, 1, 1, 12)) == 2021
+    assert publication_year("2019-03-01") == 2019
+    assert publication_year("First published May 2, 2019") == 2019
+    assert publication_year("2018///") == 2018
+    assert publication_year("") is None
+    assert publication_year(None) is None
+    assert publication_year("12345") is None
+
+
+def test_publication_date():
+    assert publication_date(datetime.datetime(2021, 1, 1, 12)) == datetime.date(2021, 1, 1)
+    assert publication_date("2019-03-01") == datetime.date(2019, 3, 1)
+    assert publication_date("2020-06") == datetime.date(2020, 6, 1)
+    assert publication_date("June 2020") == datetime.date(2020, 6, 1)
+    assert publication_date("First published May 2, 2019") == datetime.date(2019, 5, 2)
+    assert publication_date("2 de mayo de 2019") == datetime.date(2019, 5, 2)
+    assert publication_date("Sep 31, 2020") == datetime.date(2020, 9, 1)
+    assert publication_date("2018") == datetime.date(2018, 1, 1)
+    assert publication_date("sin fecha") is None
+    assert publication_date(None) is None
+
+
+def test_search_query_priority():
+    query = SearchQuery(["pensamiento computacional", "educación"])
+    record = {"article_name": "El pensamiento computacional", "theme": "Educacion"}
+    assert query.priority(record) == 0
+    assert query.priority({"article_name": "Otro", "theme": "Educación"}) == 1
+
+
+RECORDS = [
+    {"id": 1, "article_name": "Database systems", "theme": "Computación"},
+    {"id": 2, "article_name": "Big data analysis", "theme": "Estadística"},
+    {"id": 3, "article_name": "Pensamiento computacional", "theme": "Educación"},
+    {"id": 4, "article_name": "Data in education", "theme": None},
+    {"id": 5, "article_name": "Robótica", "theme": "Educacion"},
+]
+
+
+def test_scores_match_score_per_record():
+    query = SearchQuery(["data", "educación", "pensamiento computacional", "sin resultados"])
+    assert query.scores(RECORDS) == [query.score(record) for record in RECORDS] == [0, 1, 2, 1, 1]
+    assert query.priorities(RECORDS) == [4, 3, 2, 3, 3]
+    assert query.priorities([]) == []
+
+
+def test_whole_word_matching():
+    # "data" no coincide con "Database", al contrario que la búsqueda por subcadena
+    query = SearchQuery("data")
+    assert [query.score(record) for record in RECORDS] == [0, 1, 0, 1, 0]
+    assert SearchQuery("comput").score(RECORDS[2]) == 0
+
+
+def test_sort_with_search_query():
+    query = SearchQuery(["data", "educación"])
+    sorter = SortingAlgorithms()
+    key = FieldKey("article_name")
+    # Todos salvo Database systems coinciden con un término; empates por título
+    expected = [2, 4, 3, 5, 1]
+    for algorithm in ("tim_sort", "quick_sort", "heap_sort", "top_k"):
+        method = getattr(sorter, algorithm)
+        result = method(RECORDS, 5, key=key, search_value=query) if algorithm == "top_k" else \
+            method(list(RECORDS), key=key, search_value=query)
+        assert [record["id"] for record in result] == expected
+
+
+def test_non_dict_records_use_key():
+    query = SearchQuery("thinking")
+    titles = ["Design", "Computational thinking", "Thinking machines"]
+    assert query.scores(titles) == [0, 1, 1]
+    assert query.score(("x", "deep thinking"), key=lambda record: record[1]) == 1
+    assert SortingAlgorithms().tim_sort(titles, search_value=query) == ["Computational thinking",
+                                                                        "Thinking machines", "Design"]
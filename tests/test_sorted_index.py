@@ -0,0 +1,105 @@
+import datetime
+import random
+
+import pytest
+
+from sorting_algorithms.sorted_index import ArticleIndex, SortedIndex
+
+
+def _article(number, rnd):
+    return {
+        "id": number,
+        "article_name": rnd.choice(["Computational", "Computer", "Data", "Robotics"]) + f" study {number % 7}",
+        "author_name": rnd.choice(["Ana García", "John Smith", None]),
+        "publication_date": datetime.date(2000 + rnd.randrange(20), 1 + rnd.randrange(12), 1),
+        "theme": rnd.choice(["Computación", "Educación"]),
+        "category": rnd.choice(["Journal", "Review"]),
+    }
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_sorted_index_random_operations_match_sorted_list(seed):
+    rnd = random.Random(seed)
+    index = SortedIndex(load=4)
+    reference = []
+    for step in range(2000):
+        if reference and rnd.random() < 0.4:
+            entry = reference.pop(rnd.randrange(len(reference)))
+            index.remove(*entry)
+        else:
+            entry = (rnd.randrange(100), step)
+            reference.append(entry)
+            index.insert(*entry)
+        if step % 100 == 0:
+            reference.sort()
+            assert list(index) == reference and len(index) == len(reference)
+            low, high = sorted((rnd.randrange(110), rnd.randrange(110)))
+            assert list(index.irange(low, high)) == [entry for entry in reference if low <= entry[0] <= high]
+            assert list(index.irange(maximum=high)) == [entry for entry in reference if entry[0] <= high]
+            assert list(index.irange(low)) == [entry for entry in reference if entry[0] >= low]
+    reference.sort()
+    assert list(index) == reference
+
+
+def test_sorted_index_remove_missing_entry():
+    index = SortedIndex.from_sorted([(1, 1), (2, 2)], load=1)
+    with pytest.raises(KeyError):
+        index.remove(1, 2)
+    with pytest.raises(KeyError):
+        index.remove(3, 3)
+
+
+def _expected(articles, column, minimum=None, maximum=None):
+    rows = [article for article in articles.values() if article.get(column) is not None
+            and (minimum is None or article[column] >= minimum) and (maximum is None or article[column] <= maximum)]
+    return sorted(rows, key=lambda article: (article[column], article["id"]))
+
+
+def test_article_index_random_operations_and_reload(tmp_path):
+    rnd = random.Random(3)
+    index = ArticleIndex(load=8)
+    reference = {}
+    for step in range(1500):
+        operation = rnd.random()
+        if reference and operation < 0.2:
+            article_id = rnd.choice(list(reference))
+            assert index.delete(article_id) == reference.pop(article_id)
+        elif reference and operation < 0.4:
+            article_id = rnd.choice(list(reference))
+            changes = {"publication_date": datetime.date(2000 + rnd.randrange(20), 6, 1),
+                       "author_name": rnd.choice(["Zoe Wang", None])}
+            index.update(article_id, **changes)
+            reference[article_id] = {**reference[article_id], **changes}
+        else:
+            article = _article(rnd.randrange(400), rnd)
+            index.insert(article)
+            reference[article["id"]] = dict(article)
+
+    assert len(index) == len(reference)
+    for name, column in index.fields.items():
+        assert list(index.sorted(name)) == _expected(reference, column)
+    low, high = datetime.date(2005, 1, 1), datetime.date(2012, 12, 31)
+    assert list(index.range("date", low, high)) == _expected(reference, "publication_date", low, high)
+    assert [article["id"] for article in index.prefix_search("Comput")] == [
+        article["id"] for article in _expected(reference, "article_name") if article["article_name"].startswith("Comput")]
+
+    path = tmp_path / "index.pkl"
+    index.save(str(path))
+    loaded = ArticleIndex.load(str(path))
+    for name in index.fields:
+        assert list(loaded.sorted(name)) == list(index.sorted(name))
+    loaded.insert(_article(1000, rnd))
+    assert 1000 in loaded and 1000 not in index
+
+
+def test_article_index_copies_caller_dicts():
+    article = {"id": 1, "article_name": "Beta", "publication_date": datetime.date(2020, 1, 1)}
+    index = ArticleIndex(fields=["title", "date"])
+    index.insert(article)
+    article["article_name"] = "Cambiado fuera del índice"
+    returned = index.get(1)
+    updated = index.update(1, article_name="Alpha")
+    assert article["article_name"] == "Cambiado fuera del índice"
+    assert returned["article_name"] == "Beta"
+    assert updated["article_name"] == "Alpha"
+    assert [entry for entry in index.indexes["title"]] == [("Alpha", 1)]
@@ -0,0 +1,243 @@
+import datetime
+import json
+import os
+import subprocess
+import sys
+import tracemalloc
+
+import pytest
+
+from sorting_algorithms.benchmark_sorting import (ALGORITHMS, DISTRIBUTION_ALGORITHMS, _Counter, _instrumented_key,
+                                                  generate_articles, run_case)
+from sorting_algorithms import sorting
+from sorting_algorithms.search import SearchQuery
+from sorting_algorithms.sorting import FieldKey, SortingAlgorithms
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+COMPARISON_ALGORITHMS = [name for name in ALGORITHMS if name not in DISTRIBUTION_ALGORITHMS]
+# Métodos que resuelven los empates por la posición original
+STABLE_ALGORITHMS = ["tim_sort", "tree_sort", "quick_sort", "heap_sort", "gnome_sort", "bubble_sort",
+                     "double_bubble_sort"]
+
+
+def _titles(n=60):
+    # Muchos empates de título, con y sin el término buscado
+    return [{"id": i, "article_name": f"Computational thinking {i % 5}" if i % 3 else f"Robotics {i % 5}"}
+            for i in range(n)]
+
+
+class _CallCounter:
+    def __init__(self, key):
+        self.key = key
+        self.calls = 0
+
+    def __call__(self, record):
+        self.calls += 1
+        return self.key(record)
+
+
+@pytest.mark.parametrize("algorithm", COMPARISON_ALGORITHMS)
+def test_key_computed_once_per_record(algorithm):
+    records = _titles()
+    key = _CallCounter(FieldKey("article_name"))
+    result = getattr(SortingAlgorithms(), algorithm)(list(records), key=key, search_value="thinking")
+    assert key.calls == len(records)
+    names = [record["article_name"] for record in result]
+    assert names == [record["article_name"] for record in
+                     sorted(records, key=lambda r: ("thinking" not in r["article_name"], r["article_name"]))]
+
+
+@pytest.mark.parametrize("search_value", ["thinking", SearchQuery("robotics"), None])
+@pytest.mark.parametrize("algorithm", STABLE_ALGORITHMS)
+def test_decorated_sort_is_stable_with_search_value(algorithm, search_value):
+    records = _titles()
+    sorter = SortingAlgorithms()
+    expected = sorter.tim_sort(list(records), key=FieldKey("article_name"), search_value=search_value)
+    result = getattr(sorter, algorithm)(list(records), key=FieldKey("article_name"), search_value=search_value)
+    assert [record["id"] for record in result] == [record["id"] for record in expected]
+
+
+def test_parallel_sort_default_key_uses_process_pool():
+    values = [(i * 7919) % 1000 for i in range(1000)]
+    result = SortingAlgorithms().parallel_sort(values, workers=2, chunk_size=100)
+    assert result == sorted(values)
+
+
+def test_parallel_sort_matches_sequential_with_field_key():
+    records = [{"id": i, "name": f"n{(i * 31) % 97}"} for i in range(500)]
+    sorter = SortingAlgorithms()
+    expected = sorter.tim_sort(list(records), key=FieldKey("name"))
+    assert sorter.parallel_sort(records, key=FieldKey("name"), workers=2, chunk_size=64) == expected
+
+
+def test_parallel_sort_rejects_unpicklable_key():
+    with pytest.raises(TypeError, match="serializable"):
+        SortingAlgorithms().parallel_sort(list(range(100)), key=lambda x: -x, workers=2, chunk_size=10)
+
+
+@pytest.mark.parametrize("options", [{"chunk_size": 0}, {"chunk_size": -5}, {"chunk_size": 2.5}, {"workers": -1}])
+def test_parallel_sort_rejects_invalid_sizes(options):
+    with pytest.raises(ValueError):
+        SortingAlgorithms().parallel_sort(list(range(100)), **options)
+
+
+def test_parallel_sort_accepts_lambda_in_process():
+    # Con un solo trabajador no se usa el pool y la lambda es válida
+    assert SortingAlgorithms().parallel_sort([3, 1, 2], key=lambda x: -x, workers=1) == [3, 2, 1]
+
+
+class _StrictKey:
+    # Como _CountingKey del benchmark: solo sabe compararse con su propio tipo
+    def __init__(self, value):
+        self.value = value
+
+    def __lt__(self, other):
+        return self.value < other.value
+
+    def __gt__(self, other):
+        return self.value > other.value
+
+    def __le__(self, other):
+        return self.value <= other.value
+
+    def __ge__(self, other):
+        return self.value >= other.value
+
+    def __eq__(self, other):
+        return self.value == other.value
+
+
+@pytest.mark.parametrize("size", [0, 1, 2, 3, 5, 17, 100])
+def test_bitonic_sort_padding_never_compared_with_keys(size):
+    values = [(i * 37) % 11 for i in range(size)]
+    result = SortingAlgorithms().bitonic_sort(list(values), key=_StrictKey)
+    assert result == sorted(values)
+
+
+def test_benchmark_cli_end_to_end(tmp_path):
+    output = tmp_path / "results.json"
+    completed = subprocess.run(
+        [sys.executable, "-m", "sorting_algorithms.benchmark_sorting", "--sizes", "100", "--repeat", "1",
+         "--json", str(output)],
+        cwd=ROOT, capture_output=True, text=True, timeout=600)
+    assert completed.returncode == 0, completed.stderr
+    results = json.loads(output.read_text(encoding="utf-8"))["results"]
+    assert {result["algorithm"] for result in results} == set(ALGORITHMS)
+    for result in results:
+        if result["status"] == "error":
+            # Solo los métodos de distribución rechazan claves de texto
+            assert result["algorithm"] in DISTRIBUTION_ALGORITHMS and result["key_type"] == "str"
+        else:
+            assert result["status"] == "ok"
+
+
+DISTRIBUTION_CASES = {
+    "negatives": [(i * 7919) % 201 - 100 for i in range(300)],
+    "sparse_ids": [(i * 104729) % 1000003 * 1000 for i in range(300)],
+    "dates": [datetime.date(1990 + i % 30, 1 + i % 12, 1 + i % 28) for i in range(300)],
+}
+
+
+@pytest.mark.parametrize("case", list(DISTRIBUTION_CASES))
+@pytest.mark.parametrize("algorithm", DISTRIBUTION_ALGORITHMS)
+def test_numpy_distribution_sorts(algorithm, case):
+    pytest.importorskip("numpy")
+    records = [{"id": i, "value": value} for i, value in enumerate(DISTRIBUTION_CASES[case])]
+    result = getattr(SortingAlgorithms(), algorithm)(list(records), key=FieldKey("value"))
+    # Estables: los empates conservan el orden original
+    assert result == sorted(records, key=lambda record: record["value"])
+
+
+@pytest.mark.parametrize("algorithm", DISTRIBUTION_ALGORITHMS)
+def test_numpy_distribution_sorts_match_pure_python_with_search_value(algorithm, monkeypatch):
+    pytest.importorskip("numpy")
+    records = [{"id": i, "value": (i * 37) % 50} for i in range(200)]
+    method = getattr(SortingAlgorithms(), algorithm)
+    result = method(list(records), key=FieldKey("value"), search_value="3")
+    monkeypatch.setattr(sorting, "np", None)
+    assert result == method(list(records), key=FieldKey("value"), search_value="3")
+
+
+@pytest.mark.parametrize("algorithm", DISTRIBUTION_ALGORITHMS)
+def test_pure_python_distribution_sorts(algorithm, monkeypatch):
+    monkeypatch.setattr(sorting, "np", None)
+    values = [(i * 7919) % 1000 for i in range(300)]
+    assert getattr(SortingAlgorithms(), algorithm)(list(values)) == sorted(values)
+
+
+@pytest.mark.parametrize("algorithm", ["tim_sort", "quick_sort", "heap_sort"])
+def test_external_sort_merges_several_runs(algorithm, tmp_path):
+    records = _titles(250)
+    expected = SortingAlgorithms().tim_sort(list(records), key=FieldKey("article_name"), search_value="thinking")
+    result = SortingAlgorithms().external_sort(iter(records), key=FieldKey("article_name"),
+                                               search_value="thinking", algorithm=algorithm, run_size=40,
+                                               tmp_dir=str(tmp_path))
+    assert list(result) == expected
+
+
+def test_external_sort_jsonl_file_to_file(tmp_path):
+    source = tmp_path / "articles.jsonl"
+    records = [{"id": i, "year": 2000 + (i * 13) % 25} for i in range(100)]
+    source.write_text("".join(json.dumps(record) + "\n" for record in records) + "\n", encoding="utf-8")
+    output = tmp_path / "sorted.jsonl"
+    assert SortingAlgorithms().external_sort(str(source), key=FieldKey("year"), run_size=7,
+                                             output=str(output)) == str(output)
+    lines = output.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line) for line in lines] == sorted(records, key=lambda record: record["year"])
+
+
+def test_external_sort_empty_source():
+    assert list(SortingAlgorithms().external_sort([])) == []
+
+
+PRESORTED_CASES = {
+    "ascending": list(range(50000)),
+    "descending": list(range(50000, 0, -1)),
+    "equal": [7] * 50000,
+    "organ_pipe": list(range(25000)) + list(range(25000, 0, -1)),
+}
+
+
+@pytest.mark.parametrize("case", list(PRESORTED_CASES))
+@pytest.mark.parametrize("algorithm", ["quick_sort", "tree_sort"])
+def test_iterative_sorts_on_presorted_50k(algorithm, case):
+    values = PRESORTED_CASES[case]
+    records = [{"id": i, "value": value} for i, value in enumerate(values)]
+    result = getattr(SortingAlgorithms(), algorithm)(list(records), key=FieldKey("value"))
+    assert result == sorted(records, key=lambda record: record["value"])
+
+
+@pytest.mark.parametrize("search_value", [None, "thinking", SearchQuery("robotics 3")])
+def test_top_k_and_sorted_page_match_sorted_slices(search_value):
+    records = _titles(200)
+    sorter = SortingAlgorithms()
+    key = FieldKey("article_name")
+    expected = sorted(records, key=sorter._get_effective_key(key, search_value))
+    for k in (0, 1, 20, 199, 200, 500):
+        assert sorter.top_k(records, k, key=key, search_value=search_value) == expected[:k]
+    for offset, limit in ((0, 20), (20, 20), (190, 20), (250, 10), (5, 0)):
+        page = sorter.sorted_page(records, offset, limit, key=key, search_value=search_value)
+        assert page == expected[offset:offset + limit]
+
+
+def test_sorted_page_rejects_negative_arguments():
+    with pytest.raises(ValueError):
+        SortingAlgorithms().sorted_page([1, 2], -1, 10)
+
+
+def test_benchmark_peak_memory_excludes_instrumentation():
+    articles = generate_articles(2000)
+    sorter = SortingAlgorithms()
+    result = run_case(sorter, "heap_sort", articles, "str", None, repeat=1)
+    assert result["key_calls"] == 2000 and result["comparisons"] > 0
+
+    comparisons = _Counter()
+    tracemalloc.start()
+    try:
+        sorter.heap_sort(list(articles), key=_instrumented_key("article_name", _Counter(), comparisons))
+        instrumented_peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    # Sin los 2000 _CountingKey el pico es menor
+    assert result["peak_memory_bytes"] < instrumented_peak
@@ -0,0 +1,51 @@
+import datetime
+
+from views.statistics import BibliometricStats, SpaceSaving
+
+
+def _article(title, date="2020-01-01", **fields):
+    return {"article_name": title, "publication_date": date, "author_name": "Ana García; John Smith",
+            "theme": "Computación", "category": "Article", **fields}
+
+
+def test_terms_fold_accents_and_skip_stopwords():
+    stats = BibliometricStats()
+    assert stats.terms("Análisis MÁS allá de los datos, también en 2020") == ["analisis", "alla", "datos"]
+    stats.update([_article("Análisis de datos"), _article("analisis de redes")])
+    assert stats.top("term", 1) == [("analisis", 2)]
+
+
+def test_custom_stopwords_are_folded():
+    stats = BibliometricStats(stopwords={"Educación"})
+    assert stats.terms("educacion y computación") == ["computacion"]
+
+
+def test_years_from_every_source_format():
+    stats = BibliometricStats().update([
+        _article("a", datetime.date(2019, 5, 2)),
+        _article("b", "2019"),
+        _article("c", "June 2020"),
+        _article("d", "2018///"),
+        _article("e", ""),
+    ])
+    assert stats.frequencies("year") == {2018: 1, 2019: 2, 2020: 1}
+    assert stats.total == 5
+
+
+def test_dimensions_and_summary():
+    stats = BibliometricStats().update([_article("Computational thinking"), _article("Thinking skills")])
+    summary = stats.summary(1)
+    assert summary["articles"] == 2
+    assert summary["author"] == [("Ana García", 2)]
+    assert summary["term"] == [("thinking", 2)]
+
+
+def test_space_saving_keeps_heavy_hitters():
+    sketch = SpaceSaving(capacity=10)
+    items = ["frecuente"] * 500 + [f"raro{i}" for i in range(1000)]
+    items = [items[(i * 7919) % len(items)] for i in range(len(items))]
+    sketch.update(items)
+    item, count = sketch.most_common(1)[0]
+    assert item == "frecuente"
+    assert count - sketch.error(item) <= 500 <= count
+    assert len(sketch) == 10
@@ -0,0 +1,47 @@
+import matplotlib
+
+# Sin pantalla: las pruebas nunca deben abrir ventanas
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt  # noqa: E402
+import pytest  # noqa: E402
+
+from views.statistics import BibliometricStats  # noqa: E402
+from views.visualization import render_statistics  # noqa: E402
+
+
+def _stats():
+    return BibliometricStats().update([
+        {"article_name": "Computational thinking in primary education", "publication_date": "2019-05-02",
+         "author_name": "Ana García; John Smith", "theme": "Computación", "category": "Article"},
+        {"article_name": "Pensamiento computacional y robótica", "publication_date": "June 2020",
+         "author_name": "María López", "theme": "Educación", "category": "Conference Paper"},
+    ])
+
+
+def test_render_statistics_writes_every_figure(tmp_path):
+    output_dir = tmp_path / "figures"
+    paths = render_statistics(_stats(), str(output_dir), formats=("png", "svg"))
+    names = ["temas", "categorias", "anios", "autores", "terminos"]
+    assert paths == [str(output_dir / f"{name}.{fmt}") for fmt in ("png", "svg") for name in names]
+    for path in paths:
+        with open(path, "rb") as f:
+            head = f.read(512)
+        if path.endswith(".png"):
+            assert head.startswith(b"\x89PNG\r\n\x1a\n")
+        else:
+            assert b"<svg" in head
+    # Las figuras no pasan por pyplot
+    assert plt.get_fignums() == []
+
+
+def test_render_statistics_skips_empty_dimensions(tmp_path):
+    stats = BibliometricStats().update([{"article_name": "", "publication_date": "2021"}])
+    assert render_statistics(stats, str(tmp_path)) == [str(tmp_path / "anios.png")]
+    assert render_statistics(BibliometricStats(), str(tmp_path / "vacio")) == []
+
+
+def test_render_statistics_rejects_unknown_format(tmp_path):
+    with pytest.raises(ValueError):
+        render_statistics(_stats(), str(tmp_path), formats=("pdf",))
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,161 @@
+import heapq
+from collections import Counter
+
+from sorting_algorithms.search import fold_text, publication_year, tokenize
+
+# Palabras vacías en español e inglés que no aportan a la nube de términos.
+# Los términos se comparan sin tildes (más y mas son la misma palabra)
+STOPWORDS = frozenset("""
+a al algo ante con contra cual cuando de del desde donde durante e el ella ellas ellos en entre era es esa
+ese eso esta este esto estos estas fue han hay la las le les lo los mas más me mi muy ni no nos o para pero
+por que qué se sea ser si sin sobre son su sus también tras un una unas uno unos y ya
+about after an and are as at be been between by can do does for from has have how in into is it its more
+new not of on or our over than that the their these this through to towards under use using via was we
+what when which while who why with within without
+""".split())
+
+DIMENSIONS = ("theme", "category", "year", "author", "term")
+
+
+class SpaceSaving:
+    """
+    Resumen de elementos frecuentes (algoritmo Space-Saving) con memoria
+    acotada a capacity contadores. Los elementos con frecuencia mayor que
+    total / capacity están garantizados; cada cuenta sobreestima la real como
+    mucho en su error, que se obtiene con error(item).
+
+    Tiene la misma interfaz que collections.Counter para los usos de
+    BibliometricStats: update, most_common, items y el acceso por clave.
+    """
+
+    def __init__(self, capacity=1000):
+        self.capacity = capacity
+        self.counts = {}
+        self.errors = {}
+        self.total = 0
+        # Montículo de (cuenta, elemento) con entradas obsoletas que se
+        # descartan al buscar el mínimo
+        self._heap = []
+
+    def add(self, item, count=1):
+        self.total += count
+        counts = self.counts
+        if item in counts:
+            counts[item] += count
+        elif len(counts) < self.capacity:
+            counts[item] = count
+            self.errors[item] = 0
+        else:
+            minimum, evicted = self._pop_minimum()
+            del counts[evicted]
+            del self.errors[evicted]
+            counts[item] = minimum + count
+            self.errors[item] = minimum
+        heapq.heappush(self._heap, (counts[item], item))
+        if len(self._heap) > 4 * self.capacity:
+            self._heap = [(value, key) for key, value in counts.items()]
+            heapq.heapify(self._heap)
+
+    def _pop_minimum(self):
+        while True:
+            value, item = heapq.heappop(self._heap)
+            if self.counts.get(item) == value:
+                return value, item
+
+    def update(self, items):
+        for item in items:
+            self.add(item)
+
+    def error(self, item):
+        return self.errors.get(item, 0)
+
+    def most_common(self, n=None):
+        return heapq.nlargest(n or len(self.counts), self.counts.items(), key=lambda pair: pair[1])
+
+    def items(self):
+        return self.counts.items()
+
+    def __getitem__(self, item):
+        return self.counts.get(item, 0)
+
+    def __len__(self):
+        return len(self.counts)
+
+
+class BibliometricStats:
+    """
+    Estadísticas bibliométricas que se actualizan de forma incremental: cada
+    artículo se recorre una sola vez y actualiza los conteos por temática,
+    categoría, año, autor y término del título (sin palabras vacías). Se
+    pueden añadir lotes nuevos con update en cualquier momento.
+
+    Con sketch_size, autores y términos (las dimensiones que crecen con los
+    datos) se cuentan con SpaceSaving y la memoria queda acotada; sin él se
+    cuentan de forma exacta con Counter.
+    """
+
+    def __init__(self, sketch_size=None, stopwords=STOPWORDS, min_term_length=3):
+        self.stopwords = frozenset(fold_text(word) for word in stopwords)
+        self.min_term_length = min_term_length
+        self.sketch_size = sketch_size
+        self.total = 0
+        self.counters = {
+            "theme": Counter(),
+            "category": Counter(),
+            "year": Counter(),
+            "author": SpaceSaving(sketch_size) if sketch_size else Counter(),
+            "term": SpaceSaving(sketch_size) if sketch_size else Counter(),
+        }
+
+    def terms(self, title):
+        """
+        Términos de un título normalizados con search.tokenize (minúsculas y
+        sin tildes, así "Análisis" y "analisis" cuentan juntos), sin palabras
+        vacías, números ni palabras de menos de min_term_length letras.
+        """
+        stopwords = self.stopwords
+        minimum = self.min_term_length
+        return [word for word in tokenize(title)
+                if len(word) >= minimum and word not in stopwords and not word.isdigit()]
+
+    def add(self, article):
+        counters = self.counters
+        self.total += 1
+        if article.get("theme"):
+            counters["theme"][article["theme"]] += 1
+        if article.get("category"):
+            counters["category"][article["category"]] += 1
+        year = publication_year(article.get("publication_date"))
+        if year is not None:
+            counters["year"][year] += 1
+        authors = [author.strip() for author in str(article.get("author_name") or "").split(";")]
+        counters["author"].update(author for author in authors if author)
+        counters["term"].update(self.terms(article.get("article_name") or ""))
+
+    def update(self, articles):
+        """
+        Añade un lote de artículos (cualquier iterable). Retorna self para
+        encadenar con frequencies.
+        """
+        for article in articles:
+            self.add(article)
+        return self
+
+    def top(self, dimension, n=20):
+        """
+        Los n valores más frecuentes de la dimensión, como lista de (valor, cuenta).
+        """
+        return self.counters[dimension].most_common(n)
+
+    def frequencies(self, dimension, n=None):
+        """
+        Diccionario valor -> cuenta para generate_bar_chart y generate_wordcloud.
+        Los años se ordenan cronológicamente; el resto, de mayor a menor.
+        """
+        if dimension == "year":
+            years = sorted(self.counters["year"].items())
+            return dict(years[-n:] if n else years)
+        return dict(self.top(dimension, n))
+
+    def summary(self, n=10):
+        return {"articles": self.total, **{dimension: self.top(dimension, n) for dimension in DIMENSIONS}}
@@ -1,35 +1,103 @@
+import os
+
 import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 from wordcloud import WordCloud
 
+# Formatos de salida admitidos en el renderizado por lotes
+OUTPUT_FORMATS = ("png", "svg")
+
+
+def _figure(output, figsize):
+    """
+    Sin output se usa pyplot y la ventana interactiva, como siempre. Con output
+    se crea una Figure independiente de pyplot: se dibuja con el lienzo Agg
+    (o SVG según la extensión) sin abrir ventanas ni bloquear, y es segura de
+    usar desde hilos de trabajo.
+    """
+    if output is None:
+        return plt.figure(figsize=figsize)
+    return Figure(figsize=figsize)
+
 
-def generate_bar_chart(data, title="Estadísticas", xlabel="Categoría", ylabel="Frecuencia"):
+def _finish(fig, output):
+    fig.tight_layout()
+    if output is None:
+        plt.show()
+        return None
+    directory = os.path.dirname(output)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    fig.savefig(output)
+    return output
+
+
+def generate_bar_chart(data, title="Estadísticas", xlabel="Categoría", ylabel="Frecuencia", output=None):
     """
     Genera un gráfico de barras a partir de un diccionario con datos.
+    Si se indica output (ruta .png o .svg) el gráfico se guarda en el archivo
+    en lugar de mostrarse.
     """
-    categories = list(data.keys())
+    categories = [str(category) for category in data.keys()]
     values = list(data.values())
 
-    plt.figure(figsize=(10, 6))
-    plt.bar(categories, values, color='skyblue')
-    plt.title(title)
-    plt.xlabel(xlabel)
-    plt.ylabel(ylabel)
-    plt.xticks(rotation=45)
-    plt.tight_layout()
-    plt.show()
+    fig = _figure(output, (10, 6))
+    ax = fig.add_subplot()
+    ax.bar(categories, values, color='skyblue')
+    ax.set_title(title)
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel(ylabel)
+    ax.tick_params(axis='x', labelrotation=45)
+    return _finish(fig, output)
+
+
+def generate_wordcloud(text, title="Nube de Palabras", output=None):
+    """
+    Genera y muestra una nube de palabras a partir de un string de texto o de
+    un diccionario palabra -> frecuencia (por ejemplo
+    BibliometricStats.frequencies("term")), que evita volver a tokenizar el texto.
+    Si se indica output (ruta .png o .svg) la nube se guarda en el archivo.
+    """
+    cloud = WordCloud(width=800, height=400, background_color='white')
+    if isinstance(text, dict):
+        wordcloud = cloud.generate_from_frequencies(text)
+    else:
+        wordcloud = cloud.generate(text)
+    fig = _figure(output, (10, 5))
+    ax = fig.add_subplot()
+    ax.imshow(wordcloud, interpolation='bilinear')
+    ax.set_title(title)
+    ax.axis('off')
+    return _finish(fig, output)
 
 
-def generate_wordcloud(text, title="Nube de Palabras"):
+def render_statistics(stats, output_dir="exports/figures", formats=("png",), top=20):
     """
-    Genera y muestra una nube de palabras a partir de un string de texto.
+    Genera en output_dir, sin mostrar ventanas, los gráficos de un
+    BibliometricStats: barras por temática, categoría, año y autores más
+    frecuentes, y la nube de términos de los títulos. Retorna las rutas escritas.
     """
-    wordcloud = WordCloud(width=800, height=400, background_color='white').generate(text)
-    plt.figure(figsize=(10, 5))
-    plt.imshow(wordcloud, interpolation='bilinear')
-    plt.title(title)
-    plt.axis('off')
-    plt.tight_layout()
-    plt.show()
+    for fmt in formats:
+        if fmt not in OUTPUT_FORMATS:
+            raise ValueError(f"Formato no soportado: {fmt}; opciones: {OUTPUT_FORMATS}")
+    charts = [
+        ("temas", "theme", "Frecuencia de Temáticas", "Temática"),
+        ("categorias", "category", "Frecuencia de Categorías", "Categoría"),
+        ("anios", "year", "Publicaciones por Año", "Año"),
+        ("autores", "author", f"Top {top} Autores", "Autor"),
+    ]
+    paths = []
+    for fmt in formats:
+        for name, dimension, title, xlabel in charts:
+            data = stats.frequencies(dimension, None if dimension == "year" else top)
+            if data:
+                paths.append(generate_bar_chart(data, title=title, xlabel=xlabel,
+                                                output=os.path.join(output_dir, f"{name}.{fmt}")))
+        terms = stats.frequencies("term", 200)
+        if terms:
+            paths.append(generate_wordcloud(terms, title="Términos más frecuentes",
+                                            output=os.path.join(output_dir, f"terminos.{fmt}")))
+    return paths
 
 
 if __name__ == '__main__':
@@ -37,4 +105,4 @@ if __name__ == '__main__':
     generate_bar_chart(sample_data, title="Frecuencia de Temáticas")
 
     sample_text = "computational thinking datos computación algoritmos análisis estadístico modelado visualización"
-    generate_wordcloud(sample_text, title="Nube de Palabras de Ejemplo")
\ No newline at end of file
+    generate_wordcloud(sample_text, title="Nube de Palabras de Ejemplo")